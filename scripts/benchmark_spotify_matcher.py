@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Compare the Spotify-to-YouTube matcher with the previous SequenceMatcher scorer.
+
+Builds a deterministic set of labelled search pages (the right video mixed with
+covers, lyric uploads, live cuts, extended mixes and unrelated songs) and reports,
+for each scorer, how often it picks the labelled video and how long ranking
+takes.
+
+Usage:
+    python scripts/benchmark_spotify_matcher.py [--tracks 500] [--candidates 10] [--seed 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.spotify.matcher import TrackMatcher, profile_title
+
+THRESHOLD = 0.5
+
+WORDS = [
+    "love",
+    "night",
+    "fire",
+    "heart",
+    "dream",
+    "light",
+    "rain",
+    "summer",
+    "city",
+    "river",
+    "gold",
+    "wild",
+    "blue",
+    "shadow",
+    "echo",
+    "midnight",
+    "dance",
+    "forever",
+    "home",
+    "road",
+    "star",
+    "ocean",
+    "storm",
+    "broken",
+    "young",
+    "electric",
+    "silver",
+    "paper",
+    "glass",
+    "thunder",
+    "sweet",
+    "lonely",
+    "golden",
+    "stranger",
+]
+NAMES = [
+    "Ava Stone",
+    "The Hollow Pines",
+    "Marcus Lee",
+    "Nova Bloom",
+    "DJ Kite",
+    "Lena Ray",
+    "Echo Valley",
+    "Sam Rivers",
+    "Yuki Tan",
+    "The Northern Lights",
+    "Maya Cole",
+    "Odd Harbor",
+]
+
+Case = tuple[str, float, list[dict[str, Any]], str]
+
+
+def legacy_best_match(query: str, results: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """The scorer SpotifyDownloader used before TrackMatcher, kept for comparison."""
+    common_words = {
+        "official",
+        "video",
+        "music",
+        "audio",
+        "lyrics",
+        "hd",
+        "remix",
+        "live",
+        "version",
+        "feat",
+        "ft",
+    }
+    best_match = None
+    best_score = 0.0
+    for result in results:
+        youtube_title = result.get("title", "")
+        spotify_words = [w for w in query.lower().split() if w not in common_words]
+        youtube_words = [w for w in youtube_title.lower().split() if w not in common_words]
+        score = 0.0
+        if spotify_words and youtube_words:
+            score = SequenceMatcher(None, " ".join(spotify_words), " ".join(youtube_words)).ratio()
+        youtube_lower = youtube_title.lower()
+        if "official" in youtube_lower:
+            score += 0.1
+        if "audio" in youtube_lower:
+            score += 0.05
+        if "music" in youtube_lower:
+            score += 0.05
+        if score > best_score and score >= THRESHOLD:
+            best_score = score
+            best_match = result
+    return best_match
+
+
+def build_cases(tracks: int, candidates: int, seed: int) -> list[Case]:
+    rng = random.Random(seed)
+    cases: list[Case] = []
+    for index in range(tracks):
+        artist = rng.choice(NAMES)
+        song = " ".join(rng.sample(WORDS, rng.randint(1, 4))).title()
+        duration = float(rng.randint(150, 300))
+        target_id = f"t{index}"
+
+        results = [
+            {
+                "id": target_id,
+                "title": rng.choice(
+                    (
+                        f"{artist} - {song} (Official Audio)",
+                        f"{artist} - {song}",
+                        f"{song} - {artist} [Official Music Video]",
+                        f"{artist} '{song}' (Visualizer)",
+                    )
+                ),
+                "duration": duration + rng.uniform(-3, 3),
+            },
+            {
+                "id": f"c{index}",
+                "title": f"{song} - {artist} (Lyrics)",
+                "duration": duration + rng.uniform(-2, 2),
+            },
+            {
+                "id": f"l{index}",
+                "title": f"{artist} - {song} (Live at {rng.choice(WORDS).title()} Hall)",
+                "duration": duration + rng.uniform(40, 120),
+            },
+            {
+                "id": f"x{index}",
+                "title": f"{artist} - {song} (Extended Mix) Official",
+                "duration": duration * 2,
+            },
+            {
+                "id": f"v{index}",
+                "title": f"{rng.choice(NAMES)} - {song} (Cover) Official Video",
+                "duration": duration + rng.uniform(-40, 40),
+            },
+        ]
+        while len(results) < candidates:
+            other = " ".join(rng.sample(WORDS, rng.randint(1, 4))).title()
+            results.append(
+                {
+                    "id": f"o{index}-{len(results)}",
+                    "title": f"{rng.choice(NAMES)} - {other} (Official Video)",
+                    "duration": float(rng.randint(150, 300)),
+                }
+            )
+        rng.shuffle(results)
+        cases.append((f"{artist} {song}", duration, results[:candidates], target_id))
+    return cases
+
+
+def run(
+    name: str,
+    cases: list[Case],
+    pick: Callable[[str, float, list[dict[str, Any]]], dict[str, Any] | None],
+) -> None:
+    started = time.perf_counter()
+    picks = [pick(query, duration, results) for query, duration, results, _ in cases]
+    elapsed = time.perf_counter() - started
+
+    exact = sum(
+        1 for chosen, case in zip(picks, cases, strict=True) if chosen and chosen["id"] == case[3]
+    )
+    # The lyric upload carries the same recording, so it counts as acceptable.
+    acceptable = sum(
+        1
+        for chosen, case in zip(picks, cases, strict=True)
+        if chosen and chosen["id"][1:] == case[3][1:] and chosen["id"][0] in "tc"
+    )
+    missed = sum(1 for chosen in picks if chosen is None)
+    total = len(cases)
+    print(
+        f"{name:<28} exact {exact / total:6.1%}  acceptable {acceptable / total:6.1%}  "
+        f"no match {missed / total:6.1%}  {elapsed * 1000:8.1f} ms "
+        f"({elapsed / total * 1e6:7.1f} us/track)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=500)
+    parser.add_argument("--candidates", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    cases = build_cases(args.tracks, max(5, args.candidates), args.seed)
+    matcher = TrackMatcher(THRESHOLD)
+
+    print(f"{len(cases)} tracks x {max(5, args.candidates)} candidates\n")
+    run("SequenceMatcher (previous)", cases, lambda q, _d, r: legacy_best_match(q, r))
+    profile_title.cache_clear()
+    run("TrackMatcher, no duration", cases, lambda q, _d, r: matcher.best_match(q, r))
+    profile_title.cache_clear()
+    run("TrackMatcher, with duration", cases, lambda q, d, r: matcher.best_match(q, r, d))
+    run("  warm profile cache", cases, lambda q, d, r: matcher.best_match(q, r, d))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark: launch the app repeatedly and time it up to the first paint.
+
+Each run starts ``python -m src.main`` in a fresh interpreter with the startup
+tracer on and ``--startup-benchmark`` set, so the window closes itself once it
+has painted. The per-run JSON traces are reduced to medians (wall clock, time
+to first paint, import time, every phase and DI resolution, and the slowest
+imports) and written as one summary tagged with the current git commit.
+
+Pass the summary of an earlier commit as ``--baseline`` to fail (exit 1) when
+any of those numbers regressed by more than ``--tolerance``.
+
+On Linux without a display the app is started under ``xvfb-run`` when it is
+installed, so this also runs on headless CI machines.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--output startup.json]
+        [--baseline previous.json] [--tolerance 0.2] [--min-delta-ms 25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.utils.startup_trace import BENCHMARK_FLAG, TRACE_ENV
+
+TOP_IMPORTS = 15
+
+
+def app_command(xvfb: str) -> list[str]:
+    command = [sys.executable, "-m", "src.main", BENCHMARK_FLAG]
+    headless = sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+    if xvfb == "always" or (xvfb == "auto" and headless):
+        if not (xvfb_run := shutil.which("xvfb-run")):
+            raise SystemExit("xvfb-run not found; install Xvfb or run with a display")
+        command = [xvfb_run, "-a", *command]
+    return command
+
+
+def run_once(command: list[str], report_path: Path, timeout: float) -> dict[str, Any]:
+    env = {**os.environ, TRACE_ENV: str(report_path)}
+    started = time.perf_counter()
+    result = subprocess.run(
+        command,
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if not report_path.exists():
+        tail = "\n".join(result.stderr.strip().splitlines()[-15:])
+        raise SystemExit(f"Run produced no startup trace (exit code {result.returncode}):\n{tail}")
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    report["wall_ms"] = round(wall_ms, 3)
+    return report
+
+
+def summed(spans: list[dict[str, Any]], field: str = "duration_ms") -> dict[str, float]:
+    totals: dict[str, float] = defaultdict(float)
+    for span in spans:
+        totals[span["name"]] += span[field]
+    return totals
+
+
+def medians(per_run: list[dict[str, float]]) -> dict[str, float]:
+    names = {name for run in per_run for name in run}
+    return {
+        name: round(statistics.median(run.get(name, 0.0) for run in per_run), 3)
+        for name in sorted(names)
+    }
+
+
+def summarize(reports: list[dict[str, Any]]) -> dict[str, Any]:
+    import_medians = medians([summed(report["imports"], "self_ms") for report in reports])
+    slowest = sorted(import_medians.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "commit": git_commit(),
+        "runs": len(reports),
+        "python": reports[0]["python"],
+        "platform": reports[0]["platform"],
+        "metrics": {
+            "wall_ms": round(statistics.median(r["wall_ms"] for r in reports), 3),
+            "first_paint_ms": round(
+                statistics.median(r["marks"].get("first_paint", r["total_ms"]) for r in reports), 3
+            ),
+            "import_total_ms": round(statistics.median(r["import_total_ms"] for r in reports), 3),
+        },
+        "phases": medians([summed(report["phases"]) for report in reports]),
+        "services": medians([summed(report["services"]) for report in reports]),
+        "slowest_imports": dict(slowest[:TOP_IMPORTS]),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def regressions(
+    summary: dict[str, Any], baseline: dict[str, Any], tolerance: float, min_delta_ms: float
+) -> list[str]:
+    """Numbers that grew by more than ``tolerance`` and at least ``min_delta_ms``."""
+    found = []
+    for section in ("metrics", "phases", "services"):
+        for name, before in baseline.get(section, {}).items():
+            if (after := summary[section].get(name)) is None:
+                continue
+            if after - before >= min_delta_ms and after > before * (1 + tolerance):
+                found.append(f"{section}.{name}: {before:.1f} ms -> {after:.1f} ms")
+    return found
+
+
+def print_summary(summary: dict[str, Any]) -> None:
+    print(f"\nStartup over {summary['runs']} runs (commit {summary['commit'] or 'unknown'})")
+    for title, section in (
+        ("Overall", "metrics"),
+        ("Phases", "phases"),
+        ("Service resolution", "services"),
+        ("Slowest imports (self time)", "slowest_imports"),
+    ):
+        print(f"\n{title}:")
+        for name, value in summary[section].items():
+            print(f"  {name:<48} {value:>10.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write the summary JSON here")
+    parser.add_argument("--baseline", type=Path, help="summary JSON of an earlier commit")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative growth")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=25.0, help="ignore growth smaller than this"
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per run")
+    parser.add_argument("--xvfb", choices=("auto", "always", "never"), default="auto")
+    args = parser.parse_args()
+
+    command = app_command(args.xvfb)
+    reports = []
+    with tempfile.TemporaryDirectory(prefix="startup-bench-") as tmp:
+        for run in range(1, args.runs + 1):
+            report = run_once(command, Path(tmp, f"run-{run}.json"), args.timeout)
+            print(f"run {run}/{args.runs}: first paint {report['total_ms']:.0f} ms")
+            reports.append(report)
+
+    summary = summarize(reports)
+    print_summary(summary)
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        print(f"\nSummary written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if found := regressions(summary, baseline, args.tolerance, args.min_delta_ms):
+            print(f"\nRegressed against {baseline.get('commit') or args.baseline}:")
+            for line in found:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions against {baseline.get('commit') or args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
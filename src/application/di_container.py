@@ -2,6 +2,7 @@ import importlib
 import inspect
 import types
 from collections.abc import Callable
+from dataclasses import dataclass
 from inspect import signature
 from typing import (
     Any,
@@ -15,6 +16,7 @@ from typing import (
 )
 
 from src.core.enums import LifetimeScope
+from src.utils.startup_trace import get_startup_tracer
 
 TService = TypeVar("TService")
 
@@ -50,11 +52,24 @@ class ServiceDescriptor(Generic[TService]):
             )
 
 
+@dataclass(frozen=True, slots=True)
+class _Dependency:
+    """One constructor parameter the container fills in."""
+
+    param_name: str
+    service_type: type[Any] | None
+    optional: bool
+    type_name: str
+
+
 class ServiceContainer:
     def __init__(self) -> None:
         self._services: dict[type[Any], ServiceDescriptor[Any]] = {}
         self._singletons: dict[type[Any], Any] = {}
         self._building: set[type[Any]] = set()
+        # Constructor parameters to inject, per implementation type. Built from
+        # the signature and type hints on first construction and reused after.
+        self._plans: dict[type[Any], tuple[_Dependency, ...]] = {}
 
     def register_transient(
         self,
@@ -128,13 +143,16 @@ class ServiceContainer:
         self._building.add(service_type)
 
         try:
-            if descriptor.factory:
-                instance = descriptor.factory()
-            else:
-                if descriptor.implementation is None:
-                    error_msg = f"No implementation registered for service: {service_type.__name__}"
-                    raise ValueError(error_msg)
-                instance = self._create_instance(descriptor.implementation)
+            with get_startup_tracer().span(service_type.__name__, "service"):
+                if descriptor.factory:
+                    instance = descriptor.factory()
+                else:
+                    if descriptor.implementation is None:
+                        error_msg = (
+                            f"No implementation registered for service: {service_type.__name__}"
+                        )
+                        raise ValueError(error_msg)
+                    instance = self._create_instance(descriptor.implementation)
 
             if descriptor.lifetime == LifetimeScope.SINGLETON:
                 self._singletons[service_type] = instance
@@ -145,9 +163,25 @@ class ServiceContainer:
             self._building.discard(service_type)
 
     def _create_instance(self, implementation_type: type[TService]) -> TService:
-        if not hasattr(implementation_type, "__init__"):
-            return implementation_type()
+        if (plan := self._plans.get(implementation_type)) is None:
+            plan = self._plans[implementation_type] = self._compile_plan(implementation_type)
 
+        kwargs = {}
+        for dependency in plan:
+            if dependency.service_type is not None and self.has(dependency.service_type):
+                kwargs[dependency.param_name] = self.get(dependency.service_type)
+            elif dependency.optional:
+                kwargs[dependency.param_name] = None
+            else:
+                raise ValueError(
+                    f"Required dependency {dependency.type_name} for "
+                    f"{implementation_type.__name__}.{dependency.param_name} "
+                    f"is not registered in the container"
+                )
+
+        return implementation_type(**kwargs)
+
+    def _compile_plan(self, implementation_type: type[Any]) -> tuple[_Dependency, ...]:
         sig = signature(implementation_type.__init__)
 
         global_ns = {}
@@ -159,43 +193,44 @@ class ServiceContainer:
 
         type_hints = get_type_hints(implementation_type.__init__, globalns=global_ns)
 
-        kwargs = {}
+        plan = []
         for param_name, param in sig.parameters.items():
             if param_name == "self":
                 continue
             if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
                 continue
 
-            if param.default != param.empty and not self._is_custom_type(
-                type_hints.get(param_name)
-            ):
+            param_type = type_hints.get(param_name)
+            if not param_type or param_type == Any or not self._is_custom_type(param_type):
                 continue
 
-            if (
-                (param_type := type_hints.get(param_name))
-                and param_type != Any
-                and self._is_custom_type(param_type)
-            ):
-                origin = get_origin(param_type)
-                is_union = origin is Union or isinstance(param_type, types.UnionType)
-
-                if is_union and type(None) in get_args(param_type):
-                    non_none_type = next(t for t in get_args(param_type) if t is not type(None))
-                    dependency_type = cast(type, non_none_type)
-                    if self.has(dependency_type):
-                        kwargs[param_name] = self.get(dependency_type)
-                    else:
-                        kwargs[param_name] = None
-                elif isinstance(param_type, type) and self.has(param_type):
-                    kwargs[param_name] = self.get(param_type)
-                else:
-                    type_name = self._get_type_name(param_type)
-                    raise ValueError(
-                        f"Required dependency {type_name} for {implementation_type.__name__}.{param_name} "
-                        f"is not registered in the container"
+            origin = get_origin(param_type)
+            is_union = origin is Union or isinstance(param_type, types.UnionType)
+
+            if is_union and type(None) in get_args(param_type):
+                non_none_type = next(t for t in get_args(param_type) if t is not type(None))
+                plan.append(
+                    _Dependency(
+                        param_name, cast(type, non_none_type), True, self._get_type_name(param_type)
                     )
+                )
+            else:
+                plan.append(
+                    _Dependency(
+                        param_name,
+                        param_type if isinstance(param_type, type) else None,
+                        False,
+                        self._get_type_name(param_type),
+                    )
+                )
 
-        return implementation_type(**kwargs)
+        return tuple(plan)
+
+    def precompile(self, *implementation_types: type[Any]) -> None:
+        """Build the resolution plans for ``implementation_types`` ahead of first use."""
+        for implementation_type in implementation_types:
+            if implementation_type not in self._plans:
+                self._plans[implementation_type] = self._compile_plan(implementation_type)
 
     def create_with_injection(self, class_type: type[TService]) -> TService:
         return self._create_instance(class_type)
@@ -247,6 +282,7 @@ class ServiceContainer:
     def clear(self) -> None:
         self._services.clear()
         self._singletons.clear()
+        self._plans.clear()
 
     def register_instance(
         self,
@@ -296,8 +332,10 @@ class ServiceContainer:
         return self
 
     def validate_dependencies(self) -> None:
-        for service_type in self._services:
+        for service_type, descriptor in self._services.items():
             try:
+                if descriptor.implementation is not None:
+                    self.precompile(descriptor.implementation)
                 self.get(service_type)
             except Exception as e:
                 raise ValueError(
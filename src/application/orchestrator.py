@@ -20,16 +20,6 @@ from src.core.interfaces import (
     IUIState,
 )
 from src.core.models import Download
-from src.handlers import (
-    instagram_handler,
-    pinterest_handler,
-    radiojavan_handler,
-    soundcloud_handler,
-    spotify_handler,
-    tiktok_handler,
-    twitter_handler,
-    youtube_handler,
-)
 from src.handlers.service_detector import ServiceDetector
 from src.services.cookies import (
     SoundCloudCookieManager,
@@ -40,10 +30,11 @@ from src.services.cookies import (
 )
 from src.services.cookies.radiojavan_cookie_manager import RadioJavanCookieManager
 from src.services.detection.base_handler import BaseHandler
-from src.services.detection.link_detector import LinkDetector
+from src.services.detection.link_detector import LinkDetectionRegistry, LinkDetector
 from src.services.events.queue import Message, MessageLevel, MessageQueue
 from src.services.file import FileService
 from src.services.instagram.auth_manager import InstagramAuthManager
+from src.services.network.session_pool import reset_session_pool
 
 if TYPE_CHECKING:
     import customtkinter as ctk
@@ -52,6 +43,7 @@ from src.application.di_container import ServiceContainer
 from src.application.service_factories import ServiceFactoryRegistry
 from src.core.models import UIState
 from src.utils.logger import get_logger
+from src.utils.startup_trace import trace_phase
 
 logger = get_logger(__name__)
 
@@ -88,13 +80,16 @@ class ApplicationOrchestrator:
 
         self.container = ServiceContainer()
         self.factory_registry = ServiceFactoryRegistry(self.container, self.root)
-        self._configure_dependencies()
+        with trace_phase("orchestrator.configure_dependencies"):
+            self._configure_dependencies()
 
         self.network_checker = self.container.get(INetworkChecker)
 
-        self._import_link_handlers()
-        self.link_detector = LinkDetector(handler_factory=self._create_handler_factory())
-        self._initialize_cookies_background()
+        with trace_phase("orchestrator.link_handlers"):
+            self._import_link_handlers()
+            self.link_detector = LinkDetector(handler_factory=self._create_handler_factory())
+        with trace_phase("orchestrator.cookies_background"):
+            self._initialize_cookies_background()
 
         self.ui_components: dict[str, _UIComponentProtocol] = {}
 
@@ -176,17 +171,9 @@ class ApplicationOrchestrator:
         self.root.after(0, callback)
 
     def _import_link_handlers(self) -> None:
-        with contextlib.suppress(Exception):
-            _ = (
-                instagram_handler,
-                pinterest_handler,
-                radiojavan_handler,
-                soundcloud_handler,
-                spotify_handler,
-                tiktok_handler,
-                twitter_handler,
-                youtube_handler,
-            )
+        # Only the URL patterns are registered here; each handler module is
+        # imported the first time a URL for its service is detected.
+        LinkDetectionRegistry.register_manifest(self.config)
 
     def _initialize_cookies_background(self) -> None:
         def init_youtube_cookies() -> None:
@@ -417,6 +404,7 @@ class ApplicationOrchestrator:
             ):
                 self.event_coordinator.downloads.cleanup()
 
+            reset_session_pool()
             self.container.clear()
         except Exception:
             pass
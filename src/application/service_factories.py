@@ -27,6 +27,7 @@ from src.services.cookies import (
     SpotifyCookieManager,
 )
 from src.services.detection.base_handler import BaseHandler
+from src.services.downloads import DownloadJournal
 from src.services.instagram import InstagramAuthManager
 from src.services.youtube.metadata_service import YouTubeMetadataService
 from src.utils.logger import get_logger
@@ -161,8 +162,13 @@ class ServiceFactoryRegistry:
         return handler_ctor(message_queue=message_queue, config=config)
 
     def create_download_handler(self) -> DownloadHandler:
-        """Create download handler with proper dependencies."""
-        return DownloadHandler(
+        """Create download handler with proper dependencies.
+
+        The queue journal is replayed here so restored downloads are present before
+        the UI first asks for the list.
+        """
+        config = self.container.get(AppConfig)
+        handler = DownloadHandler(
             service_factory=self._get_service_factory(),
             file_service=self.container.get(IFileService),
             ui_state=self.container.get(IUIState),
@@ -170,7 +176,11 @@ class ServiceFactoryRegistry:
             auto_cookie_manager=self.container.get(IAutoCookieManager),
             message_queue=self.container.get_optional(IMessageQueue),
             error_handler=self.container.get_optional(IErrorNotifier),
+            config=config,
+            journal=DownloadJournal(config=config) if config.downloads.persist_queue else None,
         )
+        handler.initialize()
+        return handler
 
     def _get_service_factory(self) -> ServiceFactory:
         """Get or create ServiceFactory using new registry."""
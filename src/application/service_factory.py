@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+import importlib
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, cast
+
 from src.core.config import AppConfig, get_config
 from src.core.enums import ServiceType
 from src.core.interfaces import (
@@ -7,22 +13,18 @@ from src.core.interfaces import (
     IErrorNotifier,
     IFileService,
 )
-from src.services.cookies import (
-    RadioJavanCookieManager,
-    SoundCloudCookieManager,
-    SpotifyCookieManager,
-)
-from src.services.instagram import InstagramAuthManager
-from src.services.instagram.downloader import InstagramDownloader
-from src.services.pinterest.downloader import PinterestDownloader
-from src.services.radiojavan.downloader import RadioJavanDownloader
-from src.services.soundcloud.downloader import SoundCloudDownloader
-from src.services.spotify.downloader import SpotifyDownloader
-from src.services.tiktok.downloader import TikTokDownloader
-from src.services.twitter.downloader import TwitterDownloader
-from src.services.youtube.downloader import YouTubeDownloader
+from src.services.detection import UrlClassifier
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.services.cookies import (
+        RadioJavanCookieManager,
+        SoundCloudCookieManager,
+        SpotifyCookieManager,
+    )
+    from src.services.instagram import InstagramAuthManager
+    from src.services.instagram.downloader import InstagramDownloader
+
 logger = get_logger(__name__)
 
 
@@ -52,6 +54,10 @@ class ServiceFactory:
         self.config = resolved_config
         logger.info("[SERVICE_FACTORY] Initialized")
 
+    @cached_property
+    def url_classifier(self) -> UrlClassifier:
+        return UrlClassifier(self.config, handler_patterns={})
+
     def get_cookie_handler(self) -> ICookieHandler | None:
         return self.cookie_handler
 
@@ -63,22 +69,8 @@ class ServiceFactory:
         return self.auto_cookie_manager
 
     def detect_service_type(self, url: str) -> ServiceType:
-        url_lower = url.lower()
-
-        service_map = {
-            ServiceType.YOUTUBE: ["youtube.com", "youtu.be"],
-            ServiceType.SOUNDCLOUD: ["soundcloud.com"],
-            ServiceType.TWITTER: ["twitter.com", "x.com"],
-            ServiceType.INSTAGRAM: ["instagram.com"],
-            ServiceType.PINTEREST: ["pinterest.com", "pin.it"],
-            ServiceType.TIKTOK: ["tiktok.com", "vm.tiktok.com"],
-            ServiceType.RADIOJAVAN: ["play.radiojavan.com", "radiojavan.com", "rj.app"],
-            ServiceType.SPOTIFY: ["open.spotify.com", "spotify.com", "spotify.link"],
-        }
-
-        for service_type, patterns in service_map.items():
-            if any(pattern in url_lower for pattern in patterns):
-                return service_type
+        if (service_type := self.url_classifier.service_for_url(url)) is not ServiceType.GENERIC:
+            return service_type
 
         logger.warning(f"[SERVICE_FACTORY] Unknown service type for URL: {url}")
         if self.error_handler:
@@ -97,58 +89,18 @@ class ServiceFactory:
             service_type = self.detect_service_type(url)
         logger.info(f"[SERVICE_FACTORY] Getting downloader for service: {service_type}")
 
-        downloader_map = {
-            ServiceType.SOUNDCLOUD: lambda: SoundCloudDownloader(
-                error_handler=self.error_handler,
-                file_service=self.file_service,
-                config=self.config,
-                cookie_manager=self.sc_cookie_manager,
-            ),
-            ServiceType.YOUTUBE: lambda: YouTubeDownloader(
-                cookie_handler=self.cookie_handler,
-                auto_cookie_manager=self.auto_cookie_manager,
-                error_handler=self.error_handler,
-                file_service=self.file_service,
-                config=self.config,
-            ),
-            ServiceType.TWITTER: lambda: TwitterDownloader(
-                error_handler=self.error_handler,
-                file_service=self.file_service,
-                config=self.config,
-            ),
-            ServiceType.INSTAGRAM: self._get_instagram_downloader,
-            ServiceType.PINTEREST: lambda: PinterestDownloader(
-                error_handler=self.error_handler,
-                file_service=self.file_service,
-                config=self.config,
-            ),
-            ServiceType.TIKTOK: lambda: TikTokDownloader(
-                error_handler=self.error_handler,
-                file_service=self.file_service,
-                config=self.config,
-            ),
-            ServiceType.RADIOJAVAN: lambda: RadioJavanDownloader(
-                error_handler=self.error_handler,
-                file_service=self.file_service,
-                config=self.config,
-                cookie_manager=self.rj_cookie_manager,
-            ),
-            ServiceType.SPOTIFY: lambda: SpotifyDownloader(
+        try:
+            if service_type == ServiceType.INSTAGRAM:
+                return self._get_instagram_downloader()
+            if not (downloader_class := self._downloader_class(service_type)):
+                logger.error(f"[SERVICE_FACTORY] No factory for service type: {service_type}")
+                return None
+            return downloader_class(
                 error_handler=self.error_handler,
                 file_service=self.file_service,
                 config=self.config,
-                cookie_handler=self.cookie_handler,
-                auto_cookie_manager=self.auto_cookie_manager,
-                spotify_cookie_manager=self.spotify_cookie_manager,
-            ),
-        }
-
-        if not (downloader_factory := downloader_map.get(service_type)):
-            logger.error(f"[SERVICE_FACTORY] No factory for service type: {service_type}")
-            return None
-
-        try:
-            return downloader_factory()
+                **self._downloader_kwargs(service_type),
+            )
         except Exception as e:
             logger.error(f"[SERVICE_FACTORY] Failed to create downloader: {e}", exc_info=True)
             if self.error_handler:
@@ -157,7 +109,42 @@ class ServiceFactory:
                 )
             return None
 
+    def _downloader_class(self, service_type: ServiceType) -> type[BaseDownloader] | None:
+        """Import the service's downloader module the first time it is needed.
+
+        Module and class come from ``services.<name>.downloader_module`` and
+        ``downloader_class``, so yt-dlp, instaloader and friends stay unloaded
+        until a download for their service starts.
+        """
+        if not (service_config := self.config.services.all_services.get(str(service_type))):
+            return None
+        module = importlib.import_module(service_config["downloader_module"])
+        return cast(type[BaseDownloader], getattr(module, service_config["downloader_class"]))
+
+    def _downloader_kwargs(self, service_type: ServiceType) -> dict[str, Any]:
+        """Service-specific constructor arguments beyond handler, file service and config."""
+        match service_type:
+            case ServiceType.SOUNDCLOUD:
+                return {"cookie_manager": self.sc_cookie_manager}
+            case ServiceType.YOUTUBE:
+                return {
+                    "cookie_handler": self.cookie_handler,
+                    "auto_cookie_manager": self.auto_cookie_manager,
+                }
+            case ServiceType.RADIOJAVAN:
+                return {"cookie_manager": self.rj_cookie_manager}
+            case ServiceType.SPOTIFY:
+                return {
+                    "cookie_handler": self.cookie_handler,
+                    "auto_cookie_manager": self.auto_cookie_manager,
+                    "spotify_cookie_manager": self.spotify_cookie_manager,
+                }
+            case _:
+                return {}
+
     def _get_instagram_downloader(self) -> InstagramDownloader:
+        from src.services.instagram.downloader import InstagramDownloader
+
         if not self.instagram_auth_manager:
             logger.warning("[SERVICE_FACTORY] Instagram auth manager not available")
             return InstagramDownloader(
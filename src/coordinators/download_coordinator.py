@@ -1,5 +1,7 @@
+import threading
 import time
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterable
 from datetime import datetime
 
 from src.core.config import AppConfig, get_config
@@ -16,6 +18,75 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_ACTIVE_STATUSES = frozenset({DownloadStatus.PENDING, DownloadStatus.DOWNLOADING})
+
+
+class _ProgressAggregate:
+    """Running totals over the download queue, keyed by ``Download.id``.
+
+    Each event re-observes only the download it concerns: its previous status and
+    progress are retracted from the counters and the current ones applied, so the
+    overall figure is available in constant time however long the queue is. Progress
+    callbacks arrive on worker threads, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[DownloadStatus, float]] = {}
+        self.status_counts: Counter[DownloadStatus] = Counter()
+        self._active_count = 0
+        self._active_progress = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, download_id: object) -> bool:
+        return download_id in self._entries
+
+    @property
+    def active_count(self) -> int:
+        return self._active_count
+
+    def _apply(self, status: DownloadStatus, progress: float, sign: int) -> None:
+        self.status_counts[status] += sign
+        if status in _ACTIVE_STATUSES:
+            self._active_count += sign
+            self._active_progress += sign * progress
+
+    def observe(self, download: Download) -> None:
+        """Fold the current status and progress of ``download`` into the totals."""
+        with self._lock:
+            self._observe_locked(download)
+
+    def _observe_locked(self, download: Download) -> None:
+        if (previous := self._entries.get(download.id)) is not None:
+            self._apply(*previous, sign=-1)
+        entry = (download.status, download.progress)
+        self._entries[download.id] = entry
+        self._apply(*entry, sign=1)
+
+    def forget(self, download_id: str) -> None:
+        with self._lock:
+            if (previous := self._entries.pop(download_id, None)) is not None:
+                self._apply(*previous, sign=-1)
+
+    def reset(self, downloads: Iterable[Download] = ()) -> None:
+        """Rebuild from scratch, which also discards accumulated float error."""
+        with self._lock:
+            self._entries.clear()
+            self.status_counts.clear()
+            self._active_count = 0
+            self._active_progress = 0.0
+            for download in downloads:
+                self._observe_locked(download)
+
+    def overall_progress(self) -> float:
+        """Mean progress of active downloads; 100 once only completed ones remain."""
+        with self._lock:
+            if self._active_count <= 0:
+                return 100.0 if self.status_counts[DownloadStatus.COMPLETED] > 0 else 0.0
+            return min(100.0, max(0.0, self._active_progress / self._active_count))
+
 
 class DownloadCoordinator:
     def __init__(
@@ -35,8 +106,10 @@ class DownloadCoordinator:
         self.message_queue = message_queue
         self.ui_callbacks = ui_callbacks or {}
         self._progress_throttle = {}
-        self._last_progress_update = {}
+        # Last accepted progress event per Download.id
+        self._last_progress_update: dict[str, float] = {}
         self._progress_update_interval = 0.1
+        self._progress = _ProgressAggregate()
 
         # Subscribe to download events
         self._setup_event_subscriptions()
@@ -51,6 +124,10 @@ class DownloadCoordinator:
         self.ui_callbacks.update(callbacks)
         logger.info(f"[DOWNLOAD_COORDINATOR] UI callbacks updated: {list(callbacks.keys())}")
 
+        # Show downloads restored from the queue journal as soon as the list exists
+        if "refresh_download_list" in callbacks and self.download_handler.has_items():
+            self._refresh_ui_after_event(enable_buttons=True)
+
     def _get_ui_callback(self, callback_name: str) -> Callable | None:
         """Get a UI callback if available."""
         return self.ui_callbacks.get(callback_name)
@@ -90,7 +167,7 @@ class DownloadCoordinator:
         if refresh_callback := self._get_ui_callback("refresh_download_list"):
             try:
                 downloads = self.download_handler.get_downloads()
-                self._cleanup_old_progress_tracking(downloads)
+                self._sync_progress_tracking(downloads)
                 refresh_callback(downloads)
                 logger.debug(f"[DOWNLOAD_COORDINATOR] Refreshed UI with {len(downloads)} downloads")
             except Exception as e:
@@ -113,21 +190,23 @@ class DownloadCoordinator:
                         e, "Setting action buttons state", "Download Coordinator"
                     )
 
-    def _cleanup_old_progress_tracking(self, downloads: list[Download]) -> None:
-        """Clean up progress tracking for downloads that are no longer active."""
-        active_download_ids = {id(d) for d in downloads}
-        completed_ids = {
-            id(d)
-            for d in downloads
-            if d.status
-            in {DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED}
-        }
+    def _sync_progress_tracking(self, downloads: list[Download], force: bool = False) -> None:
+        """Rebuild the progress aggregate when it no longer matches the queue.
 
-        ids_to_remove = set(self._last_progress_update.keys()) - active_download_ids
-        ids_to_remove.update(completed_ids)
+        Adds and removes made through the coordinator keep the aggregate current, so
+        this only rebuilds when the sizes disagree (e.g. downloads restored from the
+        journal or queued straight on the handler), or when ``force`` is set after a
+        batch whose workers may have stopped without publishing an event.
+        """
+        if not force and len(downloads) == len(self._progress):
+            return
+        self._progress.reset(downloads)
+        for download_id in self._last_progress_update.keys() - {d.id for d in downloads}:
+            del self._last_progress_update[download_id]
 
-        for download_id in ids_to_remove:
-            self._last_progress_update.pop(download_id, None)
+    def _forget_progress(self, download: Download) -> None:
+        self._progress.forget(download.id)
+        self._last_progress_update.pop(download.id, None)
 
     def _setup_event_subscriptions(self) -> None:
         """Subscribe to download events from event bus."""
@@ -137,23 +216,14 @@ class DownloadCoordinator:
 
     # Event Handlers
     def _calculate_overall_progress(self) -> float:
-        """Calculate overall progress from all active downloads."""
-        downloads = self.download_handler.get_downloads()
-        active_downloads = [
-            d for d in downloads if d.status in {DownloadStatus.PENDING, DownloadStatus.DOWNLOADING}
-        ]
-
-        if not active_downloads:
-            completed_downloads = [d for d in downloads if d.status == DownloadStatus.COMPLETED]
-            return 100.0 if completed_downloads else 0.0
-
-        total_progress = sum(d.progress for d in active_downloads)
-        return total_progress / len(active_downloads)
+        """Overall progress of active downloads, from the running aggregate."""
+        return self._progress.overall_progress()
 
     def _on_progress_event(self, download: Download, progress: float, speed: float) -> None:
         """Handle progress event with throttling to prevent UI freezing."""
         current_time = time.time()
-        download_id = id(download)
+        download_id = download.id
+        self._progress.observe(download)
 
         last_update = self._last_progress_update.get(download_id, 0)
         time_since_update = current_time - last_update
@@ -195,13 +265,13 @@ class DownloadCoordinator:
 
     def _on_completed_event(self, download: Download) -> None:
         """Handle completion event - update UI immediately."""
-        download_id = id(download)
-        self._last_progress_update.pop(download_id, None)
+        self._last_progress_update.pop(download.id, None)
 
         if download.status != DownloadStatus.COMPLETED:
             download.status = DownloadStatus.COMPLETED
             if not download.completed_at:
                 download.completed_at = datetime.now()
+        self._progress.observe(download)
 
         overall_progress = self._calculate_overall_progress()
         if status_callback := self._get_ui_callback("update_status_progress"):
@@ -227,13 +297,13 @@ class DownloadCoordinator:
         """
         logger.error(f"[DOWNLOAD_COORDINATOR] Failed: {download.name} - {error}")
 
-        download_id = id(download)
-        self._last_progress_update.pop(download_id, None)
+        self._last_progress_update.pop(download.id, None)
 
         download.status = DownloadStatus.FAILED
         download.error_message = error
         if not download.completed_at:
             download.completed_at = datetime.now()
+        self._progress.observe(download)
 
         if self.message_queue:
             try:
@@ -258,6 +328,7 @@ class DownloadCoordinator:
         if self.download_handler:
             try:
                 self.download_handler.add_download(download)
+                self._progress.observe(download)
                 logger.info(f"[DOWNLOAD_COORDINATOR] Added download: {download.name}")
                 self._refresh_ui_after_event(enable_buttons=True)
             except Exception as e:
@@ -307,10 +378,12 @@ class DownloadCoordinator:
                         logger.debug(
                             f"[DOWNLOAD_COORDINATOR] Completion callback: success={success}"
                         )
+                        downloads = self.download_handler.get_downloads()
+                        # Workers that were cancelled or paused publish no event.
+                        self._sync_progress_tracking(downloads, force=True)
                         has_active = self.has_active_downloads()
                         logger.debug(f"[DOWNLOAD_COORDINATOR] Has active downloads: {has_active}")
                         if not has_active:
-                            downloads = self.download_handler.get_downloads()
                             failed = [d for d in downloads if d.status == DownloadStatus.FAILED]
                             if failed:
                                 self._update_status(f"Failed: {failed[0].name}", is_error=True)
@@ -367,7 +440,11 @@ class DownloadCoordinator:
         """Remove downloads via the download handler."""
         if self.download_handler:
             try:
+                downloads = self.download_handler.get_downloads()
+                removed = [downloads[i] for i in set(indices) if 0 <= i < len(downloads)]
                 self.download_handler.remove_downloads(indices)
+                for download in removed:
+                    self._forget_progress(download)
                 logger.info(f"[DOWNLOAD_COORDINATOR] Removed downloads at indices: {indices}")
                 self._refresh_ui_after_event(enable_buttons=True)
             except Exception as e:
@@ -388,6 +465,8 @@ class DownloadCoordinator:
         if self.download_handler:
             try:
                 self.download_handler.clear_downloads()
+                self._progress.reset()
+                self._last_progress_update.clear()
                 logger.info("[DOWNLOAD_COORDINATOR] Cleared all downloads")
                 self._refresh_ui_after_event(enable_buttons=True)
             except Exception as e:
@@ -439,6 +518,7 @@ class DownloadCoordinator:
             for download in downloads:
                 if download.status in active_statuses:
                     self.download_handler.cancel_download(download)
+                    self._progress.observe(download)
             logger.info("[DOWNLOAD_COORDINATOR] Cancelled all active downloads")
         except Exception as e:
             logger.error(f"[DOWNLOAD_COORDINATOR] Error cancelling downloads: {e}", exc_info=True)
@@ -447,6 +527,28 @@ class DownloadCoordinator:
                     e, "Cancelling downloads", "Download Coordinator"
                 )
 
+    def pause_download(self, download: Download) -> None:
+        """Pause a download; its worker stops and the partial file is kept."""
+        try:
+            self.download_handler.pause_download(download)
+            self._progress.observe(download)
+            self._refresh_ui_after_event(enable_buttons=True)
+        except Exception as e:
+            logger.error(f"[DOWNLOAD_COORDINATOR] Error pausing download: {e}", exc_info=True)
+            if self.error_handler:
+                self.error_handler.handle_exception(e, "Pausing download", "Download Coordinator")
+
+    def resume_download(self, download: Download, download_dir: str | None = None) -> None:
+        """Resume a paused download from where its partial file stopped."""
+        try:
+            if self.download_handler.resume_download(download):
+                self._progress.observe(download)
+                self.start_downloads([download], download_dir)
+        except Exception as e:
+            logger.error(f"[DOWNLOAD_COORDINATOR] Error resuming download: {e}", exc_info=True)
+            if self.error_handler:
+                self.error_handler.handle_exception(e, "Resuming download", "Download Coordinator")
+
     def cleanup(self) -> None:
         """Clean up resources."""
         logger.info("[DOWNLOAD_COORDINATOR] Cleaning up")
@@ -1,17 +1,18 @@
+from __future__ import annotations
+
+import importlib
 import os
 import re
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from src.core.config import AppConfig, get_config
 from src.core.enums.instagram_auth_status import InstagramAuthStatus
 from src.core.interfaces import ICookieHandler, IErrorNotifier
 from src.core.models import Download
 from src.services.instagram.auth_manager import InstagramAuthManager
-from src.services.instagram.downloader import InstagramDownloader
-from src.services.soundcloud.downloader import SoundCloudDownloader
-from src.services.spotify.downloader import SpotifyDownloader
 from src.ui.components.loading_dialog import LoadingDialog
 from src.ui.dialogs.login_dialog import LoginDialog
 from src.utils.error_helpers import extract_error_context
@@ -20,6 +21,28 @@ from src.utils.window import close_loading_dialog
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    from src.services.instagram.downloader import InstagramDownloader
+
+# Downloaders used by the dialogs pull in yt-dlp, instaloader and bs4, so they
+# are imported when a dialog first needs one rather than at startup.
+_LAZY_DOWNLOADERS = {
+    "InstagramDownloader": "src.services.instagram.downloader",
+    "SoundCloudDownloader": "src.services.soundcloud.downloader",
+    "SpotifyDownloader": "src.services.spotify.downloader",
+}
+
+
+def __getattr__(name: str) -> type:
+    if module_path := _LAZY_DOWNLOADERS.get(name):
+        return getattr(importlib.import_module(module_path), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _downloader_class(name: str) -> type:
+    # Module globals win so a class patched onto this module is honoured.
+    return globals().get(name) or __getattr__(name)
+
 
 class DialogHandler(ABC):
     """Base interface for platform-specific dialog handlers."""
@@ -102,7 +125,7 @@ class SpotifyDialogHandler(DialogHandler):
     def show_dialog(self, url: str, on_download_callback: Callable) -> None:
         """Show Spotify download dialog."""
         try:
-            downloader = SpotifyDownloader(error_handler=self.error_handler)
+            downloader = _downloader_class("SpotifyDownloader")(error_handler=self.error_handler)
             info = downloader.get_metadata(url)
 
             track_name = info.get("title", os.path.basename(url) or "spotify_download")
@@ -134,7 +157,9 @@ class SoundCloudDialogHandler(DialogHandler):
 
         def _fetch_and_create() -> None:
             try:
-                downloader = SoundCloudDownloader(error_handler=self.error_handler)
+                downloader = _downloader_class("SoundCloudDownloader")(
+                    error_handler=self.error_handler
+                )
                 info = downloader.get_info(url)
 
                 if info and downloader._is_premium_track(info):
@@ -422,7 +447,9 @@ class PlatformDialogCoordinator:
             logger.info(
                 f"[PLATFORM_DIALOG_COORDINATOR] Auth worker started for user: {username[:3]}***"
             )
-            downloader = InstagramDownloader(error_handler=self.error_handler, config=self.config)
+            downloader = _downloader_class("InstagramDownloader")(
+                error_handler=self.error_handler, config=self.config
+            )
             logger.info("[PLATFORM_DIALOG_COORDINATOR] Calling downloader.authenticate()")
             success = downloader.authenticate(username, password)
             logger.info(f"[PLATFORM_DIALOG_COORDINATOR] Authentication result: {success}")
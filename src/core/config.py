@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.core.enums.appearance_mode import AppearanceMode
-from src.utils.logger import get_logger
+from src.utils.logger import configure_logging, get_logger
 
 if TYPE_CHECKING:
     pass
@@ -88,6 +88,18 @@ class PathConfig(BaseModel):
     def themes_dir(self) -> Path:
         return self.base_dir / "themes"
 
+    @property
+    def queue_journal_file(self) -> Path:
+        return self.base_dir / "download_queue.jsonl"
+
+    @property
+    def youtube_info_cache_dir(self) -> Path:
+        return self.base_dir / "cache" / "youtube_info"
+
+    @property
+    def spotify_cache_file(self) -> Path:
+        return self.base_dir / "cache" / "spotify.json"
+
     @property
     def config_file(self) -> Path:
         """Return the config file path (YAML preferred, JSON fallback)."""
@@ -118,12 +130,20 @@ class LogConfig(BaseModel):
         default="INFO",
         description="Log level (DEBUG, INFO, WARNING, ERROR)",
     )
+    queue_size: int = Field(
+        default=10_000,
+        description="Log records buffered for the background writer; DEBUG records are dropped when full",
+    )
 
 
 class DownloadConfig(BaseModel):
     """Download-related configuration."""
 
     max_concurrent_downloads: int = Field(default=1, description="Maximum concurrent downloads")
+    item_concurrency: int = Field(
+        default=4,
+        description="Media items of one download (carousel, multi-tweet) fetched at once",
+    )
     retry_count: int = Field(default=3, description="Number of retries for failed downloads")
     retry_delay: float = Field(default=3.0, description="Delay between retries in seconds")
     socket_timeout: int = Field(default=15, description="Socket timeout in seconds")
@@ -133,6 +153,42 @@ class DownloadConfig(BaseModel):
     )
     default_timeout: int = Field(default=10, description="Default download timeout in seconds")
     kb_to_bytes: int = Field(default=1024, description="KB to bytes conversion constant")
+    http_pool_connections: int = Field(
+        default=10,
+        description="Number of hosts whose connection pools each pooled HTTP session keeps",
+    )
+    http_pool_maxsize: int = Field(
+        default=4,
+        description="Keep-alive connections per host and idle HTTP sessions kept warm per host",
+    )
+    resume_partial_downloads: bool = Field(
+        default=True,
+        description="Keep interrupted .part files and resume them with HTTP Range requests",
+    )
+    segmented_min_size: int = Field(
+        default=8 * 1024 * 1024,
+        description=(
+            "Minimum size in bytes before a direct download is split across the "
+            "service's download_segments connections"
+        ),
+    )
+    bandwidth_limit: int = Field(
+        default=0,
+        description="Combined download rate cap in KB/s across all downloads (0 = unlimited)",
+    )
+    service_bandwidth_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-service download rate caps in KB/s, keyed by service name",
+    )
+    persist_queue: bool = Field(
+        default=True, description="Journal the download queue so it survives restarts"
+    )
+    journal_flush_interval: float = Field(
+        default=1.0, description="Seconds queue journal writes are batched before an fsync"
+    )
+    journal_compact_threshold: int = Field(
+        default=500, description="Journal lines after which the log is compacted"
+    )
 
 
 class NetworkConfig(BaseModel):
@@ -140,6 +196,10 @@ class NetworkConfig(BaseModel):
 
     default_timeout: int = Field(default=10, description="Default network timeout in seconds")
     twitter_api_timeout: int = Field(default=10, description="Twitter API timeout in seconds")
+    twitter_hedge_delay: float = Field(
+        default=1.5,
+        description="Seconds before the next-best tweet API endpoint is also asked (0 disables)",
+    )
     user_agent: str = Field(
         default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         description="Default user agent string",
@@ -151,6 +211,18 @@ class NetworkConfig(BaseModel):
     minimal_user_agent: str = Field(
         default="Mozilla/5.0", description="Minimal user agent for basic requests"
     )
+    connectivity_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds a successful service connectivity check is reused (0 disables)",
+    )
+    connectivity_failure_ttl: float = Field(
+        default=10.0,
+        description="Seconds a failed service connectivity check is reused",
+    )
+    connectivity_sweep_timeout: float = Field(
+        default=15.0,
+        description="Overall deadline in seconds for checking all services at once (0 waits for every check)",
+    )
     service_domains: dict[str, list[str]] = Field(
         default_factory=lambda: {
             "youtube": ["youtube.com", "youtu.be", "www.youtube.com", "music.youtube.com"],
@@ -290,6 +362,13 @@ class YouTubeConfig(BaseModel):
     metadata_timeout: int = Field(default=30, description="Metadata fetch timeout in seconds")
     fallback_timeout: int = Field(default=20, description="Fallback command timeout in seconds")
     subtitle_timeout: int = Field(default=5, description="Subtitle fetch timeout in seconds")
+    info_cache_ttl: int = Field(
+        default=1800,
+        description="Seconds an extracted info dict is reused before re-extracting (0 disables)",
+    )
+    info_cache_memory_items: int = Field(
+        default=64, description="Extracted info dicts kept in memory"
+    )
     client_fallback_timeout: int = Field(
         default=15, description="Client fallback timeout in seconds"
     )
@@ -605,6 +684,13 @@ class RadioJavanConfig(BaseModel):
         ],
         description="Available CDN hosts",
     )
+    host_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds CDN hosts from the host lookup endpoints are reused (0 disables)",
+    )
+    validation_concurrency: int = Field(
+        default=4, description="Candidate download URLs validated at once"
+    )
     media_type_paths: dict[str, str] = Field(
         default_factory=lambda: {
             "mp3": "/mp3/{media_name}",
@@ -641,6 +727,16 @@ class SpotifyConfig(BaseModel):
     youtube_search_format: str = Field(
         default="ytsearch{max}:{artist} - {track}", description="YouTube search query format"
     )
+    cache_ttl: int = Field(
+        default=86400,
+        description="Seconds oEmbed, track-list and YouTube search results are reused (0 disables)",
+    )
+    cache_max_entries: int = Field(
+        default=2000, description="Cached Spotify lookups kept before the oldest are evicted"
+    )
+    search_concurrency: int = Field(
+        default=4, description="YouTube searches run in parallel for playlist and album tracks"
+    )
     default_audio_quality: str = Field(default="best", description="Default audio quality")
     url_patterns: list[str] = Field(
         default_factory=lambda: [
@@ -678,6 +774,8 @@ class ServiceConfig(BaseModel):
                 r"^https?://music\.youtube\.com/playlist\?list=[\w-]+",
             ],
             "domains": ["youtube.com", "youtu.be", "www.youtube.com"],
+            "max_concurrent_downloads": 2,
+            "max_downloads_per_host": 2,
             "downloader_module": "src.services.youtube.downloader",
             "downloader_class": "YouTubeDownloader",
             "handler_module": "src.handlers.youtube_handler",
@@ -698,6 +796,10 @@ class ServiceConfig(BaseModel):
                 r"^https?://(?:mobile\.)?x\.com/[\w]+/status/[\d]+",
             ],
             "domains": ["twitter.com", "x.com", "api.x.com", "mobile.x.com"],
+            "media_domains": ["twimg.com"],
+            "download_segments": 4,
+            "max_concurrent_downloads": 3,
+            "max_downloads_per_host": 2,
             "downloader_module": "src.services.twitter.downloader",
             "downloader_class": "TwitterDownloader",
             "handler_module": "src.handlers.twitter_handler",
@@ -718,6 +820,10 @@ class ServiceConfig(BaseModel):
                 r"^https?://(?:www\.)?instagram\.com/[\w]+/reel/[\w-]+",
             ],
             "domains": ["instagram.com", "www.instagram.com", "m.instagram.com"],
+            "media_domains": ["cdninstagram.com", "fbcdn.net"],
+            "download_segments": 1,
+            "max_concurrent_downloads": 2,
+            "max_downloads_per_host": 1,
             "downloader_module": "src.services.instagram.downloader",
             "downloader_class": "InstagramDownloader",
             "handler_module": "src.handlers.instagram_handler",
@@ -740,6 +846,10 @@ class ServiceConfig(BaseModel):
                 r"^https?://(?:www\.)?pinterest\.fr/pin/[\d]+",
             ],
             "domains": ["pinterest.com", "www.pinterest.com"],
+            "media_domains": ["pinimg.com"],
+            "download_segments": 4,
+            "max_concurrent_downloads": 3,
+            "max_downloads_per_host": 2,
             "downloader_module": "src.services.pinterest.downloader",
             "downloader_class": "PinterestDownloader",
             "handler_module": "src.handlers.pinterest_handler",
@@ -759,6 +869,8 @@ class ServiceConfig(BaseModel):
                 r"^https?://soundcloud\.app\.goo\.gl/[\w]+",
             ],
             "domains": ["soundcloud.com", "www.soundcloud.com"],
+            "max_concurrent_downloads": 2,
+            "max_downloads_per_host": 2,
             "downloader_module": "src.services.soundcloud.downloader",
             "downloader_class": "SoundCloudDownloader",
             "handler_module": "src.handlers.soundcloud_handler",
@@ -776,6 +888,8 @@ class ServiceConfig(BaseModel):
                 r"^https?://(?:www\.)?tiktok\.com/t/[\w-]+",
             ],
             "domains": ["tiktok.com", "vm.tiktok.com", "www.tiktok.com"],
+            "max_concurrent_downloads": 2,
+            "max_downloads_per_host": 2,
             "downloader_module": "src.services.tiktok.downloader",
             "downloader_class": "TikTokDownloader",
             "handler_module": "src.handlers.tiktok_handler",
@@ -796,6 +910,10 @@ class ServiceConfig(BaseModel):
                 r"^https?://(?:www\.)?radiojavan\.com/(?:mp3|mp4)/[\w-]+",
             ],
             "domains": ["play.radiojavan.com", "radiojavan.com", "rj.app"],
+            "media_domains": ["rj1.media", "rj2.media", "rj3.media", "rjmedia.app"],
+            "download_segments": 4,
+            "max_concurrent_downloads": 2,
+            "max_downloads_per_host": 1,
             "downloader_module": "src.services.radiojavan.downloader",
             "downloader_class": "RadioJavanDownloader",
             "handler_module": "src.handlers.radiojavan_handler",
@@ -816,6 +934,8 @@ class ServiceConfig(BaseModel):
                 r"^https?://(?:spotify\.link|song\.link|album\.link|playlist\.link)/[\w-]+",
             ],
             "domains": ["open.spotify.com", "spotify.com", "spotify.link"],
+            "max_concurrent_downloads": 2,
+            "max_downloads_per_host": 2,
             "downloader_module": "src.services.spotify.downloader",
             "downloader_class": "SpotifyDownloader",
             "handler_module": "src.handlers.spotify_handler",
@@ -838,6 +958,34 @@ class ServiceConfig(BaseModel):
             "spotify": self.spotify,
         }
 
+    def service_for_host(self, host: str) -> str | None:
+        """Map a hostname (site or media CDN) to its service name.
+
+        Matches the host itself or any parent domain against each service's
+        ``domains`` and ``media_domains``.
+        """
+        host = host.lower().rstrip(".")
+        for name, service in self.all_services.items():
+            for domain in [*service.get("domains", []), *service.get("media_domains", [])]:
+                if host == domain or host.endswith(f".{domain}"):
+                    return name
+        return None
+
+    def download_segments_for_host(self, host: str) -> int:
+        """Number of parallel range connections configured for ``host``'s service."""
+        if not (name := self.service_for_host(host)):
+            return 1
+        return max(1, int(self.all_services[name].get("download_segments", 1)))
+
+    def concurrency_limits(self, service: str) -> tuple[int, int]:
+        """Per-service and per-host concurrent download caps (0 = only the global cap)."""
+        if not (service_config := self.all_services.get(service)):
+            return 0, 0
+        return (
+            max(0, int(service_config.get("max_concurrent_downloads", 0))),
+            max(0, int(service_config.get("max_downloads_per_host", 0))),
+        )
+
     @property
     def service_types(self) -> dict[str, str]:
         """Map domain to service type."""
@@ -1049,6 +1197,7 @@ class AppConfig(BaseSettings):
     tiktok: TikTokConfig = Field(default_factory=TikTokConfig)
     spotify: SpotifyConfig = Field(default_factory=SpotifyConfig)
     ui: UIConfig = Field(default_factory=UIConfig)
+    logging: LogConfig = Field(default_factory=LogConfig)
 
     @classmethod
     def _load_config_file(cls) -> dict[str, Any] | None:
@@ -1180,6 +1329,7 @@ def get_config() -> AppConfig:
     global _config_instance  # noqa: PLW0603
     if _config_instance is None:
         _config_instance = AppConfig()
+        configure_logging(_config_instance.logging)
     return _config_instance
 
 
@@ -61,6 +61,10 @@ class IDownloadHandler(Protocol):
 
     def cancel_download(self, download: Download) -> None: ...
 
+    def pause_download(self, download: Download) -> None: ...
+
+    def resume_download(self, download: Download) -> bool: ...
+
     def has_active_downloads(self) -> bool: ...
 
 
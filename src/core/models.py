@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -59,6 +60,7 @@ class CookieState(BaseModel):
 
 
 class Download(BaseModel):
+    id: str = Field(default_factory=lambda: uuid4().hex)
     name: str
     url: str
     status: DownloadStatus = Field(default=DownloadStatus.PENDING)
@@ -82,6 +84,7 @@ class Download(BaseModel):
     speed_limit: int | None = None
     retries: int = Field(default=3)
     concurrent_downloads: int = Field(default=1)
+    output_path: str | None = None
 
     _event_bus: IEventBus | None = None
 
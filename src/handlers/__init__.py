@@ -1,34 +1,13 @@
 import importlib
 
-from . import (
-    instagram_handler,
-    pinterest_handler,
-    radiojavan_handler,
-    soundcloud_handler,
-    spotify_handler,
-    tiktok_handler,
-    twitter_handler,
-    youtube_handler,
-)
 from .cookie_handler import CookieHandler
 from .download_handler import DownloadHandler
 from .network_checker import NetworkChecker
 from .service_detector import ServiceDetector
 
-
-def _register_link_handlers() -> tuple[type, ...]:
-    return (
-        youtube_handler.YouTubeHandler,
-        instagram_handler.InstagramHandler,
-        twitter_handler.TwitterHandler,
-        pinterest_handler.PinterestHandler,
-        soundcloud_handler.SoundCloudHandler,
-        spotify_handler.SpotifyHandler,
-        tiktok_handler.TikTokHandler,
-        radiojavan_handler.RadioJavanHandler,
-    )
-
-
+# Link handler modules import their dialogs and service clients, so they are
+# loaded on first use: through ``LinkDetectionRegistry`` when a URL needs one,
+# or through attribute access on this package.
 _HANDLER_IMPORTS = {
     "YouTubeHandler": ("youtube_handler", "YouTubeHandler"),
     "InstagramHandler": ("instagram_handler", "InstagramHandler"),
@@ -40,14 +19,10 @@ _HANDLER_IMPORTS = {
     "RadioJavanHandler": ("radiojavan_handler", "RadioJavanHandler"),
 }
 
-YouTubeHandler = youtube_handler.YouTubeHandler
-InstagramHandler = instagram_handler.InstagramHandler
-TwitterHandler = twitter_handler.TwitterHandler
-PinterestHandler = pinterest_handler.PinterestHandler
-SoundCloudHandler = soundcloud_handler.SoundCloudHandler
-SpotifyHandler = spotify_handler.SpotifyHandler
-TikTokHandler = tiktok_handler.TikTokHandler
-RadioJavanHandler = radiojavan_handler.RadioJavanHandler
+
+def _register_link_handlers() -> tuple[type, ...]:
+    """Import every link handler module so all handlers are registered."""
+    return tuple(__getattr__(name) for name in _HANDLER_IMPORTS)
 
 
 def __getattr__(name: str) -> type:
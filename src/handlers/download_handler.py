@@ -1,8 +1,13 @@
+import contextlib
+import glob
+import os
 import threading
 import time
+from collections import Counter
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -21,6 +26,16 @@ from src.core.interfaces import (
     IUIState,
 )
 from src.core.models import Download, DownloadOptions
+from src.services.detection import UrlClassifier
+from src.services.downloads import (
+    CancellationToken,
+    DownloadCancelledError,
+    DownloadJournal,
+    bind_budget,
+    bind_token,
+    current_token,
+)
+from src.services.network.bandwidth import get_bandwidth_scheduler
 from src.services.notifications.notifier import NotifierService
 from src.utils.logger import get_logger
 
@@ -38,6 +53,7 @@ class DownloadHandler(IDownloadHandler):
         message_queue: IMessageQueue | None = None,
         error_handler: IErrorNotifier | None = None,
         config: AppConfig | None = None,
+        journal: DownloadJournal | None = None,
     ) -> None:
         self.config = config or get_config()
         self.service_factory = service_factory
@@ -48,8 +64,11 @@ class DownloadHandler(IDownloadHandler):
         self.error_handler = error_handler
         self.notifier: INotifier = NotifierService(message_queue)
         self._initialized = False
-        # Manage download queue directly
+        # Manage download queue directly; the journal (if any) mirrors it on disk
         self._downloads: list[Download] = []
+        self._journal = journal
+        # Stop signals for queued and running downloads, keyed by Download.id
+        self._tokens: dict[str, CancellationToken] = {}
 
     def initialize(self) -> None:
         """Initialize the download handler."""
@@ -57,13 +76,24 @@ class DownloadHandler(IDownloadHandler):
             return
         self._initialized = True
 
+        if self._journal:
+            known_ids = {d.id for d in self._downloads}
+            restored = [d for d in self._journal.replay() if d.id not in known_ids]
+            self._downloads.extend(restored)
+            if restored:
+                logger.info(f"[DOWNLOAD_HANDLER] Restored {len(restored)} queued downloads")
+
     def cleanup(self) -> None:
         """Clean up resources."""
         self._initialized = False
+        if self._journal:
+            self._journal.close()
 
     def add_download(self, download: Download) -> None:
         """Add a download item."""
         self._downloads.append(download)
+        if self._journal:
+            self._journal.record_add(download)
         logger.info(f"[DOWNLOAD_HANDLER] Added download: {download.name}")
 
     def remove_downloads(self, indices: list[int]) -> None:
@@ -72,12 +102,16 @@ class DownloadHandler(IDownloadHandler):
         for index in sorted(indices, reverse=True):
             if 0 <= index < len(self._downloads):
                 removed = self._downloads.pop(index)
+                if self._journal:
+                    self._journal.record_remove(removed)
                 logger.info(f"[DOWNLOAD_HANDLER] Removed download: {removed.name}")
 
     def clear_downloads(self) -> None:
         """Clear all download items."""
         count = len(self._downloads)
         self._downloads.clear()
+        if self._journal:
+            self._journal.record_clear()
         logger.info(f"[DOWNLOAD_HANDLER] Cleared {count} downloads")
 
     def get_downloads(self) -> list[Download]:
@@ -124,13 +158,13 @@ class DownloadHandler(IDownloadHandler):
         progress_callback: Callable[[Download, float], None] | None,
     ) -> None:
         """Worker function to handle a single download."""
-        logger.info(f"[DOWNLOAD_HANDLER] Worker started for: {download.name}")
-        logger.info(f"[DOWNLOAD_HANDLER] URL: {download.url}")
-        logger.info(f"[DOWNLOAD_HANDLER] Directory: {download_dir}")
+        logger.info("[DOWNLOAD_HANDLER] Worker started for: %s", download.name)
+        logger.info("[DOWNLOAD_HANDLER] URL: %s", download.url)
+        logger.debug("[DOWNLOAD_HANDLER] Directory: %s", download_dir)
 
         try:
             # Use injected service factory (mandatory dependency)
-            logger.info(f"[DOWNLOAD_HANDLER] Using service factory: {self.service_factory}")
+            logger.debug("[DOWNLOAD_HANDLER] Using service factory: %s", self.service_factory)
 
             # Create a downloader with the download's specific options
             # Use download.service_type as primary signal (set correctly at URL detection time)
@@ -138,13 +172,11 @@ class DownloadHandler(IDownloadHandler):
             service_type = download.service_type or self.service_factory.detect_service_type(
                 download.url
             )
-            logger.info(f"[DOWNLOAD_HANDLER] Detected service type: {service_type}")
-
-            # Debug: Log all download attributes
-            logger.info(f"[DOWNLOAD_HANDLER] Download object attributes: {download.__dict__}")
-            logger.info(f"[DOWNLOAD_HANDLER] Has cookie_path: {hasattr(download, 'cookie_path')}")
-            if hasattr(download, "cookie_path"):
-                logger.info(f"[DOWNLOAD_HANDLER] cookie_path value: {download.cookie_path}")
+            logger.info("[DOWNLOAD_HANDLER] Detected service type: %s", service_type)
+            logger.debug("[DOWNLOAD_HANDLER] Download object attributes: %s", download.__dict__)
+            logger.debug(
+                "[DOWNLOAD_HANDLER] cookie_path value: %s", getattr(download, "cookie_path", None)
+            )
 
             if not (
                 downloader := self.service_factory.get_downloader(
@@ -172,13 +204,13 @@ class DownloadHandler(IDownloadHandler):
                     cookie_manager.set_cookie_file(download.cookie_path)
                     logger.info("[DOWNLOAD_HANDLER] Successfully set cookies for download")
                 except Exception as e:
-                    logger.error(f"[DOWNLOAD_HANDLER] Failed to set cookies: {e}")
+                    logger.error("[DOWNLOAD_HANDLER] Failed to set cookies: %s", e)
                     if self.error_handler:
                         self.error_handler.handle_exception(
                             e, "Setting cookies for download", "Download Handler"
                         )
 
-            logger.info(f"[DOWNLOAD_HANDLER] Downloader obtained: {type(downloader).__name__}")
+            logger.debug("[DOWNLOAD_HANDLER] Downloader obtained: %s", type(downloader).__name__)
 
             # Prepare download
             output_path = self._prepare_download_path(download, download_dir)
@@ -190,12 +222,20 @@ class DownloadHandler(IDownloadHandler):
 
             # Execute download
             logger.info("[DOWNLOAD_HANDLER] Starting download...")
-            success = downloader.download(
-                url=download.url,
-                save_path=output_path,
-                progress_callback=progress_wrapper,
-            )
-            logger.info(f"[DOWNLOAD_HANDLER] Download completed with success: {success}")
+            with get_bandwidth_scheduler().transfer(
+                download.url, service=str(service_type), limit_kbps=download.speed_limit
+            ):
+                success = downloader.download(
+                    url=download.url,
+                    save_path=output_path,
+                    progress_callback=progress_wrapper,
+                )
+            logger.info("[DOWNLOAD_HANDLER] Download completed with success: %s", success)
+
+            # Downloaders report a cancelled transfer as a plain failure
+            if (token := current_token()) and token.status:
+                self._handle_download_stopped(download, token.status)
+                return
 
             # Handle result with early return
             if not success:
@@ -203,6 +243,8 @@ class DownloadHandler(IDownloadHandler):
                 return
 
             self._handle_download_success(download)
+        except DownloadCancelledError as e:
+            self._handle_download_stopped(download, e.status)
         except Exception as e:
             error_msg = f"Download error: {e!s}"
             logger.error(
@@ -266,7 +308,7 @@ class DownloadHandler(IDownloadHandler):
             return
 
         max_workers = self.config.downloads.max_concurrent_downloads
-        active_downloads = threading.Semaphore(max_workers)
+        gate = _ConcurrencyGate(self.config, max_workers)
 
         logger.info(
             f"[DOWNLOAD_HANDLER] Starting {len(downloads)} downloads with {max_workers} concurrent workers"
@@ -278,28 +320,52 @@ class DownloadHandler(IDownloadHandler):
                     max_workers=max_workers, thread_name_prefix="DownloadWorker"
                 ) as executor:
                     futures = {}
+                    pending: list[tuple[Download, str, str]] = []
 
                     for download in downloads:
                         if not download.url or not download.url.strip():
                             logger.error(f"[DOWNLOAD_HANDLER] Invalid URL for: {download.name}")
                             continue
+                        service = str(
+                            download.service_type or self._detect_service_type(download.url)
+                        )
+                        host = (urlparse(download.url).hostname or "").lower()
+                        pending.append((download, service, host))
+                        self._tokens[download.id] = CancellationToken()
 
-                        def wrapper(d: Download) -> None:
-                            with active_downloads:
-                                if d.status != DownloadStatus.DOWNLOADING:
-                                    d.status = DownloadStatus.DOWNLOADING
-                                    logger.info(f"[DOWNLOAD_HANDLER] Starting download: {d.name}")
-
-                                try:
+                    def wrapper(
+                        d: Download, service: str, host: str, token: CancellationToken
+                    ) -> None:
+                        try:
+                            if token.status:
+                                self._handle_download_stopped(d, token.status)
+                                return
+                            if d.status != DownloadStatus.DOWNLOADING:
+                                d.status = DownloadStatus.DOWNLOADING
+                                self._journal_update(d, "status")
+                                logger.info(f"[DOWNLOAD_HANDLER] Starting download: {d.name}")
+
+                            try:
+                                with bind_token(token), bind_budget(gate.budget(service, host)):
                                     self._download_worker(d, validated_dir, progress_callback)
-                                except Exception as e:
-                                    logger.error(
-                                        f"[DOWNLOAD_HANDLER] Error in download worker for {d.name}: {e}",
-                                        exc_info=True,
-                                    )
-                                    self._handle_download_failure(d, f"Download error: {e!s}")
-
-                        future = executor.submit(wrapper, download)
+                            except Exception as e:
+                                logger.error(
+                                    f"[DOWNLOAD_HANDLER] Error in download worker for {d.name}: {e}",
+                                    exc_info=True,
+                                )
+                                self._handle_download_failure(d, f"Download error: {e!s}")
+                        finally:
+                            gate.release(service, host)
+                            if self._tokens.get(d.id) is token:
+                                del self._tokens[d.id]
+
+                    # Items for a saturated service/host wait in place while later
+                    # items for idle hosts take the free slots.
+                    while pending:
+                        download, service, host = gate.take_next(pending)
+                        future = executor.submit(
+                            wrapper, download, service, host, self._tokens[download.id]
+                        )
                         futures[future] = download
 
                     for future in as_completed(futures):
@@ -334,17 +400,24 @@ class DownloadHandler(IDownloadHandler):
         """Prepare and return the output path for download.
 
         Note: Returns path WITHOUT extension - the downloader will add the appropriate extension.
+        A download with partial files left at its previous path (restored from the journal
+        or paused) keeps that path so the downloader resumes its .part file.
         """
+        if download.output_path and self._partial_files(download.output_path):
+            return download.output_path
+
         target_dir = Path(download_dir)
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"[DOWNLOAD_HANDLER] Sanitizing filename: {download.name}")
+        logger.debug("[DOWNLOAD_HANDLER] Sanitizing filename: %s", download.name)
 
         # Use injected file service directly
         base_name = self.file_service.clean_filename(download.name or "download")
         # Don't add extension - downloader will add it
         output_path = str(target_dir / base_name)
-        logger.info(f"[DOWNLOAD_HANDLER] Output path (without extension): {output_path}")
+        logger.info("[DOWNLOAD_HANDLER] Output path (without extension): %s", output_path)
+        download.output_path = output_path
+        self._journal_update(download, "output_path")
         return output_path
 
     def _create_progress_wrapper(
@@ -366,6 +439,7 @@ class DownloadHandler(IDownloadHandler):
             if time_since_update >= update_interval or progress >= 100 or progress == 0:
                 last_update_time[0] = current_time
                 download.update_progress(progress, speed)
+                self._journal_update(download, "progress", "status")
                 progress_callback(download, progress)
 
         return progress_wrapper
@@ -378,6 +452,7 @@ class DownloadHandler(IDownloadHandler):
             if not download.completed_at:
                 download.completed_at = datetime.now()
             download.update_progress(100.0, 0.0)
+        self._journal_update(download, "status", "progress", "completed_at")
 
     def _handle_download_failure(self, download: Download, message: str) -> None:
         """Handle download failure."""
@@ -386,11 +461,43 @@ class DownloadHandler(IDownloadHandler):
         download.status = DownloadStatus.FAILED
         if not download.completed_at:
             download.completed_at = datetime.now()
+        self._journal_update(download, "status", "error_message", "completed_at")
         if self.error_handler:
             self.error_handler.handle_service_failure(
                 "Download Handler", "download", message, download.url
             )
 
+    def _handle_download_stopped(self, download: Download, status: DownloadStatus) -> None:
+        """Record a worker that unwound because of a cancel or pause request."""
+        logger.info(f"[DOWNLOAD_HANDLER] Download {status.value.lower()}: {download.name}")
+        download.status = status
+        download.speed = 0.0
+        if status == DownloadStatus.CANCELLED:
+            download.error_message = "Cancelled by user"
+            self._discard_partial_files(download)
+        self._journal_update(download, "status", "error_message")
+
+    @staticmethod
+    def _partial_files(output_path: str) -> list[str]:
+        """Resume state (.part, sidecar, .ytdl) left next to ``output_path``."""
+        return [
+            path
+            for path in glob.glob(f"{glob.escape(output_path)}.*")
+            if path.endswith((".part", ".part.json", ".ytdl"))
+        ]
+
+    def _discard_partial_files(self, download: Download) -> None:
+        """Remove the partial files of a cancelled download; paused ones keep theirs."""
+        if not download.output_path:
+            return
+        for path in self._partial_files(download.output_path):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    def _journal_update(self, download: Download, *fields: str) -> None:
+        if self._journal:
+            self._journal.record_update(download, *fields)
+
     def _invoke_completion_callback(
         self,
         callback: Callable[[bool, str | None], None] | None,
@@ -416,13 +523,53 @@ class DownloadHandler(IDownloadHandler):
     def cancel_download(self, download: Download) -> None:
         """Cancel a specific download.
 
+        A running worker stops within one chunk and frees its slot; its partial
+        files are removed.
+
         Args:
             download: The download to cancel
         """
-        if download.status in {DownloadStatus.PENDING, DownloadStatus.DOWNLOADING}:
-            download.status = DownloadStatus.FAILED
-            download.error_message = "Cancelled by user"
-            logger.info(f"[DOWNLOAD_HANDLER] Cancelled download: {download.name}")
+        if download.status not in {
+            DownloadStatus.PENDING,
+            DownloadStatus.DOWNLOADING,
+            DownloadStatus.PAUSED,
+        }:
+            return
+        if token := self._tokens.get(download.id):
+            token.cancel()
+        if download.status != DownloadStatus.DOWNLOADING:
+            self._handle_download_stopped(download, DownloadStatus.CANCELLED)
+        logger.info(f"[DOWNLOAD_HANDLER] Cancelled download: {download.name}")
+
+    def pause_download(self, download: Download) -> None:
+        """Pause a queued or running download, keeping its .part file for resume.
+
+        Args:
+            download: The download to pause
+        """
+        if download.status not in {DownloadStatus.PENDING, DownloadStatus.DOWNLOADING}:
+            return
+        if token := self._tokens.get(download.id):
+            token.pause()
+        if download.status != DownloadStatus.DOWNLOADING:
+            self._handle_download_stopped(download, DownloadStatus.PAUSED)
+        logger.info(f"[DOWNLOAD_HANDLER] Paused download: {download.name}")
+
+    def resume_download(self, download: Download) -> bool:
+        """Return a paused download to the queue; start it again to continue.
+
+        Args:
+            download: The download to resume
+
+        Returns:
+            True if the download was paused and is now pending
+        """
+        if download.status != DownloadStatus.PAUSED:
+            return False
+        download.status = DownloadStatus.PENDING
+        self._journal_update(download, "status")
+        logger.info(f"[DOWNLOAD_HANDLER] Resumed download: {download.name}")
+        return True
 
     def has_active_downloads(self) -> bool:
         """Check if there are active downloads."""
@@ -479,28 +626,89 @@ class DownloadHandler(IDownloadHandler):
 
     def _detect_service_type(self, url: str) -> ServiceType:
         """Detect service type from URL."""
-        url_lower = url.lower()
-
-        # Map service names to ServiceType enum
-        service_map = {
-            "youtube": ServiceType.YOUTUBE,
-            "twitter": ServiceType.TWITTER,
-            "instagram": ServiceType.INSTAGRAM,
-            "pinterest": ServiceType.PINTEREST,
-            "soundcloud": ServiceType.SOUNDCLOUD,
-            "tiktok": ServiceType.TIKTOK,
-            "radiojavan": ServiceType.RADIOJAVAN,
-        }
-
-        # Check service domains first
-        for service_name, domains in self.config.network.service_domains.items():
-            if any(domain in url_lower for domain in domains):
-                if (service_name_lower := service_name.lower()) in service_map:
-                    return service_map[service_name_lower]
-                try:
-                    return ServiceType(service_name_lower)
-                except ValueError:
-                    pass
+        return self.url_classifier.service_for_url(url)
 
-        # Return GENERIC for unknown URLs
-        return ServiceType.GENERIC
+    @cached_property
+    def url_classifier(self) -> UrlClassifier:
+        return UrlClassifier(self.config, handler_patterns={})
+
+
+class _ConcurrencyGate:
+    """Admits queued downloads while the global, per-service and per-host caps allow.
+
+    Caps come from ``downloads.max_concurrent_downloads`` and each service's
+    ``max_concurrent_downloads`` / ``max_downloads_per_host`` config keys.
+    """
+
+    def __init__(self, config: AppConfig, max_active: int) -> None:
+        self.config = config
+        self.max_active = max(1, max_active)
+        self._condition = threading.Condition()
+        self._active = 0
+        self._per_service: Counter[str] = Counter()
+        self._per_host: Counter[str] = Counter()
+
+    def _has_room(self, service: str, host: str) -> bool:
+        service_cap, host_cap = self.config.services.concurrency_limits(service)
+        return (not service_cap or self._per_service[service] < service_cap) and (
+            not host_cap or self._per_host[host] < host_cap
+        )
+
+    def take_next(self, pending: list[tuple[Download, str, str]]) -> tuple[Download, str, str]:
+        """Block until a pending download may start, then remove and return it.
+
+        The earliest item whose service and host have room wins, so order is kept
+        except where a saturated host would otherwise leave a slot idle.
+        """
+        with self._condition:
+            while True:
+                if self._active < self.max_active:
+                    for index, (_, service, host) in enumerate(pending):
+                        if self._has_room(service, host):
+                            self._active += 1
+                            self._per_service[service] += 1
+                            self._per_host[host] += 1
+                            return pending.pop(index)
+                self._condition.wait()
+
+    def release(self, service: str, host: str, count: int = 1) -> None:
+        with self._condition:
+            self._active -= count
+            self._per_service[service] -= count
+            self._per_host[host] -= count
+            self._condition.notify_all()
+
+    def borrow(self, service: str, host: str, wanted: int) -> int:
+        """Take up to ``wanted`` free slots for a running download's item fetches.
+
+        Item media come from CDN hosts rather than the page host, so only the
+        global and per-service caps limit what may be lent.
+        """
+        service_cap, _host_cap = self.config.services.concurrency_limits(service)
+        with self._condition:
+            free = self.max_active - self._active
+            if service_cap:
+                free = min(free, service_cap - self._per_service[service])
+            granted = max(0, min(wanted, free))
+            self._active += granted
+            self._per_service[service] += granted
+            self._per_host[host] += granted
+            return granted
+
+    def budget(self, service: str, host: str) -> "_GateBudget":
+        return _GateBudget(self, service, host)
+
+
+class _GateBudget:
+    """A worker's view of the gate, bound to its download's service and host."""
+
+    def __init__(self, gate: _ConcurrencyGate, service: str, host: str) -> None:
+        self._gate = gate
+        self._service = service
+        self._host = host
+
+    def borrow(self, wanted: int) -> int:
+        return self._gate.borrow(self._service, self._host, wanted)
+
+    def give_back(self, count: int) -> None:
+        self._gate.release(self._service, self._host, count)
@@ -7,27 +7,39 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
-from src.utils.common import ensure_gui_available, resource_path, set_windows_dpi_awareness
-from src.utils.logger import get_logger
+# Started first so the startup trace (when enabled) sees every later import.
+from src.utils.startup_trace import start_startup_trace, trace_phase
+
+startup_tracer = start_startup_trace()
+
+from src.utils.common import (  # noqa: E402
+    ensure_gui_available,
+    resource_path,
+    set_windows_dpi_awareness,
+)
+from src.utils.logger import get_logger  # noqa: E402
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 logger = get_logger(__name__)
 
 # Windows DPI awareness must be set before ANY tkinter/CTk window is created
-set_windows_dpi_awareness()
+with trace_phase("dpi_awareness"):
+    set_windows_dpi_awareness()
 
-ensure_gui_available()
+with trace_phase("gui_available"):
+    ensure_gui_available()
 from tkinter import Menu  # noqa: E402
 
-import customtkinter as ctk  # noqa: E402
+with trace_phase("ctk_theme"):
+    import customtkinter as ctk
 
-# Initialize CTK's built-in theme so ThemeManager.theme is populated.
-# This MUST happen before any CTk widget is created.
-ctk.set_default_color_theme("blue")
-ctk.set_appearance_mode("System")
-ctk.set_widget_scaling(1.0)
-ctk.set_window_scaling(1.0)
+    # Initialize CTK's built-in theme so ThemeManager.theme is populated.
+    # This MUST happen before any CTk widget is created.
+    ctk.set_default_color_theme("blue")
+    ctk.set_appearance_mode("System")
+    ctk.set_widget_scaling(1.0)
+    ctk.set_window_scaling(1.0)
 
 from src.core import get_application_orchestrator  # noqa: E402
 from src.core.config import AppConfig, get_config  # noqa: E402
@@ -178,20 +190,23 @@ class MediaDownloaderApp(ctk.CTk):
         self._queue_processor_running = True
         self.after(100, self._process_thread_queue)
 
-        application_orchestrator = cast(
-            type["ApplicationOrchestrator"],
-            get_application_orchestrator(),
-        )
-        self.orchestrator = application_orchestrator(self, config=self.config)
+        with trace_phase("orchestrator"):
+            application_orchestrator = cast(
+                type["ApplicationOrchestrator"],
+                get_application_orchestrator(),
+            )
+            self.orchestrator = application_orchestrator(self, config=self.config)
 
-        self.theme_manager = get_theme_manager(self, config=self.config)
+        with trace_phase("theme_manager"):
+            self.theme_manager = get_theme_manager(self, config=self.config)
 
         self.update()
 
-        self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self._create_ui()
-        self._setup_layout()
-        self._setup_menu()
+        with trace_phase("build_ui"):
+            self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
+            self._create_ui()
+            self._setup_layout()
+            self._setup_menu()
 
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
@@ -200,6 +215,15 @@ class MediaDownloaderApp(ctk.CTk):
         logger.info("Media Downloader initialized")
 
         self.after(100, self.orchestrator.check_connectivity)
+        if startup_tracer.enabled:
+            # Idle callbacks run after Tk's pending redraws, i.e. once the window has painted.
+            self.after_idle(self._on_first_paint)
+
+    def _on_first_paint(self) -> None:
+        if report_path := startup_tracer.finish():
+            logger.info(f"[MAIN_APP] Startup trace written to {report_path}")
+        if startup_tracer.exit_after_paint:
+            self.after(0, self._on_closing)
 
     def _process_thread_queue(self) -> None:
         if not self._queue_processor_running:
@@ -392,34 +416,38 @@ if __name__ == "__main__":
     try:
         # Step 1: Verify Playwright Python package is available
         logger.info("[MAIN_APP] Step 1/3: Checking Playwright installation...")
-        _check_playwright_installation()
+        with trace_phase("playwright_check"):
+            _check_playwright_installation()
 
         # Step 2: Ensure Chromium browser is available (non-blocking).
         # Cookie init threads will wait on _chromium_ready event before launching browsers.
         logger.info("[MAIN_APP] Step 2/3: Checking Chromium availability...")
         try:
-            from src.services.cookies.playwright_bootstrap import (
-                is_chromium_installed,
-            )
+            with trace_phase("chromium_check"):
+                from src.services.cookies.playwright_bootstrap import (
+                    is_chromium_installed,
+                )
 
-            if not is_chromium_installed():
-                logger.info("[MAIN_APP] Chromium not found - will install on first launch")
+                if not is_chromium_installed():
+                    logger.info("[MAIN_APP] Chromium not found - will install on first launch")
         except Exception as e:
             logger.warning(f"[MAIN_APP] Playwright bootstrap check skipped: {e}")
 
         # Step 2b: Verify ffmpeg is available (no download — installer handles this).
         logger.info("[MAIN_APP] Step 2b: Checking ffmpeg availability...")
         try:
-            from src.utils.ffmpeg import is_ffmpeg_available
+            with trace_phase("ffmpeg_check"):
+                from src.utils.ffmpeg import is_ffmpeg_available
 
-            if not is_ffmpeg_available():
-                logger.warning("[MAIN_APP] ffmpeg not found - video merging may not work")
+                if not is_ffmpeg_available():
+                    logger.warning("[MAIN_APP] ffmpeg not found - video merging may not work")
         except Exception as e:
             logger.warning(f"[MAIN_APP] ffmpeg check skipped: {e}")
 
         # Step 3: Create and display the main application window
         logger.info("[MAIN_APP] Step 3/3: Initializing application window...")
-        app = MediaDownloaderApp()
+        with trace_phase("main_window"):
+            app = MediaDownloaderApp()
 
         # Start Chromium install in background after window is visible
         try:
@@ -1,4 +1,5 @@
 from .base_handler import BaseHandler
+from .classifier import UrlClassification, UrlClassifier
 from .link_detector import (
     DetectionResult,
     LinkDetectionRegistry,
@@ -13,5 +14,7 @@ __all__ = [
     "LinkDetectionRegistry",
     "LinkDetector",
     "LinkHandlerInterface",
+    "UrlClassification",
+    "UrlClassifier",
     "auto_register_handler",
 ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.core.config import AppConfig, get_config
+from src.core.enums import ServiceType
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Trie key marking that the labels walked so far form a complete domain.
+_SERVICE = ""
+
+
+@dataclass(frozen=True, slots=True)
+class UrlClassification:
+    service_type: ServiceType
+    handler_name: str | None = None
+
+
+class UrlClassifier:
+    """Maps a URL to its service and link handler in one pass.
+
+    Every handler's ``get_patterns`` are joined into a single alternation with
+    one named group per handler, so one ``match`` call finds the first handler
+    (in registration order) that accepts the URL. URLs no handler accepts fall
+    back to a trie of the configured service domains, walked from the top-level
+    label down, so ``m.youtube.com`` and ``youtube.com`` resolve alike without
+    scanning every domain string.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig | None = None,
+        handler_patterns: Mapping[str, Iterable[str]] | None = None,
+    ) -> None:
+        self.config = config or get_config()
+        services = self.config.services.all_services
+
+        if handler_patterns is None:
+            handler_patterns = {
+                service["handler_class"]: service.get("url_patterns", [])
+                for service in services.values()
+                if service.get("handler_class")
+            }
+        self._handler_services = {
+            service["handler_class"]: _service_type(name)
+            for name, service in services.items()
+            if service.get("handler_class")
+        }
+
+        self._group_handlers: dict[str, str] = {}
+        self._handler_regexes: list[tuple[str, list[re.Pattern[str]]]] = []
+        alternatives = []
+        for index, (handler_name, patterns) in enumerate(handler_patterns.items()):
+            if valid := [p for p in patterns if _is_valid_pattern(handler_name, p)]:
+                group = f"h{index}"
+                self._group_handlers[group] = handler_name
+                self._handler_regexes.append((handler_name, [re.compile(p) for p in valid]))
+                alternatives.append(f"(?P<{group}>{'|'.join(f'(?:{p})' for p in valid)})")
+        try:
+            self._pattern = re.compile("|".join(alternatives)) if alternatives else None
+        except re.error as e:
+            # Patterns that cannot share one regex (clashing group names, inline
+            # flags) are matched one handler at a time instead.
+            logger.warning(f"[CLASSIFIER] Falling back to per-handler matching: {e}")
+            self._pattern = None
+
+        self._hosts: dict[str, Any] = {}
+        domain_lists: list[tuple[str, Iterable[str]]] = [
+            (name, service.get("domains", [])) for name, service in services.items()
+        ]
+        domain_lists.extend(self.config.network.service_domains.items())
+        for name, domains in domain_lists:
+            if (service_type := _service_type(name)) is not ServiceType.GENERIC:
+                for domain in domains:
+                    self._add_host(domain, service_type)
+
+    def _add_host(self, domain: str, service_type: ServiceType) -> None:
+        node = self._hosts
+        for label in reversed(domain.lower().strip(".").split(".")):
+            node = node.setdefault(label, {})
+        node.setdefault(_SERVICE, service_type)
+
+    def classify(self, url: str) -> UrlClassification:
+        """Service type and accepting handler for ``url``; GENERIC if unknown."""
+        if handler_name := self._match_handler(url):
+            service_type = self._handler_services.get(handler_name) or self.service_for_url(url)
+            return UrlClassification(service_type, handler_name)
+        return UrlClassification(self.service_for_url(url))
+
+    def _match_handler(self, url: str) -> str | None:
+        if self._pattern:
+            match = self._pattern.match(url)
+            return self._group_handlers[match.lastgroup] if match and match.lastgroup else None
+        return next(
+            (name for name, regexes in self._handler_regexes if any(r.match(url) for r in regexes)),
+            None,
+        )
+
+    def service_for_url(self, url: str) -> ServiceType:
+        """Service whose configured domain is the longest suffix of the URL's host."""
+        try:
+            host = urlsplit(url if "//" in url else f"//{url}").hostname or ""
+        except ValueError:
+            return ServiceType.GENERIC
+
+        node = self._hosts
+        found = ServiceType.GENERIC
+        for label in reversed(host.rstrip(".").split(".")):
+            if (node := node.get(label)) is None:
+                break
+            found = node.get(_SERVICE, found)
+        return found
+
+
+def _service_type(name: str) -> ServiceType:
+    try:
+        return ServiceType(name.lower())
+    except ValueError:
+        return ServiceType.GENERIC
+
+
+def _is_valid_pattern(handler_name: str, pattern: str) -> bool:
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        logger.error(f"[CLASSIFIER] Invalid regex pattern '{pattern}' for {handler_name}: {e}")
+        return False
+    return True
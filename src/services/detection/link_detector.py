@@ -1,7 +1,10 @@
+import importlib
 import re
+import threading
 from collections.abc import Callable
 from typing import ClassVar, TypeVar, cast
 
+from src.core.config import AppConfig, get_config
 from src.core.interfaces import (
     DynamicUIContextProtocol,
     HasEventCoordinatorProtocol,
@@ -11,6 +14,7 @@ from src.utils.logger import get_logger
 from src.utils.type_helpers import get_ui_context
 
 from .base_handler import BaseHandler, UICallback
+from .classifier import UrlClassification, UrlClassifier
 from .models import DetectionResult
 
 logger = get_logger(__name__)
@@ -25,6 +29,11 @@ class LinkDetectionRegistry:
     _handlers: ClassVar[dict[str, type[BaseHandler]]] = {}
     _compiled_patterns: ClassVar[dict[str, list[re.Pattern[str]]]] = {}
     _handler_factory: ClassVar[Callable[[type[BaseHandler]], BaseHandler] | None] = None
+    _handler_modules: ClassVar[dict[str, str]] = {}
+    _classifier: ClassVar[UrlClassifier | None] = None
+    _handler_instances: ClassVar[dict[str, BaseHandler]] = {}
+    _instances_factory: ClassVar[Callable[[type[BaseHandler]], BaseHandler] | None] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -39,15 +48,11 @@ class LinkDetectionRegistry:
     @classmethod
     def register(cls, handler_class: type[BaseHandler]) -> None:
         handler_name = handler_class.__name__
-        logger.info(f"[REGISTRATION] Attempting to register handler: {handler_name}")
 
         if handler_name in cls._handlers:
             logger.warning(f"[REGISTRATION] Handler {handler_name} already registered, replacing")
 
         cls._handlers[handler_name] = handler_class
-        logger.info(f"[REGISTRATION] Successfully registered handler: {handler_name}")
-        logger.info(f"[REGISTRATION] Total handlers registered: {len(cls._handlers)}")
-        logger.info(f"[REGISTRATION] Registered handlers: {list(cls._handlers.keys())}")
 
         if get_patterns := getattr(handler_class, "get_patterns", None):
             patterns = get_patterns()
@@ -58,65 +63,121 @@ class LinkDetectionRegistry:
                 except re.error as e:
                     logger.error(f"[REGISTRATION] Invalid regex pattern '{pattern}': {e}")
             cls._compiled_patterns[handler_name] = compiled
-            logger.info(f"[REGISTRATION] Compiled {len(compiled)} patterns for {handler_name}")
+            logger.debug(f"[REGISTRATION] Compiled {len(compiled)} patterns for {handler_name}")
         else:
             logger.warning(f"[REGISTRATION] Handler {handler_name} has no get_patterns method")
 
+        with cls._lock:
+            cls._classifier = None
+            cls._handler_instances.pop(handler_name, None)
+        logger.info(
+            f"[REGISTRATION] Registered handler {handler_name} ({len(cls._handlers)} total)"
+        )
+
     @classmethod
-    def detect_handler(cls, url: str) -> BaseHandler | None:
-        logger.info(f"[DETECTION] Starting URL detection for: {url}")
-        logger.info(f"[DETECTION] Available handlers: {list(cls._handlers.keys())}")
+    def register_manifest(cls, config: AppConfig | None = None) -> None:
+        """Register every configured handler by its URL patterns, without importing it.
+
+        Each ``services.<name>`` entry names a ``handler_module`` and
+        ``handler_class``; the module is imported the first time a URL for that
+        handler is detected.
+        """
+        config = config or get_config()
+        for service in config.services.all_services.values():
+            handler_name = service.get("handler_class")
+            module_path = service.get("handler_module")
+            if not handler_name or not module_path or handler_name in cls._handlers:
+                continue
+
+            compiled = []
+            for pattern in service.get("url_patterns", []):
+                try:
+                    compiled.append(re.compile(pattern))
+                except re.error as e:
+                    logger.error(f"[REGISTRATION] Invalid regex pattern '{pattern}': {e}")
+            cls._compiled_patterns[handler_name] = compiled
+            cls._handler_modules[handler_name] = module_path
 
-        best_handler = None
-        best_confidence = 0.0
+        with cls._lock:
+            cls._classifier = None
+        logger.debug(f"[REGISTRATION] Handler manifest: {list(cls._handler_modules)}")
 
-        for handler_name, handler_class in cls._handlers.items():
-            try:
-                logger.debug(f"[DETECTION] Testing handler: {handler_name}")
+    @classmethod
+    def classifier(cls) -> UrlClassifier:
+        """The compiled classifier for the registered handlers, rebuilt after changes."""
+        with cls._lock:
+            if cls._classifier is None:
+                cls._classifier = UrlClassifier(
+                    handler_patterns={
+                        name: [pattern.pattern for pattern in patterns]
+                        for name, patterns in cls._compiled_patterns.items()
+                        if name in cls._handlers or name in cls._handler_modules
+                    }
+                )
+            return cls._classifier
 
+    @classmethod
+    def classify(cls, url: str) -> UrlClassification:
+        """Service type and accepting handler name for ``url`` in one regex pass."""
+        return cls.classifier().classify(url)
+
+    @classmethod
+    def _get_handler(cls, handler_name: str) -> BaseHandler:
+        """Shared handler instance, recreated when the handler factory changes."""
+        if handler_name not in cls._handlers:
+            # Importing the module registers the class through auto_register_handler.
+            importlib.import_module(cls._handler_modules[handler_name])
+            logger.info("[REGISTRY] Loaded handler module for %s", handler_name)
+
+        with cls._lock:
+            if cls._instances_factory is not cls._handler_factory:
+                cls._handler_instances.clear()
+                cls._instances_factory = cls._handler_factory
+            if (handler := cls._handler_instances.get(handler_name)) is None:
+                handler_class = cls._handlers[handler_name]
                 if cls._handler_factory:
                     handler = cls._handler_factory(handler_class)
                 else:
                     handler = cast(Callable[[], BaseHandler], handler_class)()
+                cls._handler_instances[handler_name] = handler
+            return handler
 
-                logger.debug(f"[DETECTION] Created handler instance: {handler}")
-                result = handler.can_handle(url)
-                logger.debug(
-                    f"[DETECTION] Handler {handler_name} result: confidence={result.confidence}, service_type={result.service_type}"
-                )
+    @classmethod
+    def detect_handler(cls, url: str) -> BaseHandler | None:
+        classification = cls.classify(url)
+        if not (handler_name := classification.handler_name):
+            logger.debug("[DETECTION] No handler accepts URL: %s", url)
+            return None
 
-                if result.confidence > best_confidence:
-                    best_confidence = result.confidence
-                    best_handler = handler
-                    logger.info(
-                        f"[DETECTION] New best handler: {handler_name} with confidence {best_confidence}"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"[DETECTION] Error testing handler {handler_name}: {e}",
-                    exc_info=True,
-                )
+        try:
+            handler = cls._get_handler(handler_name)
+        except Exception as e:
+            logger.error(
+                "[DETECTION] Error creating handler %s: %s", handler_name, e, exc_info=True
+            )
+            return None
 
-        logger.info(
-            f"[DETECTION] Detection complete. Best handler: {best_handler.__class__.__name__ if best_handler else 'None'} with confidence {best_confidence}"
+        logger.debug(
+            "[DETECTION] %s -> %s (%s)", url, handler_name, classification.service_type.value
         )
-        return best_handler if best_confidence > 0.5 else None
+        return handler
 
     @classmethod
     def quick_detect(cls, url: str) -> str | None:
-        for handler_name, patterns in cls._compiled_patterns.items():
-            if any(pattern.match(url) for pattern in patterns):
-                return handler_name
-        return None
+        return cls.classify(url).handler_name
 
     @classmethod
     def get_registered_handlers(cls) -> list[str]:
-        return list(cls._handlers.keys())
+        return list(dict.fromkeys([*cls._handlers, *cls._handler_modules]))
 
     @classmethod
     def clear(cls) -> None:
         cls._handlers.clear()
         cls._compiled_patterns.clear()
+        cls._handler_modules.clear()
+        with cls._lock:
+            cls._classifier = None
+            cls._handler_instances.clear()
 
 
 class LinkDetector:
@@ -136,13 +197,13 @@ class LinkDetector:
         | HasEventCoordinatorProtocol
         | None = None,
     ) -> bool:
-        logger.info(f"[LINK_DETECTOR] Starting detect_and_handle for URL: {url}")
+        logger.debug("[LINK_DETECTOR] Starting detect_and_handle for URL: %s", url)
 
         if not (handler := self.registry.detect_handler(url)):
-            logger.warning(f"[LINK_DETECTOR] No handler found for URL: {url}")
+            logger.warning("[LINK_DETECTOR] No handler found for URL: %s", url)
             return False
 
-        logger.info(f"[LINK_DETECTOR] Detected handler: {handler.__class__.__name__}")
+        logger.info("[LINK_DETECTOR] Detected handler: %s", type(handler).__name__)
 
         try:
             if not (callback := cast(UICallback | None, handler.get_ui_callback())):
@@ -159,9 +220,9 @@ class LinkDetector:
                 logger.warning("[LINK_DETECTOR] Invalid ui_context")
                 return False
 
-            logger.info(f"[LINK_DETECTOR] Executing callback with URL: {url}")
+            logger.debug("[LINK_DETECTOR] Executing callback with URL: %s", url)
             callback(url, resolved_context)
-            logger.info("[LINK_DETECTOR] Callback executed successfully")
+            logger.debug("[LINK_DETECTOR] Callback executed successfully")
             return True
         except Exception as e:
             logger.error(
@@ -180,10 +241,8 @@ class LinkDetector:
 
 
 def auto_register_handler(handler_class: THandlerClass) -> THandlerClass:
-    logger.info(f"[DECORATOR] Auto-registering handler: {handler_class.__name__}")
     try:
         LinkDetectionRegistry.register(handler_class)
-        logger.info(f"[DECORATOR] Successfully auto-registered handler: {handler_class.__name__}")
     except Exception as e:
         logger.error(
             f"[DECORATOR] Failed to auto-register handler {handler_class.__name__}: {e}",
@@ -0,0 +1,25 @@
+from .cancellation import (
+    CancellationToken,
+    DownloadCancelledError,
+    bind_token,
+    cancellation_requested,
+    current_token,
+    raise_if_cancelled,
+    ytdlp_cancel_hook,
+)
+from .fanout import bind_budget, fetch_concurrently, split_progress
+from .journal import DownloadJournal
+
+__all__ = [
+    "CancellationToken",
+    "DownloadCancelledError",
+    "DownloadJournal",
+    "bind_budget",
+    "bind_token",
+    "cancellation_requested",
+    "current_token",
+    "fetch_concurrently",
+    "raise_if_cancelled",
+    "split_progress",
+    "ytdlp_cancel_hook",
+]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from src.core.enums.download_status import DownloadStatus
+
+
+class DownloadCancelledError(Exception):
+    """Raised inside a worker once its download has been cancelled or paused."""
+
+    def __init__(self, status: DownloadStatus) -> None:
+        super().__init__(f"Download {status.value.lower()}")
+        self.status = status
+
+
+class CancellationToken:
+    """Cooperative stop signal shared by a download's worker and the UI thread.
+
+    ``cancel()`` and ``pause()`` only set a flag; chunk loops, yt-dlp hooks and the
+    ffmpeg runner poll it and unwind by raising :class:`DownloadCancelledError`. Pausing
+    keeps the ``.part`` file so the next run resumes it with a Range request.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._status: DownloadStatus | None = None
+
+    @property
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def status(self) -> DownloadStatus | None:
+        """CANCELLED or PAUSED once a stop was requested, else None."""
+        return self._status
+
+    def cancel(self) -> None:
+        self._status = DownloadStatus.CANCELLED
+        self._event.set()
+
+    def pause(self) -> None:
+        # Cancelling wins over a later pause request.
+        if self._status != DownloadStatus.CANCELLED:
+            self._status = DownloadStatus.PAUSED
+        self._event.set()
+
+    def raise_if_set(self) -> None:
+        if self._event.is_set():
+            raise DownloadCancelledError(self._status or DownloadStatus.CANCELLED)
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep up to ``seconds``; returns True if woken early by a stop request."""
+        return self._event.wait(seconds)
+
+
+_current_token: ContextVar[CancellationToken | None] = ContextVar(
+    "current_cancellation_token", default=None
+)
+
+
+def current_token() -> CancellationToken | None:
+    """Token of the download running on this thread, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def bind_token(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make ``token`` visible to code running on this thread for the block."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def raise_if_cancelled(token: CancellationToken | None = None) -> None:
+    """Raise :class:`DownloadCancelledError` if ``token`` (default: this thread's) is set."""
+    if (token := token or _current_token.get()) is not None:
+        token.raise_if_set()
+
+
+def cancellation_requested() -> bool:
+    """Whether the download running on this thread has been asked to stop."""
+    token = _current_token.get()
+    return token is not None and token.is_set
+
+
+def ytdlp_cancel_hook() -> Callable[[dict[str, Any]], None]:
+    """yt-dlp progress/postprocessor hook that aborts once the current token is set."""
+    token = current_token()
+
+    def hook(_d: dict[str, Any]) -> None:
+        raise_if_cancelled(token)
+
+    return hook
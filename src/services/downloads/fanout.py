@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Protocol, TypeVar
+
+from src.core.config import AppConfig, get_config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ProgressCallback = Callable[[float, float], None]
+
+
+class FanoutBudget(Protocol):
+    """Spare download slots a worker may borrow for fetching its items in parallel."""
+
+    def borrow(self, wanted: int) -> int:
+        """Take up to ``wanted`` extra slots without blocking; returns how many."""
+        ...
+
+    def give_back(self, count: int) -> None:
+        """Return slots taken with :meth:`borrow`."""
+        ...
+
+
+_current_budget: ContextVar[FanoutBudget | None] = ContextVar("current_fanout_budget", default=None)
+
+
+@contextmanager
+def bind_budget(budget: FanoutBudget) -> Iterator[FanoutBudget]:
+    """Let code on this thread borrow extra slots from ``budget`` for the block."""
+    reset = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(reset)
+
+
+def fetch_concurrently(
+    items: Sequence[T],
+    fetch: Callable[[T], R],
+    config: AppConfig | None = None,
+) -> list[R]:
+    """Run ``fetch`` over the items of one download on a bounded sub-pool.
+
+    The pool is at most ``downloads.item_concurrency`` wide. Inside a download
+    handler worker, every thread beyond the worker's own slot is borrowed from the
+    handler's concurrency gate, so a carousel never pushes the process past
+    ``downloads.max_concurrent_downloads``; with no spare slots the items run one
+    after another. Each task runs in a copy of the caller's context, so the
+    cancellation token and bandwidth tag follow it into the pool.
+
+    Returns:
+        Results in item order. An exception raised by ``fetch`` is re-raised once
+        every item has finished.
+    """
+    if len(items) <= 1:
+        return [fetch(item) for item in items]
+
+    config = config or get_config()
+    wanted = min(len(items), max(1, config.downloads.item_concurrency)) - 1
+    budget = _current_budget.get()
+    extra = budget.borrow(wanted) if budget and wanted else wanted
+
+    try:
+        if not extra:
+            return [fetch(item) for item in items]
+        with ThreadPoolExecutor(max_workers=extra + 1, thread_name_prefix="DownloadItem") as pool:
+            futures = [pool.submit(contextvars.copy_context().run, fetch, item) for item in items]
+            return [future.result() for future in futures]
+    finally:
+        if budget and extra:
+            budget.give_back(extra)
+
+
+def split_progress(
+    progress_callback: ProgressCallback | None, count: int
+) -> list[ProgressCallback | None]:
+    """Per-item callbacks that report the items' combined progress to the parent.
+
+    The parent sees the mean of the items' percentages and the sum of their
+    speeds, so items finishing out of order never move its progress backwards.
+    """
+    if progress_callback is None or count <= 1:
+        return [progress_callback] * count
+
+    lock = threading.Lock()
+    progress = [0.0] * count
+    speeds = [0.0] * count
+
+    def item_callback(index: int) -> ProgressCallback:
+        def report(item_progress: float, speed: float) -> None:
+            with lock:
+                progress[index] = max(progress[index], min(100.0, item_progress))
+                speeds[index] = 0.0 if progress[index] >= 100.0 else speed
+                progress_callback(sum(progress) / count, sum(speeds))
+
+        return report
+
+    return [item_callback(index) for index in range(count)]
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.core.config import AppConfig, get_config
+from src.core.enums.download_status import DownloadStatus
+from src.core.models import Download
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Statuses that still have work left; everything else is dropped on replay.
+_RESUMABLE_STATUSES = {DownloadStatus.PENDING, DownloadStatus.DOWNLOADING, DownloadStatus.PAUSED}
+
+
+class DownloadJournal:
+    """Append-only JSONL log of the download queue that survives crashes.
+
+    Each line is one operation: ``add`` (full snapshot), ``update`` (changed fields),
+    ``remove`` or ``clear``. Records are buffered and written by a background flusher
+    every ``downloads.journal_flush_interval`` seconds; consecutive updates for the
+    same download are merged in the buffer, so progress reports cost one line per
+    flush rather than one fsync each. Once the log holds more than
+    ``downloads.journal_compact_threshold`` lines it is rewritten with one ``add``
+    per live download.
+    """
+
+    def __init__(self, path: Path | None = None, config: AppConfig | None = None) -> None:
+        self.config = config or get_config()
+        self.path = Path(path or self.config.paths.queue_journal_file)
+        self._lock = threading.Lock()
+        self._buffer: list[dict[str, Any]] = []
+        self._live: dict[str, dict[str, Any]] = {}
+        self._line_count = 0
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+
+    # Replay
+
+    def replay(self) -> list[Download]:
+        """Rebuild unfinished downloads from the log and compact it.
+
+        Downloads that were running when the process died come back as PENDING with
+        their last progress; their ``.part`` files let the downloaders resume.
+        """
+        live: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply(live, json.loads(line))
+                    except (ValueError, KeyError, TypeError) as e:
+                        # A torn final line is expected after a crash mid-write.
+                        logger.warning(f"[DOWNLOAD_JOURNAL] Skipping bad record {line_number}: {e}")
+
+        restored: list[Download] = []
+        for download_id, snapshot in list(live.items()):
+            try:
+                download = Download.model_validate(snapshot)
+            except Exception as e:
+                logger.warning(
+                    f"[DOWNLOAD_JOURNAL] Dropping unreadable download {download_id}: {e}"
+                )
+                del live[download_id]
+                continue
+            if download.status not in _RESUMABLE_STATUSES:
+                del live[download_id]
+                continue
+            download.status = DownloadStatus.PENDING
+            download.speed = 0.0
+            live[download_id] = self._snapshot(download)
+            restored.append(download)
+
+        with self._lock:
+            self._live = live
+            self._buffer.clear()
+            if self.path.exists():
+                self._compact_locked()
+
+        logger.info(f"[DOWNLOAD_JOURNAL] Restored {len(restored)} unfinished downloads")
+        return restored
+
+    @staticmethod
+    def _apply(live: dict[str, dict[str, Any]], record: dict[str, Any]) -> None:
+        op = record["op"]
+        if op == "add":
+            live[record["id"]] = dict(record["download"])
+        elif op == "update":
+            if (snapshot := live.get(record["id"])) is not None:
+                snapshot.update(record["fields"])
+        elif op == "remove":
+            live.pop(record["id"], None)
+        elif op == "clear":
+            live.clear()
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    @staticmethod
+    def _snapshot(download: Download) -> dict[str, Any]:
+        return download.model_dump(mode="json")
+
+    # Recording
+
+    def record_add(self, download: Download) -> None:
+        self._append({"op": "add", "id": download.id, "download": self._snapshot(download)})
+
+    def record_update(self, download: Download, *fields: str) -> None:
+        """Record the current values of ``fields`` on ``download``."""
+        dumped = download.model_dump(mode="json", include=set(fields))
+        self._append({"op": "update", "id": download.id, "fields": dumped})
+
+    def record_remove(self, download: Download) -> None:
+        self._append({"op": "remove", "id": download.id})
+
+    def record_clear(self) -> None:
+        self._append({"op": "clear"})
+
+    def _append(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            with contextlib.suppress(KeyError):
+                self._apply(self._live, record)
+            last = self._buffer[-1] if self._buffer else None
+            if (
+                record["op"] == "update"
+                and last is not None
+                and last["op"] in {"add", "update"}
+                and last["id"] == record["id"]
+            ):
+                target = last["download"] if last["op"] == "add" else last["fields"]
+                target.update(record["fields"])
+            else:
+                self._buffer.append(record)
+            self._ensure_flusher_locked()
+        self._wakeup.set()
+
+    # Writing
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._flush_loop, daemon=True, name="DownloadJournalFlusher"
+            )
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        interval = self.config.downloads.journal_flush_interval
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._closed:
+                return
+            # Let the burst that woke us accumulate before paying for an fsync.
+            time.sleep(interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to disk and fsync them."""
+        with self._lock:
+            if not self._buffer:
+                return
+            records, self._buffer = self._buffer, []
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(json.dumps(record) + "\n" for record in records)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._line_count += len(records)
+            except OSError as e:
+                logger.error(f"[DOWNLOAD_JOURNAL] Failed to write {self.path}: {e}")
+                return
+
+            if self._line_count > self.config.downloads.journal_compact_threshold:
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Rewrite the log as one ``add`` per live download (caller holds the lock)."""
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for download_id, snapshot in self._live.items():
+                    record = {"op": "add", "id": download_id, "download": snapshot}
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._line_count = len(self._live)
+        except OSError as e:
+            logger.error(f"[DOWNLOAD_JOURNAL] Failed to compact {self.path}: {e}")
+
+    def close(self) -> None:
+        """Flush outstanding records and stop the background flusher."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
@@ -1,9 +1,13 @@
 from .event_bus import DownloadEvent, DownloadEventBus, EventBus
 from .queue import MessageQueue
+from .scheduler import DrainScheduler, ThreadDrainScheduler, TkDrainScheduler
 
 __all__ = [
     "DownloadEvent",
     "DownloadEventBus",
+    "DrainScheduler",
     "EventBus",
     "MessageQueue",
+    "ThreadDrainScheduler",
+    "TkDrainScheduler",
 ]
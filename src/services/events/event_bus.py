@@ -1,17 +1,20 @@
-import contextlib
-import queue
 import threading
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Hashable
 from enum import Enum
 from typing import Generic, Literal, Protocol, TypeVar
 
 from src.core.enums.events import DownloadEvent
 from src.utils.logger import get_logger
 
+from .scheduler import DrainScheduler, TkDrainScheduler
+
 logger = get_logger(__name__)
 
 EventType = TypeVar("EventType", bound=Enum)
 
+CoalesceKey = Callable[[EventType, dict[str, object]], Hashable | None]
+
 
 class _EventLoopRoot(Protocol):
     def after(
@@ -20,36 +23,77 @@ class _EventLoopRoot(Protocol):
         func: Callable[..., object],
         *args: object,
     ) -> str: ...
+    def after_idle(self, func: Callable[..., object], *args: object) -> str: ...
+    def after_cancel(self, id: str) -> None: ...
     def update(self) -> None: ...
 
 
+class _PendingEvent(Generic[EventType]):
+    """Queue slot whose payload can be replaced until it is drained."""
+
+    __slots__ = ("event", "key", "kwargs")
+
+    def __init__(self, event: EventType, kwargs: dict[str, object], key: Hashable | None) -> None:
+        self.event = event
+        self.kwargs = kwargs
+        self.key = key
+
+
 class EventBus(Generic[EventType]):
     """Generic thread-safe event bus using queue-based dispatch.
 
     Works with any Enum type for events. All threading logic is handled
     internally with queue-based processing on the main thread.
+
+    When a ``coalesce_key`` is given, an event for which it returns a key
+    replaces the payload of a still-queued event with the same key instead of
+    being queued again. Any event without a key acts as a barrier, so a
+    coalesced event is never reordered across it.
+
+    Draining is event-driven: ``publish`` wakes the ``scheduler``, which by
+    default is a :class:`TkDrainScheduler` on ``root``. Pass a
+    :class:`ThreadDrainScheduler` to dispatch on a worker thread when no Tk
+    root exists.
     """
 
-    def __init__(self, event_enum: type[EventType], root: _EventLoopRoot | None = None) -> None:
+    def __init__(
+        self,
+        event_enum: type[EventType],
+        root: _EventLoopRoot | None = None,
+        coalesce_key: CoalesceKey[EventType] | None = None,
+        max_events_per_drain: int | None = None,
+        scheduler: DrainScheduler | None = None,
+    ) -> None:
         """Initialize event bus with event enum type.
 
         Args:
             event_enum: The Enum class that defines event types
             root: Optional root window for main thread processing
+            coalesce_key: Optional function returning a key for events that may
+                be superseded by a later event with the same key
+            max_events_per_drain: Optional cap on events dispatched per drain
+                cycle; remaining events are handled on the next cycle
+            scheduler: Optional drain scheduler; defaults to scheduling on root
         """
         self._event_enum = event_enum
         self._listeners: dict[EventType, list[Callable[..., None]]] = {
             event: [] for event in event_enum
         }
-        self._event_queue: queue.Queue = queue.Queue()
+        self._event_queue: deque[_PendingEvent[EventType]] = deque()
+        self._pending_by_key: dict[Hashable, _PendingEvent[EventType]] = {}
+        self._queue_lock = threading.Lock()
+        self._coalesce_key = coalesce_key
+        self._max_events_per_drain = max_events_per_drain
+        self._coalesced_count = 0
         self._root = root
+        self._scheduler = scheduler or (TkDrainScheduler(root) if root else None)
         self._processing = False
         self._lock = threading.Lock()
 
         logger.info(f"[EVENT_BUS] Initialized with root: {root is not None}")
 
-        if self._root:
-            logger.info("[EVENT_BUS] Root provided, starting event processing")
+        if self._scheduler:
+            logger.info("[EVENT_BUS] Scheduler available, starting event processing")
             self._start_processing()
         else:
             logger.warning("[EVENT_BUS] No root provided - event processing NOT started")
@@ -58,6 +102,16 @@ class EventBus(Generic[EventType]):
         """Set the root window and start processing."""
         logger.info(f"[EVENT_BUS] set_root called, processing: {self._processing}")
         self._root = root
+        if not self._processing:
+            self._scheduler = TkDrainScheduler(root)
+        self._start_processing()
+
+    def set_scheduler(self, scheduler: DrainScheduler) -> None:
+        """Replace the drain scheduler, restarting processing on it."""
+        if self._scheduler and self._processing:
+            self._scheduler.stop()
+            self._processing = False
+        self._scheduler = scheduler
         self._start_processing()
 
     def subscribe(self, event: EventType, callback: Callable[..., None]) -> None:
@@ -79,14 +133,51 @@ class EventBus(Generic[EventType]):
 
     def publish(self, event: EventType, **kwargs: object) -> None:
         """Publish an event - adds to queue for processing on main thread."""
-        self._event_queue.put((event, kwargs))
-        logger.debug(
-            f"[EVENT_BUS] Event {event.name} queued, queue size: {self._event_queue.qsize()}"
-        )
+        key = self._coalesce_key(event, kwargs) if self._coalesce_key else None
+
+        with self._queue_lock:
+            if key is None:
+                self._pending_by_key.clear()
+            elif (pending := self._pending_by_key.get(key)) is not None:
+                pending.kwargs = kwargs
+                self._coalesced_count += 1
+                return
+
+            pending = _PendingEvent(event, kwargs, key)
+            if key is not None:
+                self._pending_by_key[key] = pending
+            self._event_queue.append(pending)
+
+        if self._processing and self._scheduler:
+            self._scheduler.wake()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events waiting to be dispatched."""
+        with self._queue_lock:
+            return len(self._event_queue)
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of events dropped because a newer event superseded them."""
+        with self._queue_lock:
+            return self._coalesced_count
+
+    def _take_pending(self) -> list[_PendingEvent[EventType]]:
+        """Remove the next batch of events from the queue."""
+        with self._queue_lock:
+            limit = self._max_events_per_drain or len(self._event_queue)
+            batch = []
+            while self._event_queue and len(batch) < limit:
+                pending = self._event_queue.popleft()
+                if pending.key is not None and self._pending_by_key.get(pending.key) is pending:
+                    del self._pending_by_key[pending.key]
+                batch.append(pending)
+            return batch
 
     def _start_processing(self) -> None:
-        """Start processing events on main thread."""
-        if not self._root:
+        """Start processing events on the scheduler."""
+        if not self._scheduler:
             logger.warning("[EVENT_BUS] Cannot start processing - no root window")
             return
 
@@ -94,43 +185,27 @@ class EventBus(Generic[EventType]):
             logger.debug("[EVENT_BUS] Processing already started, skipping")
             return
 
-        logger.info("[EVENT_BUS] Starting event processing loop")
+        logger.info("[EVENT_BUS] Starting event processing")
         self._processing = True
-        self._process_events()
-
-    def _process_events(self) -> None:
-        """Process all queued events on main thread."""
-        if not self._root:
-            logger.error("[EVENT_BUS] _process_events called without root!")
-            return
+        self._scheduler.start(self._process_events)
 
+    def _process_events(self) -> bool:
+        """Process one batch of queued events; returns True if more remain."""
+        remaining = 0
         try:
-            events_processed = 0
-            queue_size = self._event_queue.qsize()
-
-            while not self._event_queue.empty():
-                try:
-                    event, kwargs = self._event_queue.get_nowait()
-                    self._dispatch_event(event, kwargs)
-                    events_processed += 1
-                except queue.Empty:
-                    break
-
-            if events_processed > 0:
-                logger.info(
-                    f"[EVENT_BUS] Processed {events_processed} events (queue was {queue_size})"
+            batch = self._take_pending()
+            for pending in batch:
+                self._dispatch_event(pending.event, pending.kwargs)
+
+            if batch:
+                remaining = self.pending_count
+                logger.debug(
+                    "[EVENT_BUS] Processed %d events, %d still queued", len(batch), remaining
                 )
-            elif queue_size > 0:
-                logger.warning(f"[EVENT_BUS] Queue had {queue_size} items but processed 0")
 
         except Exception as e:
             logger.error(f"[EVENT_BUS] Error processing events: {e}", exc_info=True)
-        finally:
-            if self._processing:
-                with contextlib.suppress(Exception):
-                    self._root.after(50, self._process_events)
-            else:
-                logger.warning("[EVENT_BUS] Processing stopped, not scheduling next cycle")
+        return self._processing and remaining > 0
 
     def _dispatch_event(self, event: EventType, kwargs: dict[str, object]) -> None:
         """Dispatch event to all subscribers."""
@@ -138,28 +213,29 @@ class EventBus(Generic[EventType]):
             listeners = self._listeners.get(event, []).copy()
 
         if not listeners:
-            logger.warning(f"[EVENT_BUS] No listeners registered for {event.name}!")
+            logger.warning("[EVENT_BUS] No listeners registered for %s!", event.name)
             return
 
-        logger.info(f"[EVENT_BUS] Dispatching {event.name} to {len(listeners)} listeners")
+        logger.debug("[EVENT_BUS] Dispatching %s to %d listeners", event.name, len(listeners))
 
-        for i, callback in enumerate(listeners):
+        for i, callback in enumerate(listeners, 1):
             try:
                 logger.debug(
-                    f"[EVENT_BUS] Calling listener {i + 1}/{len(listeners)} for {event.name}"
+                    "[EVENT_BUS] Calling listener %d/%d for %s", i, len(listeners), event.name
                 )
                 callback(**kwargs)
-                logger.debug(f"[EVENT_BUS] Listener {i + 1} completed successfully")
+                logger.debug("[EVENT_BUS] Listener %d completed successfully", i)
             except Exception as e:
                 logger.error(
-                    f"[EVENT_BUS] Error in {event.name} callback {i + 1}: {e}",
-                    exc_info=True,
+                    "[EVENT_BUS] Error in %s callback %d: %s", event.name, i, e, exc_info=True
                 )
 
     def stop_processing(self) -> None:
         """Stop processing events."""
         logger.info("[EVENT_BUS] Stopping event processing")
         self._processing = False
+        if self._scheduler:
+            self._scheduler.stop()
 
     def clear(self) -> None:
         """Clear all subscriptions and queued events."""
@@ -167,18 +243,42 @@ class EventBus(Generic[EventType]):
             for event in self._event_enum:
                 self._listeners[event].clear()
 
-        while not self._event_queue.empty():
-            try:
-                self._event_queue.get_nowait()
-            except queue.Empty:
-                break
+        with self._queue_lock:
+            self._event_queue.clear()
+            self._pending_by_key.clear()
 
         logger.info("[EVENT_BUS] Cleared all listeners and queued events")
 
 
+def _download_progress_key(event: DownloadEvent, kwargs: dict[str, object]) -> Hashable | None:
+    """Coalesce PROGRESS events per download; every other event keeps its place."""
+    if event != DownloadEvent.PROGRESS:
+        return None
+    download = kwargs.get("download")
+    return getattr(download, "id", None) or id(download)
+
+
 class DownloadEventBus(EventBus[DownloadEvent]):
-    """Thread-safe event bus for download events - backward compatibility wrapper."""
+    """Thread-safe event bus for download events.
+
+    Only the latest PROGRESS event per download is kept between drain cycles,
+    and each cycle dispatches at most ``max_events_per_drain`` events so a
+    burst of updates cannot stall the UI thread.
+    """
 
-    def __init__(self, root: _EventLoopRoot | None = None) -> None:
+    MAX_EVENTS_PER_DRAIN = 200
+
+    def __init__(
+        self,
+        root: _EventLoopRoot | None = None,
+        max_events_per_drain: int | None = MAX_EVENTS_PER_DRAIN,
+        scheduler: DrainScheduler | None = None,
+    ) -> None:
         """Initialize download event bus."""
-        super().__init__(DownloadEvent, root)
+        super().__init__(
+            DownloadEvent,
+            root,
+            coalesce_key=_download_progress_key,
+            max_events_per_drain=max_events_per_drain,
+            scheduler=scheduler,
+        )
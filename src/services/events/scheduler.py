@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Literal, Protocol
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# A drain callback processes one batch and returns True while work remains.
+DrainCallback = Callable[[], bool]
+
+
+class _TkRoot(Protocol):
+    def after(
+        self,
+        ms: int | Literal["idle"],
+        func: Callable[..., object],
+        *args: object,
+    ) -> str: ...
+    def after_idle(self, func: Callable[..., object], *args: object) -> str: ...
+    def after_cancel(self, id: str) -> None: ...
+
+
+class DrainScheduler(ABC):
+    """Decides when a queue's drain callback runs.
+
+    Producers call :meth:`wake` after enqueueing; the scheduler runs the drain
+    callback on its own thread of control until the callback reports that the
+    queue is empty.
+    """
+
+    @abstractmethod
+    def start(self, drain: DrainCallback) -> None:
+        """Begin scheduling ``drain``."""
+
+    @abstractmethod
+    def wake(self) -> None:
+        """Request a drain soon. Safe to call from any thread."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop scheduling; pending work is left in the queue."""
+
+    @property
+    @abstractmethod
+    def running(self) -> bool:
+        """Whether the scheduler has been started and not stopped."""
+
+
+class TkDrainScheduler(DrainScheduler):
+    """Runs drains on the Tk main loop.
+
+    A wakeup is marshalled onto Tk with ``after_idle`` and collapses with any
+    wakeup that is already pending. While a drain leaves a backlog the next batch
+    runs on the following idle turn, so input and redraws interleave with it.
+    Once the queue is empty a fallback check runs with a delay that doubles up
+    to ``max_idle_ms``, covering wakeups that could not be marshalled.
+    """
+
+    def __init__(self, root: _TkRoot, min_idle_ms: int = 50, max_idle_ms: int = 1000) -> None:
+        self._root = root
+        self._min_idle_ms = min_idle_ms
+        self._max_idle_ms = max_idle_ms
+        self._idle_ms = min_idle_ms
+        self._drain: DrainCallback | None = None
+        self._lock = threading.Lock()
+        self._wake_pending = False
+        self._fallback_id: str | None = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, drain: DrainCallback) -> None:
+        self._drain = drain
+        self._running = True
+        self._run()
+
+    def wake(self) -> None:
+        if not self._running:
+            return
+        with self._lock:
+            self._idle_ms = self._min_idle_ms
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            self._root.after_idle(self._run)
+        except Exception as e:
+            # The fallback check picks the work up on its next turn.
+            with self._lock:
+                self._wake_pending = False
+            logger.debug(f"[DRAIN_SCHEDULER] Could not marshal wakeup onto Tk: {e}")
+
+    def stop(self) -> None:
+        self._running = False
+        self._cancel_fallback()
+
+    def _run(self) -> None:
+        with self._lock:
+            self._wake_pending = False
+        if not self._running or self._drain is None:
+            return
+
+        backlog = False
+        try:
+            backlog = self._drain()
+        except Exception as e:
+            logger.error(f"[DRAIN_SCHEDULER] Drain failed: {e}", exc_info=True)
+
+        if not self._running:
+            return
+        if backlog:
+            self.wake()
+            return
+        self._schedule_fallback()
+
+    def _schedule_fallback(self) -> None:
+        self._cancel_fallback()
+        with self._lock:
+            delay = self._idle_ms
+            self._idle_ms = min(self._idle_ms * 2, self._max_idle_ms)
+        with contextlib.suppress(Exception):
+            self._fallback_id = self._root.after(delay, self._run)
+
+    def _cancel_fallback(self) -> None:
+        if self._fallback_id is not None:
+            with contextlib.suppress(Exception):
+                self._root.after_cancel(self._fallback_id)
+            self._fallback_id = None
+
+
+class ThreadDrainScheduler(DrainScheduler):
+    """Runs drains on a dedicated daemon thread, for headless use without Tk."""
+
+    def __init__(self, idle_timeout: float = 1.0, name: str = "event-drain") -> None:
+        self._idle_timeout = idle_timeout
+        self._name = name
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._drain: DrainCallback | None = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, drain: DrainCallback) -> None:
+        self._drain = drain
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name=self._name, daemon=True)
+        self._thread.start()
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self._idle_timeout)
+
+    def _loop(self) -> None:
+        while self._running:
+            self._wakeup.wait(self._idle_timeout)
+            self._wakeup.clear()
+            try:
+                while self._running and self._drain is not None and self._drain():
+                    pass
+            except Exception as e:
+                logger.error(f"[DRAIN_SCHEDULER] Drain failed: {e}", exc_info=True)
@@ -1,3 +1,4 @@
+import contextlib
 import os
 import time
 from collections.abc import Callable
@@ -7,6 +8,7 @@ from urllib.parse import urlparse
 import requests
 
 from src.core.config import AppConfig, get_config
+from src.services.network.downloader import stream_download
 from src.utils.logger import get_logger
 
 from ...core.models import ServiceType
@@ -35,7 +37,7 @@ class FileDownloader:
         """Set network service for connectivity checks."""
         self.network_service = network_service
 
-    def download_file(  # noqa: PLR0911, PLR0912
+    def download_file(  # noqa: PLR0911
         self,
         url: str,
         save_path: str,
@@ -85,46 +87,18 @@ class FileDownloader:
                 # If connectivity check fails, continue with download attempt
                 pass
 
-        # Setup session with retries
-        session = requests.Session()
         temp_file = f"{save_path}.part"
 
         try:
-            # Make a streaming request with simple custom headers
-            headers = {"User-Agent": self.config.network.user_agent}
-
-            response = session.get(url, stream=True, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-
-            # Get file size if available
-            content_length = response.headers.get("content-length", 0)
-            try:
-                file_size = int(content_length)
-            except (TypeError, ValueError):
-                file_size = 0
-
-            # Progress tracking
-            downloaded = 0
-            download_start = time.time()
-
-            with open(temp_file, "wb") as f:
-                for chunk in response.iter_content(chunk_size=self.chunk_size):
-                    if chunk:  # filter out keep-alive chunks
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        # Calculate progress and speed
-                        progress = (downloaded / file_size * 100) if file_size > 0 else -1
-                        elapsed = time.time() - download_start
-                        speed = downloaded / elapsed if elapsed > 0 else 0
-
-                        if progress_callback:
-                            # If file size unknown, report indeterminate progress
-                            mb_to_bytes = self.config.downloads.kb_to_bytes * 1024
-                            progress_to_report = (
-                                progress if progress >= 0 else min(99, downloaded / mb_to_bytes)
-                            )
-                            progress_callback(progress_to_report, speed)
+            # Interrupted transfers keep their .part file and resume where they stopped
+            downloaded = stream_download(
+                url=url,
+                temp_file=temp_file,
+                progress_callback=progress_callback,
+                chunk_size=self.chunk_size,
+                config=self.config,
+                timeout=self.timeout,
+            )
 
             # Rename temp file to final filename
             os.replace(temp_file, save_path)
@@ -161,18 +135,21 @@ class FileDownloader:
         except requests.exceptions.RequestException as e:
             download_time = time.time() - start_time
             logger.error(f"Download error for {url}: {e!s}")
-            # Clean up failed download
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            self._invalidate_connectivity(url)
             return DownloadResult(success=False, error_message=str(e), download_time=download_time)
         except Exception as e:
             download_time = time.time() - start_time
             logger.error(f"Unexpected error downloading {url}: {e!s}")
-            # Clean up failed download
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
             return DownloadResult(success=False, error_message=str(e), download_time=download_time)
 
+    def _invalidate_connectivity(self, url: str) -> None:
+        """Make the network service re-probe the URL's service after a failed transfer."""
+        if not (invalidate := getattr(self.network_service, "invalidate", None)):
+            return
+        with contextlib.suppress(Exception):
+            if service_type := self._domain_to_service_type(urlparse(url).netloc):
+                invalidate(service_type)
+
     def _domain_to_service_type(self, domain: str) -> ServiceType | None:
         """Convert domain to ServiceType."""
         domain = domain.lower()
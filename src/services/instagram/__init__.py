@@ -1,4 +1,13 @@
+import importlib
+
 from .auth_manager import InstagramAuthManager
-from .downloader import InstagramDownloader
+
+
+def __getattr__(name: str) -> type:
+    # The downloader pulls in instaloader; import it on first use.
+    if name == "InstagramDownloader":
+        return importlib.import_module(".downloader", __name__).InstagramDownloader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["InstagramAuthManager", "InstagramDownloader"]
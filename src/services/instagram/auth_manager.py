@@ -1,10 +1,16 @@
+from __future__ import annotations
+
 from threading import Lock
+from typing import TYPE_CHECKING
 
 from src.core.config import AppConfig, get_config
 from src.core.interfaces import IErrorNotifier
-from src.services.instagram.downloader import InstagramDownloader
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # instaloader is only needed once a download starts.
+    from src.services.instagram.downloader import InstagramDownloader
+
 logger = get_logger(__name__)
 
 
@@ -10,8 +10,9 @@ from src.core.interfaces import BaseDownloader, IErrorNotifier, IFileService
 
 from ...core.enums import ServiceType
 from ...utils.logger import get_logger
+from ..downloads import fetch_concurrently, split_progress
 from ..file.service import FileService
-from ..network.checker import check_site_connection
+from ..network.checker import check_site_connection, invalidate_site_connection
 
 logger = get_logger(__name__)
 
@@ -183,6 +184,7 @@ class InstagramDownloader(BaseDownloader):
             return False
 
         except Exception as e:
+            invalidate_site_connection(ServiceType.INSTAGRAM)
             logger.error(f"Error downloading from Instagram: {e!s}", exc_info=True)
             if self.error_handler:
                 self.error_handler.handle_exception(e, "Instagram download", "Instagram")
@@ -229,24 +231,27 @@ class InstagramDownloader(BaseDownloader):
         file_service: IFileService,
         progress_callback: Callable[[float, float], None] | None = None,
     ) -> bool:
-        """Download all items from a GraphSidecar (carousel) post."""
-        any_success = False
-        for i, node in enumerate(post.get_sidecar_nodes()):
+        """Download all items from a GraphSidecar (carousel) post, several at once."""
+        nodes = list(post.get_sidecar_nodes())
+        callbacks = split_progress(progress_callback, len(nodes))
+
+        def download_node(i: int) -> bool:
+            node = nodes[i]
             try:
                 ext = ".mp4" if node.is_video else ".jpg"
                 media_url: str | None = node.video_url if node.is_video else node.display_url
                 if not media_url:
                     logger.warning(f"[INSTAGRAM_DOWNLOADER] No media URL for sidecar item {i}")
-                    continue
+                    return False
                 suffix = f"_{i}" if i > 0 else ""
                 filename = self.file_service.sanitize_filename(f"{base_name}{suffix}{ext}")
                 full_path = os.path.join(save_dir, filename)
-                if file_service.download_file(media_url, full_path, progress_callback).success:
-                    any_success = True
+                return file_service.download_file(media_url, full_path, callbacks[i]).success
             except Exception as e:
                 logger.error(f"Error downloading sidecar item {i}: {e!s}")
-                continue
-        return any_success
+                return False
+
+        return any(fetch_concurrently(range(len(nodes)), download_node, self.config))
 
     def _download_post(
         self,
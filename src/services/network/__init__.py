@@ -1,21 +1,32 @@
+from .bandwidth import BandwidthScheduler, get_bandwidth_scheduler
 from .checker import (
     ConnectionResult,
+    ConnectivityState,
     HTTPNetworkChecker,
     NetworkService,
     check_all_services,
     check_internet_connection,
     check_site_connection,
     get_problem_services,
+    invalidate_site_connection,
     is_service_connected,
 )
+from .session_pool import HTTPSessionPool, get_session_pool, reset_session_pool
 
 __all__ = [
+    "BandwidthScheduler",
     "ConnectionResult",
+    "ConnectivityState",
     "HTTPNetworkChecker",
+    "HTTPSessionPool",
     "NetworkService",
     "check_all_services",
     "check_internet_connection",
     "check_site_connection",
+    "get_bandwidth_scheduler",
     "get_problem_services",
+    "get_session_pool",
+    "invalidate_site_connection",
     "is_service_connected",
+    "reset_session_pool",
 ]
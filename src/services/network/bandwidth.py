@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.config import AppConfig, get_config
+from src.services.downloads.cancellation import current_token
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """Byte-rate limiter that hands out reservations in arrival order.
+
+    The balance may go negative: each caller pays for its chunk up front and then
+    sleeps off the debt, so concurrent workers queue behind one another instead of
+    the first one draining the bucket and starving the rest.
+    """
+
+    def __init__(self, rate: float = 0, burst_seconds: float = 0.25) -> None:
+        self._lock = threading.Lock()
+        self._burst_seconds = burst_seconds
+        self._rate = 0.0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.set_rate(rate)
+
+    @property
+    def rate(self) -> float:
+        """Bytes per second, 0 meaning unlimited."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        if self._rate > 0:
+            capacity = self._rate * self._burst_seconds
+            self._tokens = min(capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def set_rate(self, rate: float) -> None:
+        """Change the rate; outstanding debt is repaid at the new rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = max(0.0, float(rate))
+            self._tokens = min(self._tokens, self._rate * self._burst_seconds)
+
+    def reserve(self, amount: int) -> float:
+        """Debit ``amount`` bytes and return how long the caller must wait."""
+        with self._lock:
+            if self._rate <= 0:
+                return 0.0
+            self._refill(time.monotonic())
+            self._tokens -= amount
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+
+@dataclass(frozen=True)
+class BandwidthLease:
+    """A running transfer registered with the scheduler."""
+
+    scheduler: BandwidthScheduler
+    key: str
+    service: str | None
+    bucket: TokenBucket
+
+    def throttle(self, amount: int) -> None:
+        self.scheduler.throttle(amount, lease=self)
+
+
+_current_transfer: ContextVar[BandwidthLease | None] = ContextVar(
+    "current_bandwidth_transfer", default=None
+)
+
+
+def current_transfer() -> BandwidthLease | None:
+    """Lease of the transfer running on this thread, if any."""
+    return _current_transfer.get()
+
+
+class BandwidthScheduler:
+    """Shares download bandwidth through global, per-service and per-download buckets.
+
+    Every chunk loop calls :meth:`throttle` with the bytes it just received. Limits are
+    in KB/s like ``Download.speed_limit``; 0 or None means unlimited, and all of them
+    can be changed while transfers are running.
+    """
+
+    def __init__(self, config: AppConfig | None = None) -> None:
+        self.config = config or get_config()
+        downloads = self.config.downloads
+        self._lock = threading.Lock()
+        self._global = TokenBucket(self._to_bytes(downloads.bandwidth_limit))
+        self._services: dict[str, TokenBucket] = {
+            service: TokenBucket(self._to_bytes(limit))
+            for service, limit in downloads.service_bandwidth_limits.items()
+        }
+        self._downloads: dict[str, TokenBucket] = {}
+
+    def _to_bytes(self, limit_kbps: int | None) -> float:
+        return float(limit_kbps or 0) * self.config.downloads.kb_to_bytes
+
+    def set_global_limit(self, limit_kbps: int | None) -> None:
+        """Cap the combined rate of all downloads."""
+        self._global.set_rate(self._to_bytes(limit_kbps))
+        logger.info("[BANDWIDTH] Global limit set to %s KB/s", limit_kbps or "unlimited")
+
+    def set_service_limit(self, service: str, limit_kbps: int | None) -> None:
+        """Cap the combined rate of all downloads for ``service``."""
+        with self._lock:
+            bucket = self._services.setdefault(service, TokenBucket())
+        bucket.set_rate(self._to_bytes(limit_kbps))
+        logger.info("[BANDWIDTH] %s limit set to %s KB/s", service, limit_kbps or "unlimited")
+
+    def set_download_limit(self, key: str, limit_kbps: int | None) -> bool:
+        """Cap a running download; returns False when ``key`` is not transferring."""
+        with self._lock:
+            bucket = self._downloads.get(key)
+        if bucket is None:
+            return False
+        bucket.set_rate(self._to_bytes(limit_kbps))
+        return True
+
+    @contextmanager
+    def transfer(
+        self,
+        key: str,
+        service: str | None = None,
+        limit_kbps: int | None = None,
+    ) -> Iterator[BandwidthLease]:
+        """Register a download for the duration of the block.
+
+        Chunk loops running on the calling thread pick the lease up through
+        :func:`current_transfer`, so downloaders need no extra parameters.
+        """
+        lease = BandwidthLease(self, key, service, TokenBucket(self._to_bytes(limit_kbps)))
+        with self._lock:
+            self._downloads[key] = lease.bucket
+        token = _current_transfer.set(lease)
+        try:
+            yield lease
+        finally:
+            _current_transfer.reset(token)
+            with self._lock:
+                if self._downloads.get(key) is lease.bucket:
+                    del self._downloads[key]
+
+    def throttle(self, amount: int, lease: BandwidthLease | None = None) -> None:
+        """Account for ``amount`` received bytes, sleeping while any cap is exceeded."""
+        if amount <= 0:
+            return
+        lease = lease or _current_transfer.get()
+        buckets = [self._global]
+        if lease is not None:
+            if lease.service and (service_bucket := self._services.get(lease.service)):
+                buckets.append(service_bucket)
+            buckets.append(lease.bucket)
+
+        if (delay := max(bucket.reserve(amount) for bucket in buckets)) > 0:
+            # A cancel or pause request cuts the wait short.
+            if token := current_token():
+                token.sleep(delay)
+            else:
+                time.sleep(delay)
+
+    def ytdlp_hook(self) -> Callable[[dict[str, Any]], None]:
+        """yt-dlp progress hook that throttles the transfer running on this thread.
+
+        yt-dlp reports cumulative ``downloaded_bytes`` per file, so the hook throttles
+        on the delta since its previous call for the same file.
+        """
+        lease = current_transfer()
+        seen: dict[str, int] = {}
+
+        def hook(d: dict[str, Any]) -> None:
+            if d.get("status") != "downloading":
+                return
+            filename = str(d.get("tmpfilename") or d.get("filename") or "")
+            downloaded = int(d.get("downloaded_bytes") or 0)
+            previous = seen.get(filename, 0)
+            seen[filename] = downloaded
+            self.throttle(downloaded - previous if downloaded >= previous else downloaded, lease)
+
+        return hook
+
+
+_scheduler: BandwidthScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_bandwidth_scheduler() -> BandwidthScheduler:
+    """Get the process-wide bandwidth scheduler, creating it on first use."""
+    global _scheduler  # noqa: PLW0603
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = BandwidthScheduler()
+        return _scheduler
+
+
+def reset_bandwidth_scheduler() -> None:
+    """Drop the process-wide scheduler so the next use rereads the config (tests)."""
+    global _scheduler  # noqa: PLW0603
+    with _scheduler_lock:
+        _scheduler = None
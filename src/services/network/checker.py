@@ -1,7 +1,11 @@
 import http.client
 import socket
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import ClassVar, Protocol, TypedDict
 
 from pydantic import BaseModel, Field
@@ -21,10 +25,15 @@ class ConnectionResult(BaseModel):
     service_type: ServiceType | None = Field(default=None, description="Type of service checked")
 
 
+ServiceResultCallback = Callable[[ServiceType, ConnectionResult], None]
+
+
 class NetworkChecker(Protocol):
     def check_connectivity(self) -> ConnectionResult: ...
     def check_service(self, service: ServiceType) -> ConnectionResult: ...
-    def check_all_services(self) -> dict[ServiceType, ConnectionResult]: ...
+    def check_all_services(
+        self, on_result: ServiceResultCallback | None = None
+    ) -> dict[ServiceType, ConnectionResult]: ...
 
 
 class ServiceConnectivityConfig(TypedDict):
@@ -516,21 +525,155 @@ class HTTPNetworkChecker(BaseNetworkChecker):
         """More lenient check for Instagram connectivity."""
         return self._lenient_service_check(start_time, ServiceType.INSTAGRAM, "instagram.com")
 
-    def check_all_services(self) -> dict[ServiceType, ConnectionResult]:
-        """Check connectivity to all supported services."""
-        results = {}
+    def check_all_services(
+        self,
+        on_result: ServiceResultCallback | None = None,
+        timeout: float | None = None,
+    ) -> dict[ServiceType, ConnectionResult]:
+        """Check connectivity to all supported services concurrently.
+
+        Args:
+            on_result: Called on this thread with each result as its check finishes
+            timeout: Overall deadline in seconds (network.connectivity_sweep_timeout
+                if not provided, 0 for none); services still being checked when it
+                passes are reported as timed out
+
+        Returns:
+            Results for every service, in SERVICE_URLS order
+        """
+        services = list(self.SERVICE_URLS)
+        if timeout is None:
+            timeout = self.config.network.connectivity_sweep_timeout
+        start_time = time.time()
+        results: dict[ServiceType, ConnectionResult] = {}
+
+        def report(service: ServiceType, result: ConnectionResult) -> None:
+            results[service] = result
+            if on_result:
+                try:
+                    on_result(service, result)
+                except Exception as e:
+                    logger.warning(f"[NETWORK_CHECKER] Result callback failed for {service}: {e}")
+
+        pool = ThreadPoolExecutor(max_workers=len(services), thread_name_prefix="ConnectivityCheck")
+        futures = {pool.submit(self.check_service, service): service for service in services}
+        try:
+            for future in as_completed(futures, timeout=timeout or None):
+                service = futures[future]
+                try:
+                    report(service, future.result())
+                except Exception as e:
+                    logger.error(f"Error checking service {service}: {e!s}")
+                    report(
+                        service,
+                        ConnectionResult(
+                            is_connected=False, error_message=str(e), service_type=service
+                        ),
+                    )
+        except FuturesTimeoutError:
+            logger.warning(
+                f"[NETWORK_CHECKER] Service sweep hit its {timeout}s deadline with "
+                f"{len(services) - len(results)} checks pending"
+            )
+        finally:
+            # Probes that are still running finish on their own; nobody waits for them.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        for service in services:
+            if service not in results:
+                report(
+                    service,
+                    ConnectionResult(
+                        is_connected=False,
+                        error_message=f"{service} check timed out",
+                        response_time=time.time() - start_time,
+                        service_type=service,
+                    ),
+                )
+
+        return {service: results[service] for service in services}
+
+
+# A successful result older than the TTL is still served, while it is re-checked
+# in the background, until it is this many TTLs old.
+_STALE_RESULT_FACTOR = 5
+
+
+class ConnectivityState:
+    """Recent per-service check results, so pre-download checks are a dict lookup.
+
+    A successful check is reused for ``network.connectivity_cache_ttl`` seconds and
+    a failed one for ``network.connectivity_failure_ttl``. After that, a successful
+    result is still returned while a background thread re-checks the service.
+    Downloaders call :meth:`invalidate` when a real download fails, so the next
+    download probes the service again.
+    """
+
+    def __init__(self, checker: NetworkChecker, config: AppConfig | None = None) -> None:
+        self.checker = checker
+        self.config = config or get_config()
+        self._lock = threading.Lock()
+        self._results: dict[ServiceType, tuple[float, ConnectionResult]] = {}
+        self._refreshing: set[ServiceType] = set()
 
-        for service in self.SERVICE_URLS:
+    def get(self, service: ServiceType) -> ConnectionResult:
+        """Return a recent result for ``service``, checking it only when needed."""
+        ttl = self.config.network.connectivity_cache_ttl
+        if ttl <= 0:
+            return self.checker.check_service(service)
+
+        with self._lock:
+            entry = self._results.get(service)
+
+        if entry is not None:
+            checked_at, result = entry
+            age = time.monotonic() - checked_at
+            if result.is_connected:
+                if age < ttl:
+                    return result
+                if age < ttl * _STALE_RESULT_FACTOR:
+                    self._refresh_in_background(service)
+                    return result
+            elif age < self.config.network.connectivity_failure_ttl:
+                return result
+
+        return self.refresh(service)
+
+    def refresh(self, service: ServiceType) -> ConnectionResult:
+        """Check ``service`` now and remember the result."""
+        result = self.checker.check_service(service)
+        self.store(service, result)
+        return result
+
+    def store(self, service: ServiceType, result: ConnectionResult) -> None:
+        """Remember a result obtained elsewhere, e.g. by a full service sweep."""
+        with self._lock:
+            self._results[service] = (time.monotonic(), result)
+
+    def invalidate(self, service: ServiceType | None = None) -> None:
+        """Forget the result for ``service``, or for every service."""
+        with self._lock:
+            if service is None:
+                self._results.clear()
+            else:
+                self._results.pop(service, None)
+
+    def _refresh_in_background(self, service: ServiceType) -> None:
+        with self._lock:
+            if service in self._refreshing:
+                return
+            self._refreshing.add(service)
+
+        def run() -> None:
             try:
-                result = self.check_service(service)
-                results[service] = result
+                self.refresh(service)
             except Exception as e:
-                logger.error(f"Error checking service {service}: {e!s}")
-                results[service] = ConnectionResult(
-                    is_connected=False, error_message=str(e), service_type=service
-                )
+                logger.debug(f"[NETWORK_CHECKER] Background check of {service} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(service)
 
-        return results
+        threading.Thread(target=run, name=f"connectivity-{service}", daemon=True).start()
 
 
 class NetworkService:
@@ -540,8 +683,31 @@ class NetworkService:
         self,
         checker: NetworkChecker | None = None,
         error_handler: IErrorNotifier | None = None,
+        cache_results: bool = False,
     ) -> None:
+        """Initialize network service.
+
+        Args:
+            checker: Checker used for probes (an HTTPNetworkChecker by default)
+            error_handler: Error handler passed to the default checker
+            cache_results: Serve per-service checks from a ConnectivityState
+        """
         self.checker = checker or HTTPNetworkChecker(error_handler=error_handler)
+        self.state = ConnectivityState(self.checker) if cache_results else None
+
+    def _service_result(self, service: ServiceType) -> ConnectionResult:
+        if self.state:
+            return self.state.get(service)
+        return self.checker.check_service(service)
+
+    def _all_service_results(
+        self, on_result: ServiceResultCallback | None = None
+    ) -> dict[ServiceType, ConnectionResult]:
+        results = self.checker.check_all_services(on_result=on_result)
+        if self.state:
+            for service, result in results.items():
+                self.state.store(service, result)
+        return results
 
     def check_internet_connection(self) -> tuple[bool, str]:
         """Check if the device has working internet connection."""
@@ -550,12 +716,23 @@ class NetworkService:
 
     def check_site_connection(self, service: ServiceType) -> tuple[bool, str]:
         """Check connectivity to a specific service."""
-        result = self.checker.check_service(service)
+        result = self._service_result(service)
         return result.is_connected, result.error_message
 
-    def check_all_services(self) -> dict[ServiceType, tuple[bool, str]]:
-        """Check connectivity to all services."""
-        results = self.checker.check_all_services()
+    def check_all_services(
+        self, on_result: Callable[[ServiceType, bool, str], None] | None = None
+    ) -> dict[ServiceType, tuple[bool, str]]:
+        """Check connectivity to all services.
+
+        Args:
+            on_result: Optional callback receiving (service, connected, error) as
+                each check finishes, before the full result is returned
+        """
+        results = self._all_service_results(
+            (lambda service, result: on_result(service, result.is_connected, result.error_message))
+            if on_result
+            else None
+        )
         return {
             service: (result.is_connected, result.error_message)
             for service, result in results.items()
@@ -563,16 +740,20 @@ class NetworkService:
 
     def get_problem_services(self) -> list[ServiceType]:
         """Get a list of services with connectivity issues."""
-        results = self.checker.check_all_services()
+        results = self._all_service_results()
         return [service for service, result in results.items() if not result.is_connected]
 
     def is_service_connected(self, service: ServiceType) -> bool:
         """Check if a specific service is connected."""
-        result = self.checker.check_service(service)
-        return result.is_connected
+        return self._service_result(service).is_connected
+
+    def invalidate(self, service: ServiceType | None = None) -> None:
+        """Drop cached connectivity for ``service`` (or all) after a failed download."""
+        if self.state:
+            self.state.invalidate(service)
 
 
-_DEFAULT_NETWORK_SERVICE = NetworkService()
+_DEFAULT_NETWORK_SERVICE = NetworkService(cache_results=True)
 
 
 def check_internet_connection() -> tuple[bool, str]:
@@ -585,9 +766,11 @@ def check_site_connection(service: ServiceType) -> tuple[bool, str]:
     return _DEFAULT_NETWORK_SERVICE.check_site_connection(service)
 
 
-def check_all_services() -> dict[ServiceType, tuple[bool, str]]:
+def check_all_services(
+    on_result: Callable[[ServiceType, bool, str], None] | None = None,
+) -> dict[ServiceType, tuple[bool, str]]:
     """Legacy function for backward compatibility."""
-    return _DEFAULT_NETWORK_SERVICE.check_all_services()
+    return _DEFAULT_NETWORK_SERVICE.check_all_services(on_result)
 
 
 def get_problem_services() -> list[ServiceType]:
@@ -598,3 +781,8 @@ def get_problem_services() -> list[ServiceType]:
 def is_service_connected(service: ServiceType) -> bool:
     """Legacy function for backward compatibility."""
     return _DEFAULT_NETWORK_SERVICE.is_service_connected(service)
+
+
+def invalidate_site_connection(service: ServiceType | None = None) -> None:
+    """Make the next check_site_connection call probe ``service`` again."""
+    _DEFAULT_NETWORK_SERVICE.invalidate(service)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import http.client
 import os
 import time
@@ -10,6 +11,23 @@ from urllib.parse import urlparse
 import requests
 
 from src.core.config import AppConfig, get_config
+from src.services.downloads.cancellation import (
+    DownloadCancelledError,
+    current_token,
+    raise_if_cancelled,
+)
+from src.services.network.bandwidth import get_bandwidth_scheduler
+from src.services.network.resume import (
+    PartialDownload,
+    accepted_resume_offset,
+    discard_partial,
+    load_partial,
+    resume_headers,
+    save_partial,
+    sidecar_path,
+)
+from src.services.network.segmented import segmented_download
+from src.services.network.session_pool import get_session_pool
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -66,23 +84,209 @@ def _stream_chunks_to_temp_file(
     total_size: int,
     progress_callback: Callable[[float, float], None] | None,
     config: AppConfig,
-) -> None:
-    downloaded = 0
+    *,
+    resume_from: int = 0,
+) -> int:
+    downloaded = resume_from
     start_time = time.time()
+    scheduler = get_bandwidth_scheduler()
+    token = current_token()
 
-    with open(temp_file, "wb") as f:
+    with open(temp_file, "ab" if resume_from else "wb") as f:
         for chunk in chunks:
+            raise_if_cancelled(token)
             if not chunk:
                 continue
             f.write(chunk)
             downloaded += len(chunk)
+            scheduler.throttle(len(chunk))
             if not progress_callback:
                 continue
             elapsed = time.time() - start_time
-            speed = downloaded / elapsed if elapsed > 0 else 0
+            speed = (downloaded - resume_from) / elapsed if elapsed > 0 else 0
             progress_to_report = _compute_progress_to_report(downloaded, total_size, config)
             progress_callback(progress_to_report, speed)
 
+    return downloaded
+
+
+def _open_resumable_response(
+    session: requests.Session,
+    url: str,
+    *,
+    temp_file: str,
+    request_headers: dict[str, str],
+    cookies: object | None,
+    timeout: int,
+    resume: bool,
+) -> tuple[Any, PartialDownload]:
+    """Issue the GET, continuing a kept ``.part`` file with Range/If-Range when possible."""
+    partial = load_partial(temp_file) if resume else None
+
+    def get(extra_headers: dict[str, str]) -> Any:
+        return session.get(
+            url,
+            stream=True,
+            headers={**request_headers, **extra_headers},
+            cookies=cast(Any, _normalize_cookies(cookies)),
+            timeout=timeout,
+        )
+
+    response = get(resume_headers(partial) if partial else {})
+    if partial and response.status_code == 416:
+        logger.info("[RESUME] Server rejected stored range for %s; restarting", url)
+        response.close()
+        discard_partial(temp_file)
+        partial = None
+        response = get({})
+
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+
+    offset = (
+        accepted_resume_offset(response.status_code, response.headers, partial.bytes_downloaded)
+        if partial
+        else 0
+    )
+    if partial and not offset:
+        logger.info("[RESUME] Ranges refused or validator changed for %s; full download", url)
+    elif offset:
+        logger.info("[RESUME] Resuming %s from byte %d", url, offset)
+
+    state = PartialDownload.from_response_headers(url, response.headers, offset)
+    if resume and state.is_resumable:
+        save_partial(temp_file, state)
+    return response, state
+
+
+def _keep_partial(temp_file: str, state: PartialDownload | None, resume: bool) -> bool:
+    """Keep a broken transfer for later resumption, or clean it up if it cannot resume."""
+    if resume and state is None and load_partial(temp_file):
+        # The request failed before any response; a previously kept partial is still valid.
+        return True
+    if resume and state and state.is_resumable and os.path.isfile(temp_file):
+        state.bytes_downloaded = os.path.getsize(temp_file)
+        if state.bytes_downloaded > 0:
+            save_partial(temp_file, state)
+            return True
+    discard_partial(temp_file)
+    return False
+
+
+def stream_download(
+    url: str,
+    temp_file: str,
+    *,
+    progress_callback: Callable[[float, float], None] | None,
+    chunk_size: int,
+    config: AppConfig,
+    headers: dict[str, str] | None = None,
+    cookies: object | None = None,
+    timeout: int | None = None,
+    segments: int | None = None,
+) -> int:
+    """Stream ``url`` into ``temp_file`` over a pooled session.
+
+    Large files from services configured with ``download_segments`` > 1 are first
+    tried as concurrent byte-range segments; anything the segmented engine declines
+    or fails on falls through to a single connection.
+
+    When the server supplies a validator (ETag/Last-Modified), a broken transfer keeps
+    its ``.part`` file plus sidecar metadata and is retried from the last byte written,
+    up to ``downloads.retry_count`` times. The partial also survives a final failure so
+    a later run can resume it.
+
+    Returns:
+        Number of bytes in ``temp_file``
+
+    Raises:
+        DownloadCancelledError when the running download is cancelled or paused (a resumable
+        partial is kept); otherwise the last transfer error once retries are exhausted
+    """
+    raise_if_cancelled()
+    request_headers = {"User-Agent": _safe_user_agent(config)}
+    if headers:
+        request_headers.update(headers)
+    effective_timeout = timeout if timeout is not None else config.network.default_timeout
+    resume = config.downloads.resume_partial_downloads
+    attempts_left = config.downloads.retry_count
+
+    if segments is None:
+        segments = config.services.download_segments_for_host(urlparse(url).hostname or "")
+    if segments > 1 and not (resume and load_partial(temp_file)):
+        try:
+            if (
+                downloaded := segmented_download(
+                    url,
+                    temp_file,
+                    segments=segments,
+                    progress_callback=progress_callback,
+                    chunk_size=chunk_size,
+                    config=config,
+                    request_headers=request_headers,
+                    cookies=cast(Any, _normalize_cookies(cookies)),
+                    timeout=effective_timeout,
+                )
+            ) is not None:
+                return downloaded
+        except DownloadCancelledError:
+            # Segments leave holes that a Range resume cannot fill.
+            discard_partial(temp_file)
+            raise
+        except Exception as e:
+            logger.warning("[SEGMENTED] Falling back to a single connection for %s: %s", url, e)
+            discard_partial(temp_file)
+
+    while True:
+        state: PartialDownload | None = None
+        try:
+            with get_session_pool().session(url) as session:
+                response, state = _open_resumable_response(
+                    session,
+                    url,
+                    temp_file=temp_file,
+                    request_headers=request_headers,
+                    cookies=cookies,
+                    timeout=effective_timeout,
+                    resume=resume,
+                )
+                try:
+                    downloaded = _stream_chunks_to_temp_file(
+                        chunks=response.iter_content(chunk_size=chunk_size),
+                        temp_file=temp_file,
+                        total_size=state.total_size,
+                        progress_callback=progress_callback,
+                        config=config,
+                        resume_from=state.bytes_downloaded,
+                    )
+                finally:
+                    response.close()
+        except DownloadCancelledError:
+            _keep_partial(temp_file, state, resume)
+            raise
+        except Exception as e:
+            start_offset = state.bytes_downloaded if state else 0
+            if not _keep_partial(temp_file, state, resume) or attempts_left <= 0:
+                raise
+            if state is None or state.bytes_downloaded <= start_offset:
+                raise
+            attempts_left -= 1
+            logger.warning(
+                "[RESUME] Transfer of %s broke at byte %d (%s); retrying",
+                url,
+                state.bytes_downloaded,
+                e,
+            )
+            time.sleep(config.downloads.retry_delay)
+            continue
+
+        with contextlib.suppress(OSError):
+            os.remove(sidecar_path(temp_file))
+        return downloaded
+
 
 def _finalize_download(
     temp_file: str,
@@ -210,37 +414,19 @@ def download_file(
             timeout=timeout,
         )
 
-    session = requests.Session()
     temp_file = f"{save_path}.part"
 
     try:
-        request_headers = {"User-Agent": _safe_user_agent(config)}
-        if headers:
-            request_headers.update(headers)
-
-        effective_timeout = timeout if timeout is not None else config.network.default_timeout
-        response = session.get(
-            url,
-            stream=True,
-            headers=request_headers,
-            cookies=cast(Any, _normalize_cookies(cookies)),
-            timeout=effective_timeout,
-        )
-        response.raise_for_status()
-
-        content_length = response.headers.get("content-length", 0)
-        try:
-            file_size = int(content_length)
-        except (TypeError, ValueError):
-            file_size = 0
-        _stream_chunks_to_temp_file(
-            chunks=response.iter_content(chunk_size=chunk_size),
+        stream_download(
+            url=url,
             temp_file=temp_file,
-            total_size=file_size,
             progress_callback=progress_callback,
+            chunk_size=chunk_size,
             config=config,
+            headers=headers,
+            cookies=cookies,
+            timeout=timeout,
         )
-
         return _finalize_download(
             temp_file=temp_file,
             save_path=save_path,
@@ -249,11 +435,7 @@ def download_file(
         )
     except _REQUEST_EXCEPTION as e:
         logger.error("Download error for %s: %s", url, e)
-        _safe_remove(temp_file)
         return False
     except Exception as e:
         logger.error("Unexpected error downloading %s: %s", url, e)
-        _safe_remove(temp_file)
         return False
-    finally:
-        session.close()
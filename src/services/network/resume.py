@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import re
+from collections.abc import Mapping
+
+from pydantic import BaseModel, Field
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.IGNORECASE)
+
+
+class PartialDownload(BaseModel):
+    """Metadata persisted next to a ``.part`` file so it can be resumed later."""
+
+    url: str = Field(default="", description="URL the partial bytes were fetched from")
+    etag: str | None = Field(default=None, description="Strong ETag reported by the server")
+    last_modified: str | None = Field(default=None, description="Last-Modified header value")
+    bytes_downloaded: int = Field(default=0, ge=0, description="Bytes present in the .part file")
+    total_size: int = Field(default=0, ge=0, description="Full size of the resource (0 = unknown)")
+
+    @property
+    def validator(self) -> str | None:
+        """Value for ``If-Range``; weak ETags are not allowed there."""
+        if self.etag and not self.etag.startswith("W/"):
+            return self.etag
+        return self.last_modified
+
+    @property
+    def is_resumable(self) -> bool:
+        return self.validator is not None
+
+    @classmethod
+    def from_response_headers(
+        cls, url: str, headers: Mapping[str, str], offset: int
+    ) -> PartialDownload:
+        """Build metadata from a GET response that starts at byte ``offset``."""
+        total_size = 0
+        if (match := _CONTENT_RANGE_PATTERN.match(str(headers.get("content-range", "")))) and (
+            match.group(3) != "*"
+        ):
+            total_size = int(match.group(3))
+        else:
+            with contextlib.suppress(TypeError, ValueError):
+                total_size = offset + int(headers.get("content-length", 0))
+
+        return cls(
+            url=url,
+            etag=headers.get("etag") or None,
+            last_modified=headers.get("last-modified") or None,
+            bytes_downloaded=offset,
+            total_size=total_size,
+        )
+
+
+def sidecar_path(temp_file: str) -> str:
+    """Path of the metadata file that accompanies ``temp_file``."""
+    return f"{temp_file}.json"
+
+
+def load_partial(temp_file: str) -> PartialDownload | None:
+    """Load resumable state for ``temp_file``, or None when there is nothing to resume."""
+    meta_file = sidecar_path(temp_file)
+    if not (os.path.isfile(temp_file) and os.path.isfile(meta_file)):
+        return None
+
+    try:
+        with open(meta_file, encoding="utf-8") as f:
+            partial = PartialDownload.model_validate(json.load(f))
+    except Exception as e:
+        logger.warning("[RESUME] Ignoring unreadable partial metadata %s: %s", meta_file, e)
+        return None
+
+    # The file on disk is the source of truth; the sidecar count may lag behind it.
+    partial.bytes_downloaded = os.path.getsize(temp_file)
+    if not partial.is_resumable or partial.bytes_downloaded == 0:
+        return None
+    if partial.total_size and partial.bytes_downloaded > partial.total_size:
+        return None
+    return partial
+
+
+def save_partial(temp_file: str, partial: PartialDownload) -> None:
+    """Atomically write the sidecar for ``temp_file``."""
+    meta_file = sidecar_path(temp_file)
+    tmp_meta_file = f"{meta_file}.tmp"
+    try:
+        with open(tmp_meta_file, "w", encoding="utf-8") as f:
+            json.dump(partial.model_dump(), f)
+        os.replace(tmp_meta_file, meta_file)
+    except OSError as e:
+        logger.warning("[RESUME] Failed to persist partial metadata %s: %s", meta_file, e)
+
+
+def discard_partial(temp_file: str) -> None:
+    """Remove ``temp_file`` together with its sidecar."""
+    for path in (temp_file, sidecar_path(temp_file)):
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+def resume_headers(partial: PartialDownload) -> dict[str, str]:
+    """Request headers asking the server to continue after the bytes already on disk."""
+    headers = {"Range": f"bytes={partial.bytes_downloaded}-"}
+    if validator := partial.validator:
+        headers["If-Range"] = validator
+    return headers
+
+
+def accepted_resume_offset(status_code: object, headers: Mapping[str, str], offset: int) -> int:
+    """Return ``offset`` if the response continues from it, otherwise 0 (full body)."""
+    if status_code != 206:
+        return 0
+    if not (match := _CONTENT_RANGE_PATTERN.match(str(headers.get("content-range", "")))):
+        return 0
+    return offset if int(match.group(1)) == offset else 0
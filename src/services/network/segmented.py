@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.core.config import AppConfig
+from src.services.downloads.cancellation import (
+    CancellationToken,
+    current_token,
+    raise_if_cancelled,
+)
+from src.services.network.bandwidth import BandwidthLease, current_transfer, get_bandwidth_scheduler
+from src.services.network.resume import PartialDownload
+from src.services.network.session_pool import get_session_pool
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SegmentError(Exception):
+    """Raised when a byte-range segment cannot be fetched as requested."""
+
+
+class RangeProbe(BaseModel):
+    """What a server reported about a resource before splitting it."""
+
+    url: str = Field(description="Final URL after redirects")
+    total_size: int = Field(default=0, ge=0, description="Resource size in bytes (0 = unknown)")
+    accepts_ranges: bool = Field(default=False, description="Whether byte ranges are served")
+    validator: str | None = Field(default=None, description="ETag/Last-Modified for If-Range")
+
+
+def _probe_from_headers(url: str, headers: Mapping[str, str], via_range: bool) -> RangeProbe:
+    partial = PartialDownload.from_response_headers(url, headers, 0)
+    accepts_ranges = via_range or str(headers.get("accept-ranges", "")).lower() == "bytes"
+    total_size = partial.total_size
+    if via_range and "content-range" not in headers:
+        total_size = 0
+    return RangeProbe(
+        url=url,
+        total_size=total_size,
+        accepts_ranges=accepts_ranges,
+        validator=partial.validator,
+    )
+
+
+def probe_ranges(
+    session: Any,
+    url: str,
+    headers: dict[str, str],
+    cookies: object | None,
+    timeout: int,
+) -> RangeProbe | None:
+    """Learn size and range support with HEAD, falling back to a one-byte range GET."""
+    try:
+        response = session.head(
+            url, headers=headers, cookies=cookies, timeout=timeout, allow_redirects=True
+        )
+        response.close()
+        final_url = response.url if isinstance(response.url, str) else url
+        if (
+            response.status_code < 400
+            and (
+                probe := _probe_from_headers(final_url, response.headers, via_range=False)
+            ).accepts_ranges
+        ):
+            return probe
+    except Exception as e:
+        logger.debug("[SEGMENTED] HEAD probe failed for %s: %s", url, e)
+
+    try:
+        response = session.get(
+            url,
+            headers={**headers, "Range": "bytes=0-0"},
+            cookies=cookies,
+            timeout=timeout,
+            stream=True,
+        )
+        response.close()
+        if response.status_code != 206:
+            return None
+        final_url = response.url if isinstance(response.url, str) else url
+        return _probe_from_headers(final_url, response.headers, via_range=True)
+    except Exception as e:
+        logger.debug("[SEGMENTED] Range probe failed for %s: %s", url, e)
+        return None
+
+
+def split_ranges(total_size: int, segments: int) -> list[tuple[int, int]]:
+    """Split ``total_size`` bytes into at most ``segments`` inclusive ranges."""
+    segments = max(1, min(segments, total_size))
+    step = -(-total_size // segments)
+    return [(start, min(start + step, total_size) - 1) for start in range(0, total_size, step)]
+
+
+class _SegmentProgress:
+    """Folds per-segment byte counts into the single ``(progress, speed)`` callback."""
+
+    def __init__(
+        self,
+        total_size: int,
+        progress_callback: Callable[[float, float], None] | None,
+    ) -> None:
+        self.total_size = total_size
+        self.progress_callback = progress_callback
+        self.downloaded = 0
+        self._start_time = time.time()
+        self._lock = threading.Lock()
+
+    def add(self, byte_count: int) -> None:
+        with self._lock:
+            self.downloaded += byte_count
+            if not self.progress_callback:
+                return
+            elapsed = time.time() - self._start_time
+            speed = self.downloaded / elapsed if elapsed > 0 else 0
+            self.progress_callback(self.downloaded / self.total_size * 100, speed)
+
+
+def _fetch_segment(
+    url: str,
+    temp_file: str,
+    byte_range: tuple[int, int],
+    *,
+    request_headers: dict[str, str],
+    cookies: object | None,
+    timeout: int,
+    chunk_size: int,
+    progress: _SegmentProgress,
+    stop: threading.Event,
+    lease: BandwidthLease | None,
+    token: CancellationToken | None,
+) -> None:
+    start, end = byte_range
+    scheduler = get_bandwidth_scheduler()
+    expected = end - start + 1
+    written = 0
+    with get_session_pool().session(url) as session:
+        response = session.get(
+            url,
+            stream=True,
+            headers={**request_headers, "Range": f"bytes={start}-{end}"},
+            cookies=cookies,
+            timeout=timeout,
+        )
+        try:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise SegmentError(
+                    f"expected 206 for bytes {start}-{end}, got {response.status_code}"
+                )
+            with open(temp_file, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    raise_if_cancelled(token)
+                    if stop.is_set():
+                        raise SegmentError("segmented download aborted")
+                    if not chunk:
+                        continue
+                    chunk = chunk[: expected - written]
+                    f.write(chunk)
+                    written += len(chunk)
+                    progress.add(len(chunk))
+                    scheduler.throttle(len(chunk), lease)
+                    if written >= expected:
+                        break
+        finally:
+            response.close()
+
+    if written != expected:
+        raise SegmentError(f"segment {start}-{end} ended after {written} of {expected} bytes")
+
+
+def segmented_download(
+    url: str,
+    temp_file: str,
+    *,
+    segments: int,
+    progress_callback: Callable[[float, float], None] | None,
+    chunk_size: int,
+    config: AppConfig,
+    request_headers: dict[str, str],
+    cookies: object | None,
+    timeout: int,
+) -> int | None:
+    """Fetch ``url`` over ``segments`` concurrent range requests into ``temp_file``.
+
+    Returns:
+        Bytes written, or None when the resource is too small, its size is unknown,
+        or the server does not serve ranges (callers then stream it normally)
+
+    Raises:
+        SegmentError or the underlying request error when a segment fails
+    """
+    with get_session_pool().session(url) as session:
+        probe = probe_ranges(session, url, request_headers, cookies, timeout)
+
+    if (
+        probe is None
+        or not probe.accepts_ranges
+        or probe.total_size < max(config.downloads.segmented_min_size, segments)
+    ):
+        return None
+
+    ranges = split_ranges(probe.total_size, segments)
+    logger.info(
+        "[SEGMENTED] Fetching %s (%d bytes) over %d connections",
+        probe.url,
+        probe.total_size,
+        len(ranges),
+    )
+
+    # Preallocate so every segment can write at its own offset.
+    with open(temp_file, "wb") as f:
+        f.truncate(probe.total_size)
+
+    segment_headers = dict(request_headers)
+    if probe.validator:
+        segment_headers["If-Range"] = probe.validator
+    progress = _SegmentProgress(probe.total_size, progress_callback)
+    stop = threading.Event()
+    # Segment threads do not inherit the caller's context, so hand these over.
+    lease = current_transfer()
+    token = current_token()
+
+    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="Segment") as executor:
+        futures = [
+            executor.submit(
+                _fetch_segment,
+                probe.url,
+                temp_file,
+                byte_range,
+                request_headers=segment_headers,
+                cookies=cookies,
+                timeout=timeout,
+                chunk_size=chunk_size,
+                progress=progress,
+                stop=stop,
+                lease=lease,
+                token=token,
+            )
+            for byte_range in ranges
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if (error := future.exception()) is not None:
+                stop.set()
+                raise error
+
+    return probe.total_size
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+
+from src.core.config import AppConfig, get_config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HTTPSessionPool:
+    """Process-wide registry of keep-alive ``requests`` sessions keyed by host.
+
+    A session is checked out by exactly one worker thread at a time and returned
+    afterwards, so consecutive downloads from the same CDN reuse warm TCP/TLS
+    connections instead of performing a fresh handshake per file.
+    """
+
+    def __init__(self, config: AppConfig | None = None) -> None:
+        self.config = config or get_config()
+        self._lock = threading.Lock()
+        self._idle: dict[str, list[requests.Session]] = {}
+        self._closed = False
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        return f"{parsed.scheme}://{host}:{parsed.port or ''}"
+
+    def _create_session(self) -> requests.Session:
+        downloads = self.config.downloads
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=downloads.http_pool_connections,
+            pool_maxsize=downloads.http_pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def acquire(self, url: str) -> requests.Session:
+        """Check out a session for ``url``'s host, creating one if none is idle."""
+        key = self._host_key(url)
+        with self._lock:
+            if idle := self._idle.get(key):
+                return idle.pop()
+        logger.debug("[SESSION_POOL] Opening new session for %s", key)
+        return self._create_session()
+
+    def release(self, url: str, session: requests.Session) -> None:
+        """Return a session to the pool, closing it when the host is already full."""
+        # Cookies set by one download's responses must not leak into the next one.
+        session.cookies.clear()
+        key = self._host_key(url)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if not self._closed and len(idle) < self.config.downloads.http_pool_maxsize:
+                idle.append(session)
+                return
+        session.close()
+
+    @contextmanager
+    def session(self, url: str) -> Iterator[requests.Session]:
+        """Context manager that checks a session out for the duration of a request."""
+        session = self.acquire(url)
+        try:
+            yield session
+        finally:
+            self.release(url, session)
+
+    def idle_count(self, url: str) -> int:
+        """Number of warm sessions currently parked for ``url``'s host."""
+        with self._lock:
+            return len(self._idle.get(self._host_key(url), []))
+
+    def close_all(self) -> None:
+        """Close every idle session and refuse to park new ones."""
+        with self._lock:
+            self._closed = True
+            sessions = [session for idle in self._idle.values() for session in idle]
+            self._idle.clear()
+        for session in sessions:
+            session.close()
+
+
+_session_pool: HTTPSessionPool | None = None
+_session_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> HTTPSessionPool:
+    """Get the process-wide session pool, creating it on first use."""
+    global _session_pool  # noqa: PLW0603
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = HTTPSessionPool()
+        return _session_pool
+
+
+def reset_session_pool() -> None:
+    """Close and drop the process-wide session pool (shutdown and tests)."""
+    global _session_pool  # noqa: PLW0603
+    with _session_pool_lock:
+        if _session_pool is not None:
+            _session_pool.close_all()
+        _session_pool = None
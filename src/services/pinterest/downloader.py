@@ -13,7 +13,7 @@ from src.core.interfaces import BaseDownloader, IErrorNotifier, IFileService
 
 from ...utils.logger import get_logger
 from ..file.service import FileService
-from ..network.checker import check_site_connection
+from ..network.checker import check_site_connection, invalidate_site_connection
 
 logger = get_logger(__name__)
 
@@ -83,6 +83,7 @@ class PinterestDownloader(BaseDownloader):
             result = self.file_service.download_file(media_url, full_path, progress_callback)
 
             if not result.success:
+                invalidate_site_connection(ServiceType.PINTEREST)
                 error_msg = "Failed to download media file"
                 if self.error_handler:
                     self.error_handler.handle_service_failure(
@@ -107,6 +108,7 @@ class PinterestDownloader(BaseDownloader):
             return True
 
         except Exception as e:
+            invalidate_site_connection(ServiceType.PINTEREST)
             logger.error(f"Error downloading from Pinterest: {e!s}", exc_info=True)
             if self.error_handler:
                 self.error_handler.handle_exception(e, "Pinterest download", "Pinterest")
@@ -4,7 +4,9 @@ import contextlib
 import json
 import os
 import re
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, ClassVar
 from urllib.parse import quote, unquote
 
@@ -15,6 +17,7 @@ from src.core.interfaces import BaseDownloader, IErrorNotifier, IFileService
 from src.services.network.downloader import download_file
 
 from ...utils.logger import get_logger
+from .host_cache import CdnHostCache, get_radiojavan_host_cache
 
 if TYPE_CHECKING:
     from src.services.cookies.radiojavan_cookie_manager import RadioJavanCookieManager
@@ -61,6 +64,7 @@ class RadioJavanDownloader(BaseDownloader):
         file_service: IFileService | None = None,
         config: AppConfig | None = None,
         cookie_manager: RadioJavanCookieManager | None = None,
+        host_cache: CdnHostCache | None = None,
     ) -> None:
         resolved_config = config or get_config()
         super().__init__(error_handler, file_service, resolved_config)
@@ -71,6 +75,7 @@ class RadioJavanDownloader(BaseDownloader):
         self._base_headers = {"User-Agent": self.config.network.user_agent}
         self._last_access_error: str | None = None
         self._cookie_manager = cookie_manager
+        self.host_cache = host_cache or get_radiojavan_host_cache()
 
     def _request_context(
         self,
@@ -180,14 +185,20 @@ class RadioJavanDownloader(BaseDownloader):
         return self._request_context(force_refresh=force_refresh)
 
     def _candidate_hosts(self, media_name: str, media_type: str) -> list[str]:
-        """Get candidate hosts using Radio Javan API first, then static fallbacks."""
+        """Get candidate hosts using Radio Javan API first, then static fallbacks.
+
+        The API answer is cached per media type, and the combined list is ranked
+        by how well each host has served files so far.
+        """
         hosts: list[str] = []
 
-        api_hosts = [
-            self._normalize_host(host)
-            for endpoint in self._host_lookup_endpoints(media_type)
-            if (host := self._fetch_host_from_endpoint(endpoint, media_name))
-        ]
+        if (api_hosts := self.host_cache.get_lookup(media_type)) is None:
+            api_hosts = [
+                self._normalize_host(host)
+                for endpoint in self._host_lookup_endpoints(media_type)
+                if (host := self._fetch_host_from_endpoint(endpoint, media_name))
+            ]
+            self.host_cache.put_lookup(media_type, api_hosts)
         hosts.extend(api_hosts)
 
         configured_hosts = [self._normalize_host(h) for h in self.config.radiojavan.cdn_hosts]
@@ -202,7 +213,7 @@ class RadioJavanDownloader(BaseDownloader):
                 continue
             seen.add(host)
             unique_hosts.append(host)
-        return unique_hosts
+        return self.host_cache.rank(media_type, unique_hosts)
 
     def _host_lookup_endpoints(self, media_type: str) -> list[str]:
         """Build host lookup endpoints for current media type."""
@@ -503,20 +514,18 @@ class RadioJavanDownloader(BaseDownloader):
         if direct_link := self._resolve_direct_media_url_from_play(media_name, media_type):
             return direct_link
 
-        hosts = self._candidate_hosts(media_name, media_type)
-        paths = self._candidate_paths(media_type)
+        candidates = [
+            (host, f"{host}{path.format(media_name=media_name)}")
+            for host in self._candidate_hosts(media_name, media_type)
+            for path in self._candidate_paths(media_type)
+        ]
 
-        first_candidate: str | None = None
-        for host in hosts:
-            for path in paths:
-                download_url = f"{host}{path.format(media_name=media_name)}"
-                if first_candidate is None:
-                    first_candidate = download_url
-                if self._validate_url(download_url):
-                    logger.debug(f"[RADIOJAVAN_DOWNLOADER] Valid URL found: {download_url}")
-                    return download_url
-
-        if first_candidate:
+        if download_url := self._first_valid_candidate(media_type, candidates):
+            logger.debug(f"[RADIOJAVAN_DOWNLOADER] Valid URL found: {download_url}")
+            return download_url
+
+        if candidates:
+            first_candidate = candidates[0][1]
             if self._last_access_error:
                 logger.warning(
                     "[RADIOJAVAN_DOWNLOADER] Returning best-effort URL after transport errors: %s",
@@ -531,6 +540,56 @@ class RadioJavanDownloader(BaseDownloader):
         logger.warning(f"[RADIOJAVAN_DOWNLOADER] Could not construct valid URL for: {url}")
         return None
 
+    def _first_valid_candidate(
+        self,
+        media_type: str,
+        candidates: list[tuple[str, str]],
+    ) -> str | None:
+        """Validate ``(host, url)`` candidates concurrently; the best-ranked valid one wins.
+
+        Up to ``radiojavan.validation_concurrency`` candidates are probed at once.
+        Once one validates, candidates ranked below it are not started, and the
+        result is returned as soon as every candidate ranked above it has failed.
+        Each probed host is then recorded in the host cache as a success if any
+        of its URLs validated, or as a failure otherwise.
+        """
+        if not candidates:
+            return None
+
+        lock = threading.Lock()
+        best_index = len(candidates)
+        host_outcomes: dict[str, bool] = {}
+
+        def validate(index: int, host: str, url: str) -> bool:
+            nonlocal best_index
+            with lock:
+                if index > best_index:
+                    return False
+            valid = self._validate_url(url)
+            with lock:
+                host_outcomes[host] = host_outcomes.get(host, False) or valid
+                if valid:
+                    best_index = min(best_index, index)
+            return valid
+
+        width = max(1, self.config.radiojavan.validation_concurrency)
+        pool = ThreadPoolExecutor(max_workers=width, thread_name_prefix="RadioJavanValidate")
+        try:
+            futures = [
+                pool.submit(validate, index, host, url)
+                for index, (host, url) in enumerate(candidates)
+            ]
+            for index, future in enumerate(futures):
+                if future.result():
+                    return candidates[index][1]
+            return None
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            with lock:
+                outcomes = list(host_outcomes.items())
+            for host, valid in outcomes:
+                self.host_cache.record(media_type, host, valid)
+
     def _validate_url(self, url: str) -> bool:
         """Validate if URL returns a valid file.
 
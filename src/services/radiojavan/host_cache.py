@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from src.core.config import AppConfig, get_config
+
+
+@dataclass
+class _HostStats:
+    successes: int = 0
+    failures: int = 0
+    last_success: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace smoothing: an untried host ranks between good and bad ones.
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+
+class CdnHostCache:
+    """Remembers which RadioJavan CDN hosts serve each media type.
+
+    Hosts returned by the ``mp3_host``/``video_host`` lookup endpoints are reused
+    for ``radiojavan.host_cache_ttl`` seconds, so a queue of songs posts the lookup
+    once. Validation outcomes are counted per media type and host; :meth:`rank`
+    puts the host that most recently served a file first, then orders the rest by
+    success rate.
+    """
+
+    def __init__(self, config: AppConfig | None = None) -> None:
+        self.config = config or get_config()
+        self._lock = threading.Lock()
+        self._lookups: dict[str, tuple[float, list[str]]] = {}
+        self._stats: dict[tuple[str, str], _HostStats] = {}
+
+    def get_lookup(self, media_type: str) -> list[str] | None:
+        """Hosts the lookup endpoints returned for ``media_type``, if still fresh."""
+        with self._lock:
+            if (entry := self._lookups.get(media_type)) is None:
+                return None
+            expires_at, hosts = entry
+            if time.monotonic() >= expires_at:
+                del self._lookups[media_type]
+                return None
+            return list(hosts)
+
+    def put_lookup(self, media_type: str, hosts: list[str]) -> None:
+        """Remember the lookup endpoints' answer for ``media_type``."""
+        if not hosts or self.config.radiojavan.host_cache_ttl <= 0:
+            return
+        with self._lock:
+            self._lookups[media_type] = (
+                time.monotonic() + self.config.radiojavan.host_cache_ttl,
+                list(hosts),
+            )
+
+    def record(self, media_type: str, host: str, success: bool) -> None:
+        """Count one validation outcome for ``host``."""
+        with self._lock:
+            stats = self._stats.setdefault((media_type, host), _HostStats())
+            if success:
+                stats.successes += 1
+                stats.last_success = time.monotonic()
+            else:
+                stats.failures += 1
+
+    def rank(self, media_type: str, hosts: list[str]) -> list[str]:
+        """Order ``hosts`` best first; ties keep their original order."""
+        with self._lock:
+            stats = {host: self._stats.get((media_type, host), _HostStats()) for host in hosts}
+
+        last_good = max(hosts, key=lambda host: stats[host].last_success, default=None)
+        if last_good is not None and not stats[last_good].last_success:
+            last_good = None
+
+        return sorted(
+            hosts,
+            key=lambda host: (host != last_good, -stats[host].success_rate),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lookups.clear()
+            self._stats.clear()
+
+
+_cache: CdnHostCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_radiojavan_host_cache() -> CdnHostCache:
+    """Get the process-wide host cache shared by all RadioJavan downloads."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        if _cache is None:
+            _cache = CdnHostCache()
+        return _cache
+
+
+def reset_radiojavan_host_cache() -> None:
+    """Drop the process-wide cache so the next use rereads the config (tests)."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        _cache = None
@@ -8,6 +8,8 @@ import yt_dlp
 
 from src.core.config import AppConfig, get_config
 from src.core.interfaces import BaseDownloader, IErrorNotifier, IFileService
+from src.services.downloads import ytdlp_cancel_hook
+from src.services.network.bandwidth import get_bandwidth_scheduler
 
 from ...utils.logger import get_logger
 
@@ -204,7 +206,12 @@ class SoundCloudDownloader(BaseDownloader):
             # Strip extension from save_path to avoid double-extension (e.g. track.mp3.mp3)
             stem = os.path.splitext(save_path)[0]
             options["outtmpl"] = f"{stem}.%(ext)s"
-            options["progress_hooks"] = [progress_hook]
+            options["progress_hooks"] = [
+                ytdlp_cancel_hook(),
+                get_bandwidth_scheduler().ytdlp_hook(),
+                progress_hook,
+            ]
+            options["postprocessor_hooks"] = [ytdlp_cancel_hook()]
 
             with yt_dlp.YoutubeDL(cast(Any, options)) as ydl:
                 logger.info("[SOUNDCLOUD_DOWNLOADER] Extracting info...")
@@ -1,3 +1,5 @@
+from .cache import SpotifyCache, get_spotify_cache
 from .downloader import SpotifyDownloader
+from .matcher import TrackMatcher
 
-__all__ = ["SpotifyDownloader"]
+__all__ = ["SpotifyCache", "SpotifyDownloader", "TrackMatcher", "get_spotify_cache"]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from src.core.config import AppConfig, get_config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Namespaces used by SpotifyDownloader.
+OEMBED = "oembed"
+TRACKS = "tracks"
+SEARCH = "search"
+MATCH = "match"
+
+
+def normalize_query(artist: str, track: str) -> str:
+    """Cache key for a YouTube search, insensitive to case and spacing."""
+    return "|".join(" ".join(part.casefold().split()) for part in (artist, track))
+
+
+class SpotifyCache:
+    """Size-bounded LRU of Spotify lookups with a TTL, persisted as one JSON file.
+
+    Entries are grouped by namespace: oEmbed metadata and scraped track lists are
+    keyed by Spotify ID, YouTube search results by :func:`normalize_query`, and the
+    YouTube URL chosen for a track by its Spotify ID. The file is rewritten after
+    each change; eviction keeps it at ``spotify.cache_max_entries`` entries.
+    """
+
+    def __init__(self, path: Path | None = None, config: AppConfig | None = None) -> None:
+        self.config = config or get_config()
+        self.path = Path(path or self.config.paths.spotify_cache_file)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._loaded = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.spotify.cache_ttl > 0
+
+    def get(self, namespace: str, key: str | None) -> Any | None:
+        """Return a copy of a live entry, or None."""
+        if not key or not self.enabled:
+            return None
+
+        entry_key = f"{namespace}:{key}"
+        with self._lock:
+            self._load()
+            if (entry := self._entries.get(entry_key)) is None:
+                return None
+            expires_at, value = entry
+            if time.time() >= expires_at:
+                del self._entries[entry_key]
+                return None
+            self._entries.move_to_end(entry_key)
+
+        logger.debug(f"[SPOTIFY_CACHE] Hit for {entry_key}")
+        return copy.deepcopy(value)
+
+    def put(self, namespace: str, key: str | None, value: Any) -> None:
+        """Store ``value`` and persist the cache."""
+        if not key or not self.enabled:
+            return
+
+        entry_key = f"{namespace}:{key}"
+        with self._lock:
+            self._load()
+            self._entries[entry_key] = (
+                time.time() + self.config.spotify.cache_ttl,
+                copy.deepcopy(value),
+            )
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > max(1, self.config.spotify.cache_max_entries):
+                self._entries.popitem(last=False)
+            self._save()
+
+    def clear(self) -> None:
+        """Drop every entry and the file."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            with contextlib.suppress(OSError):
+                self.path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                records = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"[SPOTIFY_CACHE] Ignoring unreadable cache file: {e}")
+            return
+
+        now = time.time()
+        with contextlib.suppress(TypeError, ValueError):
+            for entry_key, expires_at, value in records:
+                if float(expires_at) > now:
+                    self._entries[str(entry_key)] = (float(expires_at), value)
+
+    def _save(self) -> None:
+        records = [[key, expires_at, value] for key, (expires_at, value) in self._entries.items()]
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, default=str)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"[SPOTIFY_CACHE] Failed to persist cache: {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+
+_cache: SpotifyCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_spotify_cache() -> SpotifyCache:
+    """Get the process-wide cache shared by the dialog and the downloader."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        if _cache is None:
+            _cache = SpotifyCache()
+        return _cache
+
+
+def reset_spotify_cache() -> None:
+    """Drop the process-wide cache so the next use rereads the config (tests)."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        _cache = None
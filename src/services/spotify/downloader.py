@@ -1,6 +1,7 @@
 import re
+import threading
 from collections.abc import Callable
-from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import requests
@@ -18,8 +19,12 @@ from src.core.interfaces import (
 
 from ...utils.logger import get_logger
 from ..youtube.downloader import YouTubeDownloader
+from ..youtube.info_cache import extract_video_id
+from .cache import MATCH, OEMBED, SEARCH, TRACKS, SpotifyCache, get_spotify_cache, normalize_query
+from .matcher import TrackMatcher, profile_title, similarity
 
 logger = get_logger(__name__)
+_DURATION_RE = re.compile(r"\b(?:(\d+):)?(\d{1,2}):([0-5]\d)\b")
 _REQUEST_EXCEPTION = (
     requests.exceptions.RequestException
     if isinstance(getattr(requests, "exceptions", None), object)
@@ -44,6 +49,10 @@ class SpotifyDownloader(BaseDownloader):
     3. Searches YouTube for each track
     4. Returns search results for user selection
     5. Downloads selected YouTube video using YouTubeDownloader
+
+    oEmbed metadata, track lists, searches and chosen matches go through the
+    shared :class:`SpotifyCache`, so the dialog's lookups are reused by the
+    download and by later re-queues.
     """
 
     def __init__(
@@ -54,12 +63,15 @@ class SpotifyDownloader(BaseDownloader):
         cookie_handler: ICookieHandler | None = None,
         auto_cookie_manager: IAutoCookieManager | None = None,
         spotify_cookie_manager: Any = None,
+        cache: SpotifyCache | None = None,
     ) -> None:
         super().__init__(error_handler, file_service, config)
+        self.cache = cache or get_spotify_cache()
         self.default_timeout = config.spotify.default_timeout
         self.oembed_timeout = config.spotify.oembed_timeout
         self.max_search_results = config.spotify.max_search_results
         self.min_similarity_threshold = config.spotify.min_similarity_threshold
+        self.matcher = TrackMatcher(self.min_similarity_threshold)
         self.cookie_handler = cookie_handler
         self.auto_cookie_manager = auto_cookie_manager
         self.spotify_cookie_manager = spotify_cookie_manager
@@ -110,6 +122,10 @@ class SpotifyDownloader(BaseDownloader):
         Returns:
             Dictionary with metadata (title, thumbnail, type, id)
         """
+        spotify_id = self._extract_spotify_id(url)
+        if cached := self.cache.get(OEMBED, spotify_id):
+            return {**cached, "original_url": url}
+
         try:
             oembed_url = f"https://open.spotify.com/oembed?url={url}"
 
@@ -125,13 +141,15 @@ class SpotifyDownloader(BaseDownloader):
                     response.raise_for_status()
                     data = response.json()
 
-                    return {
+                    metadata = {
                         "title": data.get("title", "Unknown"),
                         "type": self._detect_url_type(url),
                         "thumbnail": data.get("thumbnail_url", ""),
                         "original_url": url,
-                        "id": self._extract_spotify_id(url),
+                        "id": spotify_id,
                     }
+                    self.cache.put(OEMBED, spotify_id, metadata)
+                    return metadata
                 except _TIMEOUT_EXCEPTION:
                     logger.warning(f"[SPOTIFY_DOWNLOADER] OEmbed timeout, attempt {attempt + 1}/3")
                     if attempt < 2:
@@ -193,15 +211,30 @@ class SpotifyDownloader(BaseDownloader):
 
         return "", title
 
-    def _scrape_playlist_tracks(self, url: str) -> list[dict[str, str]]:
+    @staticmethod
+    def _parse_duration(text: Any) -> int | None:
+        """Parse the last ``m:ss`` or ``h:mm:ss`` duration in a track row, in seconds."""
+        if not isinstance(text, str):
+            return None
+        if not (matches := _DURATION_RE.findall(text)):
+            return None
+        hours, minutes, seconds = matches[-1]
+        return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
+    def _scrape_playlist_tracks(self, url: str) -> list[dict[str, Any]]:
         """Scrape track list from Spotify playlist/album page.
 
         Args:
             url: Spotify playlist/album URL
 
         Returns:
-            List of track dictionaries with 'title' and 'position'
+            List of track dictionaries with 'title', 'position' and, when the
+            row shows one, 'duration' in seconds
         """
+        spotify_id = self._extract_spotify_id(url)
+        if (cached := self.cache.get(TRACKS, spotify_id)) is not None:
+            return cached
+
         try:
             logger.info(f"[SPOTIFY_DOWNLOADER] Scraping tracks from: {url}")
 
@@ -226,17 +259,20 @@ class SpotifyDownloader(BaseDownloader):
                     if not (track_name := track_element.get_text(strip=True)):
                         continue
 
-                    tracks.append(
-                        {
-                            "title": track_name,
-                            "position": i + 1,
-                        }
-                    )
+                    track_data: dict[str, Any] = {
+                        "title": track_name,
+                        "position": i + 1,
+                    }
+                    if duration := self._parse_duration(row.get_text(" ", strip=True)):
+                        track_data["duration"] = duration
+                    tracks.append(track_data)
                 except Exception as e:
                     logger.warning(f"[SPOTIFY_DOWNLOADER] Error parsing track row {i}: {e}")
                     continue
 
             logger.info(f"[SPOTIFY_DOWNLOADER] Scraped {len(tracks)} tracks")
+            if tracks:
+                self.cache.put(TRACKS, spotify_id, tracks)
             return tracks
 
         except _REQUEST_EXCEPTION as e:
@@ -262,6 +298,10 @@ class SpotifyDownloader(BaseDownloader):
         Returns:
             List of YouTube search results
         """
+        search_key = f"{self.max_search_results}:{normalize_query(artist, track)}"
+        if (cached := self.cache.get(SEARCH, search_key)) is not None:
+            return cached
+
         try:
             max_results = self.max_search_results
             query_format = self.config.spotify.youtube_search_format
@@ -282,7 +322,10 @@ class SpotifyDownloader(BaseDownloader):
                         }
                     ) as ydl:
                         results = ydl.extract_info(query, download=False)
-                        return list(results.get("entries", []))  # type: ignore[arg-type]
+                        entries = list(results.get("entries", []))  # type: ignore[arg-type]
+                        if entries:
+                            self.cache.put(SEARCH, search_key, entries)
+                        return entries
                 except Exception as e:
                     if attempt < 2:
                         logger.warning(
@@ -308,68 +351,25 @@ class SpotifyDownloader(BaseDownloader):
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        spotify_lower = spotify_track.lower()
-        youtube_lower = youtube_title.lower()
-
-        common_words = {
-            "official",
-            "video",
-            "music",
-            "audio",
-            "lyrics",
-            "hd",
-            "remix",
-            "live",
-            "version",
-            "feat",
-            "ft",
-        }
-
-        spotify_words = [w for w in spotify_lower.split() if w not in common_words]
-        youtube_words = [w for w in youtube_lower.split() if w not in common_words]
-
-        if not spotify_words or not youtube_words:
-            return 0.0
-
-        matcher = SequenceMatcher(None, " ".join(spotify_words), " ".join(youtube_words))
-        return matcher.ratio()
+        return similarity(profile_title(spotify_track), profile_title(youtube_title))
 
     def _select_best_match(
-        self, spotify_track: str, search_results: list[dict[str, Any]]
+        self,
+        spotify_track: str,
+        search_results: list[dict[str, Any]],
+        duration: float | None = None,
     ) -> dict[str, Any] | None:
         """Select best YouTube match based on similarity score.
 
         Args:
             spotify_track: Spotify track name
             search_results: YouTube search results
+            duration: Optional Spotify track duration in seconds
 
         Returns:
             Best matching YouTube result or None
         """
-        threshold = self.min_similarity_threshold
-        best_match = None
-        best_score = 0.0
-
-        for result in search_results:
-            youtube_title = result.get("title", "")
-            score = self._calculate_similarity(spotify_track, youtube_title)
-
-            youtube_lower = youtube_title.lower()
-
-            if "official" in youtube_lower:
-                score += 0.1
-
-            if "audio" in youtube_lower:
-                score += 0.05
-
-            if "music" in youtube_lower:
-                score += 0.05
-
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = result
-
-        return best_match
+        return self.matcher.best_match(spotify_track, search_results, duration)
 
     def get_metadata(self, url: str) -> dict[str, Any]:
         """Get Spotify metadata for URL.
@@ -400,6 +400,64 @@ class SpotifyDownloader(BaseDownloader):
         """
         return self._search_youtube(artist, track)
 
+    def search_tracks(
+        self,
+        tracks: list[dict[str, Any]],
+        on_result: Callable[[dict[str, Any]], None] | None = None,
+        cancel_event: threading.Event | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Search YouTube for many tracks concurrently.
+
+        Each track dict gets ``youtube_results`` and ``best_match`` filled in and is
+        passed to ``on_result`` as soon as its search finishes. Tracks not yet
+        started when ``cancel_event`` is set are skipped.
+
+        Args:
+            tracks: Track dicts with a 'title' key, updated in place
+            on_result: Optional callback invoked on the calling thread per track
+            cancel_event: Optional event that stops the remaining searches
+            max_workers: Searches in flight; defaults to spotify.search_concurrency
+        """
+        if not tracks:
+            return
+
+        width = max(1, max_workers or self.config.spotify.search_concurrency)
+        cancel_event = cancel_event or threading.Event()
+
+        def search(track_data: dict[str, Any]) -> dict[str, Any] | None:
+            if cancel_event.is_set():
+                return None
+            artist, track = self._parse_artist_track(track_data.get("title", ""))
+            results = self._search_youtube(artist, track)
+            track_data["youtube_results"] = results
+            track_data["best_match"] = (
+                self._select_best_match(track, results, track_data.get("duration"))
+                if results
+                else None
+            )
+            return track_data
+
+        with ThreadPoolExecutor(max_workers=width, thread_name_prefix="SpotifySearch") as pool:
+            futures = [pool.submit(search, track_data) for track_data in tracks]
+            for future in as_completed(futures):
+                if (track_data := future.result()) is None or cancel_event.is_set():
+                    continue
+                if on_result:
+                    try:
+                        on_result(track_data)
+                    except Exception as e:
+                        logger.warning(f"[SPOTIFY_DOWNLOADER] Search result callback failed: {e}")
+
+    def remember_match(self, spotify_url: str, result: dict[str, Any]) -> None:
+        """Record the YouTube result chosen for a Spotify track.
+
+        A later download of the same Spotify URL goes straight to this video
+        instead of searching again.
+        """
+        if youtube_url := self._extract_youtube_url(result):
+            self.cache.put(MATCH, self._extract_spotify_id(spotify_url), youtube_url)
+
     @staticmethod
     def _extract_youtube_url(result: dict[str, Any]) -> str | None:
         """Extract a playable YouTube URL from a search result entry."""
@@ -424,6 +482,15 @@ class SpotifyDownloader(BaseDownloader):
         progress_callback: Callable[[float, float], None] | None = None,
     ) -> bool:
         """Download Spotify track by matching and downloading from YouTube."""
+        if self._detect_url_type(url) == "unknown" and extract_video_id(url):
+            # The dialog already picked this YouTube match.
+            return self._download_from_youtube(url, save_path, progress_callback)
+
+        spotify_id = self._extract_spotify_id(url)
+        if youtube_url := self.cache.get(MATCH, spotify_id):
+            logger.info("[SPOTIFY_DOWNLOADER] Using remembered YouTube match: %s", youtube_url)
+            return self._download_from_youtube(youtube_url, save_path, progress_callback)
+
         metadata = self._extract_spotify_metadata(url)
         title = str(metadata.get("title", "")).strip()
 
@@ -459,7 +526,16 @@ class SpotifyDownloader(BaseDownloader):
             "[SPOTIFY_DOWNLOADER] Matched Spotify track to YouTube URL: %s",
             youtube_url,
         )
+        self.cache.put(MATCH, spotify_id, youtube_url)
+        return self._download_from_youtube(youtube_url, save_path, progress_callback)
 
+    def _download_from_youtube(
+        self,
+        youtube_url: str,
+        save_path: str,
+        progress_callback: Callable[[float, float], None] | None,
+    ) -> bool:
+        """Download the matched YouTube video as audio."""
         try:
             yt_downloader = YouTubeDownloader(
                 quality="lowest",
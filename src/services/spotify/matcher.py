@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+# Words that say nothing about which song a title refers to.
+NOISE_WORDS = frozenset(
+    {
+        "official",
+        "video",
+        "music",
+        "audio",
+        "lyrics",
+        "hd",
+        "remix",
+        "live",
+        "version",
+        "feat",
+        "ft",
+    }
+)
+
+# Bonuses for words that usually mark the studio recording.
+_KEYWORD_BONUSES = (("official", 0.1), ("audio", 0.05), ("music", 0.05))
+
+# A candidate within this many seconds of the Spotify duration is rewarded; one
+# off by more than the larger of the two mismatch limits is penalised.
+_DURATION_TOLERANCE_SECONDS = 5.0
+_DURATION_MISMATCH_SECONDS = 15.0
+_DURATION_MISMATCH_RATIO = 0.1
+_DURATION_BONUS = 0.1
+_DURATION_PENALTY = 0.25
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, slots=True)
+class TitleProfile:
+    """Normalized form of a title, built once and reused for every comparison."""
+
+    tokens: frozenset[str]
+    trigrams: dict[str, int]
+    norm: float
+    bonus: float
+    duration: float | None = None
+
+
+@lru_cache(maxsize=4096)
+def profile_title(title: str, duration: float | None = None) -> TitleProfile:
+    """Tokenize ``title`` and count its character trigrams.
+
+    Profiles are memoized, so a video returned for several tracks of an album is
+    only normalized once.
+    """
+    words = _TOKEN_RE.findall(title.casefold())
+    tokens = [w for w in words if w not in NOISE_WORDS]
+
+    trigrams = Counter(
+        padded[i : i + 3] for padded in (f" {t} " for t in tokens) for i in range(len(padded) - 2)
+    )
+
+    present = set(words)
+    return TitleProfile(
+        tokens=frozenset(tokens),
+        trigrams=dict(trigrams),
+        norm=math.sqrt(sum(count * count for count in trigrams.values())),
+        bonus=sum(bonus for word, bonus in _KEYWORD_BONUSES if word in present),
+        duration=float(duration) if duration else None,
+    )
+
+
+def similarity(query: TitleProfile, candidate: TitleProfile) -> float:
+    """Blend of token Jaccard and character-trigram cosine, from 0.0 to 1.0."""
+    if not query.tokens or not candidate.tokens:
+        return 0.0
+
+    jaccard = len(query.tokens & candidate.tokens) / len(query.tokens | candidate.tokens)
+
+    small, large = sorted((query.trigrams, candidate.trigrams), key=len)
+    dot = sum(count * large.get(gram, 0) for gram, count in small.items())
+    cosine = dot / (query.norm * candidate.norm)
+
+    return (jaccard + cosine) / 2
+
+
+def _duration_adjustment(expected: float | None, actual: float | None) -> float:
+    if not expected or not actual:
+        return 0.0
+    difference = abs(expected - actual)
+    if difference <= _DURATION_TOLERANCE_SECONDS:
+        return _DURATION_BONUS
+    if difference > max(_DURATION_MISMATCH_SECONDS, expected * _DURATION_MISMATCH_RATIO):
+        return -_DURATION_PENALTY
+    return 0.0
+
+
+def _as_seconds(value: Any) -> float | None:
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
+
+
+class TrackMatcher:
+    """Scores YouTube search entries against Spotify tracks.
+
+    The Spotify side is profiled once per track and each entry once per title,
+    so ranking a search page is a set intersection and a sparse dot product per
+    candidate. Entries carrying a ``duration`` are rewarded or penalised against
+    the track's duration when it is known.
+    """
+
+    def __init__(self, threshold: float = 0.5) -> None:
+        self.threshold = threshold
+
+    def score_all(
+        self,
+        query: str,
+        results: Sequence[dict[str, Any]],
+        duration: float | None = None,
+    ) -> list[float]:
+        """Score every search entry against one track."""
+        track = profile_title(query, _as_seconds(duration))
+        scores: list[float] = []
+        for result in results:
+            candidate = profile_title(
+                str(result.get("title") or ""), _as_seconds(result.get("duration"))
+            )
+            scores.append(
+                similarity(track, candidate)
+                + candidate.bonus
+                + _duration_adjustment(track.duration, candidate.duration)
+            )
+        return scores
+
+    def best_match(
+        self,
+        query: str,
+        results: Sequence[dict[str, Any]],
+        duration: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Highest-scoring entry at or above the threshold, or None."""
+        best_match = None
+        best_score = 0.0
+        for result, score in zip(results, self.score_all(query, results, duration), strict=True):
+            if score > best_score and score >= self.threshold:
+                best_score = score
+                best_match = result
+        return best_match
+
+    def match_batch(
+        self,
+        items: Iterable[tuple[str, Sequence[dict[str, Any]], float | None]],
+    ) -> list[dict[str, Any] | None]:
+        """Best match for each ``(query, results, duration)`` item, in order."""
+        return [self.best_match(query, results, duration) for query, results, duration in items]
@@ -1,7 +1,9 @@
 import json
 import os
 import re
+import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
 import requests
@@ -11,8 +13,10 @@ from src.core.interfaces import BaseDownloader, IErrorNotifier, IFileService
 
 from ...core.enums import ServiceType
 from ...utils.logger import get_logger
+from ..downloads import fetch_concurrently, split_progress
 from ..file.service import FileService
-from ..network.checker import check_site_connection
+from ..network.checker import check_site_connection, invalidate_site_connection
+from .endpoints import EndpointScoreboard, get_twitter_endpoint_scoreboard
 
 logger = get_logger(__name__)
 
@@ -23,6 +27,7 @@ class TwitterDownloader(BaseDownloader):
         error_handler: IErrorNotifier | None = None,
         file_service: IFileService | None = None,
         config: AppConfig = get_config(),
+        scoreboard: EndpointScoreboard | None = None,
     ) -> None:
         """Initialize Twitter downloader.
 
@@ -30,9 +35,11 @@ class TwitterDownloader(BaseDownloader):
             error_handler: Optional error handler for user notifications
             file_service: Optional file service for file operations
             config: AppConfig instance (defaults to global app config)
+            scoreboard: Tweet API endpoint health (defaults to the shared one)
         """
         super().__init__(error_handler, file_service, config)
         self.file_service = file_service or FileService()
+        self.scoreboard = scoreboard or get_twitter_endpoint_scoreboard()
 
     def download(
         self,
@@ -68,14 +75,19 @@ class TwitterDownloader(BaseDownloader):
                     self.error_handler.handle_service_failure("Twitter", "download", error_msg, url)
                 return False
 
+            tweets = fetch_concurrently(
+                tweet_refs, lambda ref: self._scrape_tweet_data(ref[1], ref[0]), self.config
+            )
+            tweet_callbacks = split_progress(progress_callback, len(tweet_refs))
+
             success = False
-            for i, (username, tweet_id) in enumerate(tweet_refs):
-                if not (tweet_data := self._scrape_tweet_data(tweet_id, username)):
+            for i, tweet_data in enumerate(tweets):
+                if not tweet_data:
                     continue
 
                 save_name = f"{save_path}_{i}" if len(tweet_refs) > 1 else save_path
                 media_success = self._download_media(
-                    tweet_data.get("media", []), save_name, progress_callback
+                    tweet_data.get("media", []), save_name, tweet_callbacks[i]
                 )
                 artifact_success = self._save_tweet_artifacts(save_name, tweet_data)
 
@@ -83,6 +95,7 @@ class TwitterDownloader(BaseDownloader):
                     success = True
 
             if not success:
+                invalidate_site_connection(ServiceType.TWITTER)
                 error_msg = "Failed to download media from tweet"
                 if self.error_handler:
                     self.error_handler.handle_service_failure("Twitter", "download", error_msg, url)
@@ -90,6 +103,7 @@ class TwitterDownloader(BaseDownloader):
             return success
 
         except Exception as e:
+            invalidate_site_connection(ServiceType.TWITTER)
             logger.error(f"Error downloading from Twitter: {e!s}", exc_info=True)
             if self.error_handler:
                 self.error_handler.handle_exception(e, "Twitter download", "Twitter")
@@ -137,55 +151,29 @@ class TwitterDownloader(BaseDownloader):
         return [(username, tweet_id) for tweet_id, username in refs_by_id.items()]
 
     def _scrape_tweet_data(self, tweet_id: str, username: str | None = None) -> dict | None:
-        """Scrape tweet data including media and text from FixTweet/VX endpoints."""
-        endpoints: list[str] = []
+        """Scrape tweet data including media and text from FixTweet/VX endpoints.
+
+        Endpoints are tried best first according to the shared scoreboard. When
+        ``network.twitter_hedge_delay`` is set and the current endpoint has not
+        answered by then, the next one is asked as well and the first usable
+        answer wins.
+        """
+        endpoints: dict[str, str] = {}
         if username:
-            endpoints.append(f"https://api.fxtwitter.com/{username}/status/{tweet_id}")
-        endpoints.extend(
-            [
-                f"https://api.fxtwitter.com/status/{tweet_id}",
-                f"https://api.vxtwitter.com/Twitter/status/{tweet_id}",
-                f"https://api.vxtwitter.com/status/{tweet_id}",
-            ]
-        )
+            endpoints["fxtwitter_user"] = f"https://api.fxtwitter.com/{username}/status/{tweet_id}"
+        endpoints["fxtwitter"] = f"https://api.fxtwitter.com/status/{tweet_id}"
+        endpoints["vxtwitter_user"] = f"https://api.vxtwitter.com/Twitter/status/{tweet_id}"
+        endpoints["vxtwitter"] = f"https://api.vxtwitter.com/status/{tweet_id}"
+        ranked = self.scoreboard.rank(list(endpoints))
 
-        headers = {"User-Agent": self.config.network.user_agent}
         try:
-            for endpoint in endpoints:
-                try:
-                    response = requests.get(
-                        endpoint,
-                        headers=headers,
-                        verify=True,
-                        timeout=self.config.network.twitter_api_timeout,
-                    )
-                    response.raise_for_status()
-                except requests.exceptions.HTTPError:
-                    logger.debug("[TWITTER_DOWNLOADER] Endpoint returned HTTP error: %s", endpoint)
-                    continue
-
-                content_type = response.headers.get("content-type", "")
-                match content_type:
-                    case value if "application/json" in value:
-                        data = response.json()
-                        if not (tweet_data := self._select_tweet_payload(data)):
-                            continue
-
-                        media = self._normalize_media(tweet_data)
-                        return {
-                            "media": media,
-                            "text": str(tweet_data.get("text", "")).strip(),
-                            "raw": tweet_data,
-                        }
-                    case value if "text/html" in value:
-                        if "Failed to scan your link" in response.text:
-                            logger.warning(
-                                "[TWITTER_DOWNLOADER] vxTwitter API is currently unavailable "
-                                "for this tweet (upstream API limitation)"
-                            )
-                        continue
-                    case _:
-                        continue
+            hedge_delay = self.config.network.twitter_hedge_delay
+            if hedge_delay <= 0:
+                for name in ranked:
+                    if tweet := self._fetch_tweet_endpoint(name, endpoints[name]):
+                        return tweet
+            elif tweet := self._fetch_tweet_hedged(ranked, endpoints, hedge_delay):
+                return tweet
 
             logger.warning(
                 "[TWITTER_DOWNLOADER] No usable JSON response from configured tweet API endpoints"
@@ -197,6 +185,72 @@ class TwitterDownloader(BaseDownloader):
                 self.error_handler.handle_exception(e, f"Scraping tweet {tweet_id}", "Twitter")
             return None
 
+    def _fetch_tweet_hedged(
+        self, ranked: list[str], endpoints: dict[str, str], hedge_delay: float
+    ) -> dict | None:
+        """Race endpoints in rank order, starting the next one after ``hedge_delay``."""
+        remaining = list(ranked)
+        pool = ThreadPoolExecutor(max_workers=len(remaining), thread_name_prefix="TweetAPI")
+        in_flight: set[Future[dict | None]] = set()
+        try:
+            while remaining or in_flight:
+                if remaining:
+                    name = remaining.pop(0)
+                    in_flight.add(pool.submit(self._fetch_tweet_endpoint, name, endpoints[name]))
+                # Wait for an answer, but not past the hedge delay while spares remain.
+                done, in_flight = wait(
+                    in_flight,
+                    timeout=hedge_delay if remaining else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if tweet := future.result():
+                        return tweet
+            return None
+        finally:
+            # A slower endpoint still finishes in the background and is scored.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_tweet_endpoint(self, name: str, endpoint: str) -> dict | None:
+        """Ask one endpoint for the tweet and record the outcome on the scoreboard."""
+        started = time.monotonic()
+        tweet = None
+        try:
+            response = requests.get(
+                endpoint,
+                headers={"User-Agent": self.config.network.user_agent},
+                verify=True,
+                timeout=self.config.network.twitter_api_timeout,
+            )
+            response.raise_for_status()
+            tweet = self._parse_tweet_response(response)
+        except requests.exceptions.RequestException as e:
+            logger.debug("[TWITTER_DOWNLOADER] Endpoint %s failed: %s", endpoint, e)
+        finally:
+            self.scoreboard.record(name, tweet is not None, time.monotonic() - started)
+        return tweet
+
+    def _parse_tweet_response(self, response: requests.Response) -> dict | None:
+        content_type = response.headers.get("content-type", "")
+        match content_type:
+            case value if "application/json" in value:
+                if not (tweet_data := self._select_tweet_payload(response.json())):
+                    return None
+                return {
+                    "media": self._normalize_media(tweet_data),
+                    "text": str(tweet_data.get("text", "")).strip(),
+                    "raw": tweet_data,
+                }
+            case value if "text/html" in value:
+                if "Failed to scan your link" in response.text:
+                    logger.warning(
+                        "[TWITTER_DOWNLOADER] vxTwitter API is currently unavailable "
+                        "for this tweet (upstream API limitation)"
+                    )
+                return None
+            case _:
+                return None
+
     def _save_tweet_artifacts(self, save_path: str, tweet_data: dict[str, Any]) -> bool:
         """Persist scraped tweet text/JSON for reliability when media CDNs are blocked."""
         base_name = os.path.basename(save_path)
@@ -323,50 +377,61 @@ class TwitterDownloader(BaseDownloader):
         save_path: str,
         progress_callback: Callable[[float, float], None] | None = None,
     ) -> bool:
-        """Download media files from tweet media data."""
-        success = False
-
-        for i, item in enumerate(media):
-            try:
-                if not (url := item.get("url")):
-                    continue
-
-                match item.get("type"):
-                    case "video" | "animated_gif" | "gif":
-                        ext = ".mp4"
-                    case "photo":
-                        ext = ".jpg"
-                    case _:
-                        ext = ".bin"
-
-                if len(media) > 1:
-                    filename = self.file_service.sanitize_filename(
-                        f"{os.path.basename(save_path)}_{i}{ext}"
-                    )
-                else:
-                    filename = self.file_service.sanitize_filename(
-                        f"{os.path.basename(save_path)}{ext}"
-                    )
+        """Download media files from tweet media data, several items at once."""
+        callbacks = split_progress(progress_callback, len(media))
+        results = fetch_concurrently(
+            list(enumerate(media)),
+            lambda entry: self._download_media_item(
+                entry[0], entry[1], save_path, len(media), callbacks[entry[0]]
+            ),
+            self.config,
+        )
+        return any(results)
 
-                full_path = os.path.join(os.path.dirname(save_path), filename)
+    def _download_media_item(
+        self,
+        index: int,
+        item: dict,
+        save_path: str,
+        count: int,
+        progress_callback: Callable[[float, float], None] | None,
+    ) -> bool:
+        try:
+            if not (url := item.get("url")):
+                return False
 
-                file_service = self.file_service if self.file_service else FileService()
-                if (
-                    (
-                        result := file_service.download_file(url, full_path, progress_callback)
-                    ).success
-                    and os.path.exists(full_path)
-                    and os.path.getsize(full_path) > 0
-                ):
-                    success = True
-                elif result.success:
-                    logger.warning(
-                        f"[TWITTER_DOWNLOADER] Download reported success but file is missing/empty: {full_path}"
-                    )
-            except Exception as e:
-                logger.error(f"Error downloading media item {i}: {e!s}", exc_info=True)
-                if self.error_handler:
-                    self.error_handler.handle_exception(e, f"Downloading media item {i}", "Twitter")
-                continue
+            match item.get("type"):
+                case "video" | "animated_gif" | "gif":
+                    ext = ".mp4"
+                case "photo":
+                    ext = ".jpg"
+                case _:
+                    ext = ".bin"
+
+            if count > 1:
+                filename = self.file_service.sanitize_filename(
+                    f"{os.path.basename(save_path)}_{index}{ext}"
+                )
+            else:
+                filename = self.file_service.sanitize_filename(
+                    f"{os.path.basename(save_path)}{ext}"
+                )
 
-        return success
+            full_path = os.path.join(os.path.dirname(save_path), filename)
+
+            file_service = self.file_service if self.file_service else FileService()
+            if (
+                (result := file_service.download_file(url, full_path, progress_callback)).success
+                and os.path.exists(full_path)
+                and os.path.getsize(full_path) > 0
+            ):
+                return True
+            if result.success:
+                logger.warning(
+                    f"[TWITTER_DOWNLOADER] Download reported success but file is missing/empty: {full_path}"
+                )
+        except Exception as e:
+            logger.error(f"Error downloading media item {index}: {e!s}", exc_info=True)
+            if self.error_handler:
+                self.error_handler.handle_exception(e, f"Downloading media item {index}", "Twitter")
+        return False
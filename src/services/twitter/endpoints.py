@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+# Weight of the newest sample in the per-endpoint latency average.
+_LATENCY_SMOOTHING = 0.3
+
+
+@dataclass
+class _EndpointStats:
+    successes: int = 0
+    failures: int = 0
+    latency: float | None = None
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace smoothing: an untried endpoint ranks between good and bad ones.
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+
+class EndpointScoreboard:
+    """Tracks how well each FixTweet/vxTwitter API endpoint has been answering.
+
+    Endpoints are keyed by name (``fxtwitter``, ``vxtwitter`` ...) rather than
+    URL, so what one tweet teaches applies to the next. :meth:`rank` orders them
+    by success rate, in steps of 0.1 so a single miss does not demote a fast
+    mirror, then by smoothed latency of successful answers.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, _EndpointStats] = {}
+
+    def record(self, name: str, success: bool, latency: float | None = None) -> None:
+        """Count one attempt; ``latency`` is only kept for successful answers."""
+        with self._lock:
+            stats = self._stats.setdefault(name, _EndpointStats())
+            if not success:
+                stats.failures += 1
+                return
+            stats.successes += 1
+            if latency is not None:
+                stats.latency = (
+                    latency
+                    if stats.latency is None
+                    else stats.latency + _LATENCY_SMOOTHING * (latency - stats.latency)
+                )
+
+    def rank(self, names: list[str]) -> list[str]:
+        """Order ``names`` best first; ties keep their original order."""
+        with self._lock:
+            stats = {name: self._stats.get(name, _EndpointStats()) for name in names}
+
+        def key(name: str) -> tuple[float, float]:
+            latency = stats[name].latency
+            return (-round(stats[name].success_rate, 1), latency if latency is not None else 0.0)
+
+        return sorted(names, key=key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_scoreboard: EndpointScoreboard | None = None
+_scoreboard_lock = threading.Lock()
+
+
+def get_twitter_endpoint_scoreboard() -> EndpointScoreboard:
+    """Get the process-wide scoreboard shared by all Twitter downloads."""
+    global _scoreboard  # noqa: PLW0603
+    with _scoreboard_lock:
+        if _scoreboard is None:
+            _scoreboard = EndpointScoreboard()
+        return _scoreboard
+
+
+def reset_twitter_endpoint_scoreboard() -> None:
+    """Forget every endpoint's history (tests)."""
+    global _scoreboard  # noqa: PLW0603
+    with _scoreboard_lock:
+        _scoreboard = None
@@ -1,5 +1,6 @@
 from .downloader import YouTubeDownloader
 from .error_handler import YouTubeErrorBucket, YouTubeErrorHandler
+from .info_cache import YouTubeInfoCache, get_youtube_info_cache
 from .info_extractor import YouTubeInfoExtractor
 from .metadata_service import YouTubeMetadataService
 from .subtitle_extractor import YouTubeSubtitleExtractor
@@ -8,7 +9,9 @@ __all__ = [
     "YouTubeDownloader",
     "YouTubeErrorBucket",
     "YouTubeErrorHandler",
+    "YouTubeInfoCache",
     "YouTubeInfoExtractor",
     "YouTubeMetadataService",
     "YouTubeSubtitleExtractor",
+    "get_youtube_info_cache",
 ]
@@ -1,8 +1,10 @@
 import os
 import subprocess
+import time
 
 from src.core.config import AppConfig, get_config
 from src.core.interfaces import IErrorNotifier
+from src.services.downloads import DownloadCancelledError, current_token, raise_if_cancelled
 from src.utils.ffmpeg import get_ffmpeg_path
 from src.utils.logger import get_logger
 
@@ -57,7 +59,27 @@ class AudioExtractor:
                 output_path,
             ]
 
-        return subprocess.run(cmd, check=False, capture_output=True, text=True, timeout=300)
+        return self._run_cancellable(cmd, timeout=300)
+
+    @staticmethod
+    def _run_cancellable(cmd: list[str], timeout: float) -> subprocess.CompletedProcess[str]:
+        """Run ``cmd`` like ``subprocess.run``, killing it if the download is cancelled."""
+        token = current_token()
+        deadline = time.monotonic() + timeout
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ) as proc:
+            while True:
+                try:
+                    stdout, stderr = proc.communicate(timeout=0.5)
+                    break
+                except subprocess.TimeoutExpired:
+                    if (token and token.is_set) or time.monotonic() > deadline:
+                        proc.kill()
+                        proc.communicate()
+                        raise_if_cancelled(token)
+                        raise subprocess.TimeoutExpired(cmd, timeout) from None
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
 
     def _handle_extraction_error(self, error_type: str, message: str) -> bool:
         """Handle extraction errors.
@@ -109,6 +131,9 @@ class AudioExtractor:
         Returns:
             False (always fails)
         """
+        if isinstance(e, DownloadCancelledError):
+            logger.info("[AUDIO_EXTRACTOR] Extraction stopped: download cancelled")
+            return False
         if isinstance(e, subprocess.TimeoutExpired):
             return self._handle_extraction_error(
                 "Audio Extraction Timeout", "Audio extraction took too long and was cancelled."
@@ -13,6 +13,8 @@ import yt_dlp
 
 from src.core.config import AppConfig, get_config
 from src.services.cookies import YouTubeCookieSourceCoordinator
+from src.services.downloads import cancellation_requested, ytdlp_cancel_hook
+from src.services.network.bandwidth import get_bandwidth_scheduler
 from src.services.ytdlp_logger import YTDLPLoggerBridge
 from src.utils.ffmpeg import get_ffmpeg_dir, is_ffmpeg_available
 from src.utils.logger import get_logger
@@ -26,6 +28,7 @@ from ...core.interfaces import (
 )
 from ..file.sanitizer import FilenameSanitizer
 from .error_handler import YouTubeErrorBucket, YouTubeErrorHandler
+from .info_cache import extract_video_id, get_youtube_info_cache
 from .metadata_service import YouTubeMetadataService
 
 logger = get_logger(__name__)
@@ -86,6 +89,7 @@ class YouTubeDownloader(BaseDownloader):
             config=config,
         )
         self.youtube_error_handler = YouTubeErrorHandler(error_handler=error_handler)
+        self.info_cache = get_youtube_info_cache()
         self._last_download_error_message: str | None = None
         self.ytdl_opts = self._get_simple_ytdl_options()
 
@@ -284,6 +288,8 @@ class YouTubeDownloader(BaseDownloader):
                     break
 
             except Exception as exc:
+                if cancellation_requested():
+                    return False
                 error_type = self._classify_download_error(str(exc))
                 if error_type not in transient_error_types:
                     max_retries = 1
@@ -306,6 +312,20 @@ class YouTubeDownloader(BaseDownloader):
             return self._attempt_relaxed_format_download(url, opts)
         return False
 
+    def _download_cached_info(self, opts: dict[str, Any], info: dict[str, Any]) -> bool:
+        """Download from an info dict extracted earlier instead of extracting again."""
+        try:
+            with yt_dlp.YoutubeDL(cast(Any, opts)) as ydl:
+                ydl.process_ie_result(info, download=True)
+            return True
+        except Exception as exc:
+            if not cancellation_requested():
+                logger.warning(
+                    "[YOUTUBE_DOWNLOADER] Cached info could not be downloaded, "
+                    f"re-extracting: {str(exc)[:220]}"
+                )
+            return False
+
     def _handle_download_exception(
         self,
         exc: Exception,
@@ -412,11 +432,16 @@ class YouTubeDownloader(BaseDownloader):
                 f"{output_template}{preferred_ext}" if preferred_ext else output_template
             )
 
+            # Raising from these hooks aborts yt-dlp (and its ffmpeg postprocessing)
+            # within one progress report once the download is cancelled or paused.
+            opts["progress_hooks"] = [ytdlp_cancel_hook(), get_bandwidth_scheduler().ytdlp_hook()]
+            opts["postprocessor_hooks"] = [ytdlp_cancel_hook()]
             if progress_callback:
-                opts["progress_hooks"] = [self._create_progress_hook(progress_callback)]
+                opts["progress_hooks"].append(self._create_progress_hook(progress_callback))
 
             logger.info(f"Downloading from YouTube: {url}")
             logger.info(f"Expected output path: {expected_output_path}")
+            video_id = None if self.download_playlist else extract_video_id(url)
             auth_strategies = self._build_auth_strategies()
             logger.info(
                 "[YOUTUBE_DOWNLOADER] Auth strategies: "
@@ -429,6 +454,14 @@ class YouTubeDownloader(BaseDownloader):
                 strategy_opts.update(auth_opts)
 
                 logger.info(f"[YOUTUBE_DOWNLOADER] Trying strategy: {label}")
+                if (cached_info := self.info_cache.get(video_id, label)) is not None:
+                    logger.info(f"[YOUTUBE_DOWNLOADER] Reusing extracted info for: {label}")
+                    if self._download_cached_info(strategy_opts, cached_info):
+                        return self._verify_download_completion(output_template, preferred_ext)
+                    if cancellation_requested():
+                        return False
+                    self.info_cache.invalidate(video_id, label)
+
                 download_successful = self._attempt_download(
                     url,
                     strategy_opts,
@@ -437,6 +470,8 @@ class YouTubeDownloader(BaseDownloader):
                 )
                 if download_successful:
                     return self._verify_download_completion(output_template, preferred_ext)
+                if cancellation_requested():
+                    return False
 
                 logger.warning(f"[YOUTUBE_DOWNLOADER] Strategy failed: {label}")
                 bucket = self.youtube_error_handler.classify_ytdlp_error(
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from src.core.config import AppConfig, get_config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_YOUTUBE_HOSTS = {"www.youtube.com", "youtube.com", "music.youtube.com", "m.youtube.com"}
+
+# Signed format URLs are not reused this close to their ``expire`` timestamp, so a
+# download started from a cache hit has time to open its connections.
+_EXPIRY_MARGIN_SECONDS = 300
+
+# Keys yt-dlp fills in while processing a result for one particular download; the
+# same set ``YoutubeDL.sanitize_info`` strips before writing an info JSON.
+_PRIVATE_INFO_KEYS = {
+    "requested_downloads",
+    "requested_formats",
+    "requested_subtitles",
+    "requested_entries",
+    "entries",
+    "filepath",
+    "_filename",
+    "filename",
+    "infojson_filename",
+    "original_url",
+    "playlist_autonumber",
+}
+
+
+def extract_video_id(url: str) -> str | None:
+    """Extract the video ID from a YouTube watch, embed, shorts or youtu.be URL."""
+    try:
+        parsed_url = urlparse(url)
+        hostname = (parsed_url.hostname or "").lower()
+
+        if hostname in _YOUTUBE_HOSTS:
+            if parsed_url.path == "/watch":
+                return parse_qs(parsed_url.query).get("v", [None])[0]
+            if parsed_url.path.startswith(("/embed/", "/v/", "/shorts/")):
+                return parsed_url.path.split("/")[2]
+        if hostname == "youtu.be":
+            return parsed_url.path[1:]
+
+        return None
+    except Exception:
+        return None
+
+
+def _sanitize_info(value: Any) -> Any:
+    """JSON-safe copy of an info dict without per-download private keys."""
+    if isinstance(value, dict):
+        return {
+            k: _sanitize_info(v)
+            for k, v in value.items()
+            if v is not None and not k.startswith("__") and k not in _PRIVATE_INFO_KEYS
+        }
+    if isinstance(value, list | tuple | set):
+        return [_sanitize_info(v) for v in value]
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return repr(value)
+
+
+def _signed_url_expiry(info: dict[str, Any]) -> float | None:
+    """Earliest ``expire`` timestamp among the info dict's format URLs."""
+    expiries: list[float] = []
+    for fmt in info.get("formats") or []:
+        if not isinstance(fmt, dict) or not isinstance(url := fmt.get("url"), str):
+            continue
+        if expire := parse_qs(urlparse(url).query).get("expire"):
+            with contextlib.suppress(ValueError):
+                expiries.append(float(expire[0]))
+    return min(expiries, default=None)
+
+
+class YouTubeInfoCache:
+    """Two-tier cache of yt-dlp info dicts keyed by video ID and auth strategy.
+
+    The metadata dialog stores what it extracted, and the downloader hands a hit
+    to ``YoutubeDL.process_ie_result`` instead of extracting the video again.
+    Entries live in a small in-memory LRU backed by one JSON file per key under
+    ``paths.youtube_info_cache_dir``. An entry expires after ``youtube.info_cache_ttl``
+    seconds or shortly before its signed format URLs do, whichever comes first.
+    Playlist results are never cached.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, config: AppConfig | None = None) -> None:
+        self.config = config or get_config()
+        self.cache_dir = Path(cache_dir or self.config.paths.youtube_info_cache_dir)
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.youtube.info_cache_ttl > 0
+
+    def get(self, video_id: str | None, auth_label: str) -> dict[str, Any] | None:
+        """Return a copy of the cached info dict, or None when missing or stale."""
+        if not video_id or not self.enabled:
+            return None
+
+        key = (video_id, auth_label)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None and (entry := self._read_disk(key)) is not None:
+            self._remember(key, entry)
+
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if time.time() >= expires_at:
+            self.invalidate(video_id, auth_label)
+            return None
+
+        logger.debug(f"[YOUTUBE_INFO_CACHE] Hit for {video_id} ({auth_label})")
+        return copy.deepcopy(info)
+
+    def put(self, video_id: str | None, auth_label: str, info: dict[str, Any]) -> None:
+        """Store a single-video info dict extracted with ``auth_label``."""
+        if not video_id or not self.enabled:
+            return
+        if info.get("_type", "video") != "video" or not info.get("formats"):
+            return
+
+        sanitized = _sanitize_info(info)
+        expires_at = time.time() + self.config.youtube.info_cache_ttl
+        if (url_expiry := _signed_url_expiry(sanitized)) is not None:
+            expires_at = min(expires_at, url_expiry - _EXPIRY_MARGIN_SECONDS)
+        if expires_at <= time.time():
+            return
+
+        key = (video_id, auth_label)
+        self._remember(key, (expires_at, sanitized))
+        self._write_disk(key, expires_at, sanitized)
+
+    def invalidate(self, video_id: str | None, auth_label: str) -> None:
+        """Drop one entry from both tiers."""
+        if not video_id:
+            return
+        key = (video_id, auth_label)
+        with self._lock:
+            self._memory.pop(key, None)
+        with contextlib.suppress(OSError):
+            self._disk_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir.exists():
+            for file_path in self.cache_dir.glob("*.json"):
+                with contextlib.suppress(OSError):
+                    file_path.unlink()
+
+    def _remember(self, key: tuple[str, str], entry: tuple[float, dict[str, Any]]) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > max(1, self.config.youtube.info_cache_memory_items):
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: tuple[str, str]) -> Path:
+        digest = hashlib.sha256("\0".join(key).encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_disk(self, key: tuple[str, str]) -> tuple[float, dict[str, Any]] | None:
+        path = self._disk_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                record = json.load(f)
+            return float(record["expires_at"]), record["info"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"[YOUTUBE_INFO_CACHE] Dropping unreadable entry {path.name}: {e}")
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+
+    def _write_disk(self, key: tuple[str, str], expires_at: float, info: dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": expires_at, "info": info}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"[YOUTUBE_INFO_CACHE] Failed to persist entry: {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+
+_cache: YouTubeInfoCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_youtube_info_cache() -> YouTubeInfoCache:
+    """Get the process-wide info cache shared by the dialog and the downloader."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        if _cache is None:
+            _cache = YouTubeInfoCache()
+        return _cache
+
+
+def reset_youtube_info_cache() -> None:
+    """Drop the process-wide cache so the next use rereads the config (tests)."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        _cache = None
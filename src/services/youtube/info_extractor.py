@@ -13,6 +13,7 @@ from src.services.ytdlp_logger import YTDLPLoggerBridge
 from src.utils.logger import get_logger
 
 from .error_handler import YouTubeErrorBucket, YouTubeErrorHandler
+from .info_cache import YouTubeInfoCache, extract_video_id, get_youtube_info_cache
 
 logger = get_logger(__name__)
 
@@ -26,9 +27,11 @@ class YouTubeInfoExtractor:
         auto_cookie_manager: IAutoCookieManager | None = None,
         cookie_handler: ICookieHandler | None = None,
         config: AppConfig = get_config(),
+        info_cache: YouTubeInfoCache | None = None,
     ) -> None:
         self.error_handler = error_handler
         self.config = config
+        self.info_cache = info_cache or get_youtube_info_cache()
         self.cookie_source_coordinator = YouTubeCookieSourceCoordinator(
             auto_cookie_manager=auto_cookie_manager,
             cookie_handler=cookie_handler,
@@ -79,6 +82,11 @@ class YouTubeInfoExtractor:
     def _try_auth_strategy(
         self, url: str, auth_strategy: YouTubeAuthConfig
     ) -> dict[str, Any] | None:
+        video_id = extract_video_id(url)
+        if cached := self.info_cache.get(video_id, auth_strategy.label):
+            logger.info(f"[INFO_EXTRACTOR] Using cached info for: {auth_strategy.label}")
+            return cached
+
         clients: list[str | None] = [None]
         for client in clients:
             client_label = client or "native"
@@ -90,6 +98,7 @@ class YouTubeInfoExtractor:
                 label=label,
             )
             if info:
+                self.info_cache.put(video_id, auth_strategy.label, info)
                 return info
 
         return None
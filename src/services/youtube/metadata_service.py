@@ -1,6 +1,5 @@
 import re
 import threading
-from urllib.parse import parse_qs, urlparse
 
 import requests
 
@@ -16,6 +15,7 @@ from src.core.interfaces import (
 
 from ...utils.error_helpers import extract_error_context
 from ...utils.logger import get_logger
+from .info_cache import extract_video_id
 from .info_extractor import YouTubeInfoExtractor
 from .metadata_parser import YouTubeMetadataParser
 from .subtitle_extractor import YouTubeSubtitleExtractor
@@ -190,22 +190,7 @@ class YouTubeMetadataService(IYouTubeMetadataService):
 
     def extract_video_id(self, url: str) -> str | None:
         """Extract video ID from YouTube URL."""
-        try:
-            parsed_url = urlparse(url)
-            hostname = (parsed_url.hostname or "").lower()
-
-            if hostname in {"www.youtube.com", "youtube.com", "music.youtube.com", "m.youtube.com"}:
-                if parsed_url.path == "/watch":
-                    query = parse_qs(parsed_url.query)
-                    return query.get("v", [None])[0]
-                if parsed_url.path.startswith("/embed/") or parsed_url.path.startswith("/v/"):
-                    return parsed_url.path.split("/")[2]
-            if hostname == "youtu.be":
-                return parsed_url.path[1:]  # Remove leading slash
-
-            return None
-        except Exception:
-            return None
+        return extract_video_id(url)
 
     def _fetch_oembed_metadata(self, url: str) -> YouTubeMetadata | None:
         """Fetch minimal metadata via YouTube oEmbed as a resilient fallback."""
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import tkinter as tk
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from tkinter import ttk
 
 import customtkinter as ctk
 
@@ -12,8 +14,125 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pending list changes are drawn together, at most once per ~60 Hz frame.
+_FRAME_MS = 16
+
+_COLUMNS = ("name", "url", "status")
+
+
+def _format_status(item: Download) -> str:
+    if item.status == DownloadStatus.DOWNLOADING:
+        return f"Downloading {item.progress:.0f}%" if item.progress > 0 else "Downloading"
+    if item.status == DownloadStatus.FAILED:
+        return f"Failed: {item.error_message}"
+    return item.status.value
+
+
+@dataclass(frozen=True, slots=True)
+class RowValues:
+    name: str
+    url: str
+    status: str
+    failed: bool = False
+
+    @classmethod
+    def of(cls, item: Download) -> RowValues:
+        return cls(item.name, item.url, _format_status(item), item.status == DownloadStatus.FAILED)
+
+
+@dataclass(slots=True)
+class RowChanges:
+    """What a redraw has to do to bring the widget in line with the model.
+
+    Apply ``removed``, then ``inserted`` in order (indices are final positions),
+    then ``updated``. ``reordered`` holds the full order when surviving rows
+    changed their relative order and have to be moved into place.
+    """
+
+    removed: list[str] = field(default_factory=list)
+    inserted: list[tuple[int, str, RowValues]] = field(default_factory=list)
+    updated: list[tuple[str, RowValues]] = field(default_factory=list)
+    reordered: list[str] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.removed or self.inserted or self.updated or self.reordered)
+
+
+class DownloadRows:
+    """The downloads a list shows, keyed by ``Download.id``, and the rows last drawn.
+
+    Changes only mark rows dirty; :meth:`take_changes` diffs the dirty rows
+    against what was drawn, so a redraw touches only the rows that changed no
+    matter how many updates arrived since the previous one.
+    """
+
+    def __init__(self) -> None:
+        self._downloads: list[Download] = []
+        self._drawn: dict[str, RowValues] = {}
+        self._drawn_order: list[str] = []
+        self._dirty: dict[str, Download] = {}
+        self._order_changed = False
+
+    @property
+    def downloads(self) -> list[Download]:
+        return self._downloads
+
+    def replace(self, items: Iterable[Download]) -> None:
+        self._downloads = list(items)
+        self._order_changed = True
+
+    def append(self, item: Download) -> None:
+        self._downloads.append(item)
+        self._order_changed = True
+
+    def touch(self, item: Download) -> None:
+        """Redraw ``item``'s row with its current state."""
+        self._dirty[item.id] = item
+
+    def take_changes(self) -> RowChanges:
+        changes = RowChanges()
+        if not self._order_changed:
+            for download_id, item in self._dirty.items():
+                if download_id not in self._drawn:
+                    continue
+                if (row := RowValues.of(item)) != self._drawn[download_id]:
+                    self._drawn[download_id] = row
+                    changes.updated.append((download_id, row))
+            self._dirty.clear()
+            return changes
+
+        order: list[str] = []
+        rows: dict[str, RowValues] = {}
+        for item in self._downloads:
+            if item.id not in rows:
+                order.append(item.id)
+                rows[item.id] = RowValues.of(item)
+
+        changes.removed = [i for i in self._drawn_order if i not in rows]
+        survivors = [i for i in self._drawn_order if i in rows]
+        for index, download_id in enumerate(order):
+            if (drawn := self._drawn.get(download_id)) is None:
+                changes.inserted.append((index, download_id, rows[download_id]))
+            elif drawn != rows[download_id]:
+                changes.updated.append((download_id, rows[download_id]))
+        if survivors != [i for i in order if i in self._drawn]:
+            changes.reordered = order
+
+        self._drawn = rows
+        self._drawn_order = order
+        self._dirty.clear()
+        self._order_changed = False
+        return changes
+
 
 class DownloadListView(ctk.CTkFrame):
+    """Download queue shown in a ``ttk.Treeview``, one row per download.
+
+    Tk only draws the rows in view, and rows are keyed by ``Download.id`` so
+    downloads with the same name never collide. Refreshes and progress updates
+    are collected in :class:`DownloadRows` and drawn in one batch per frame.
+    """
+
     def __init__(
         self,
         master,
@@ -23,148 +142,138 @@ class DownloadListView(ctk.CTkFrame):
         super().__init__(master)
 
         self.on_selection_change = on_selection_change
-        self._item_line_mapping: dict[str, int] = {}
-        self._downloads: list[Download] = []
+        self._rows = DownloadRows()
+        self._flush_id: str | None = None
+        self._scroll_to_end = False
 
         self._theme_manager = theme_manager or get_theme_manager(master.winfo_toplevel())
         self._theme_manager.subscribe(ThemeEvent.THEME_CHANGED, self._on_theme_changed)
 
-        self.list_view = ctk.CTkTextbox(
+        self._style = ttk.Style(self)
+        self._style_name = "DownloadList.Treeview"
+        self.list_view = ttk.Treeview(
             self,
-            activate_scrollbars=True,
-            font=("Roboto", 12),
-            corner_radius=8,
-            border_width=1,
+            columns=_COLUMNS,
+            show="headings",
+            selectmode="extended",
+            style=self._style_name,
         )
-        self.list_view.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
-
-    def _on_theme_changed(self, appearance, color) -> None:
-        theme_json = self._theme_manager.get_theme_json()
-
-        frame_config = theme_json.get("CTkFrame", {})
-        label_config = theme_json.get("CTkLabel", {})
-        if frame_config and label_config:
-            self.list_view.configure(
-                fg_color=frame_config.get("fg_color"),
-                text_color=label_config.get("text_color"),
-            )
-
-        self.list_view.bind("<<Selection>>", self._handle_selection)
-
+        for column, title, width, stretch in (
+            ("name", "Name", 260, True),
+            ("url", "URL", 360, True),
+            ("status", "Status", 160, False),
+        ):
+            self.list_view.heading(column, text=title, anchor=tk.W)
+            self.list_view.column(column, width=width, minwidth=80, stretch=stretch)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.list_view.yview)
+        self.list_view.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.list_view.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=0, pady=0)
+
+        self.list_view.bind("<<TreeviewSelect>>", self._handle_selection)
         self.list_view.bind("<Control-a>", self._select_all)
+        self._apply_theme_colors()
 
-    def refresh_items(self, items: list[Download]) -> None:
-        try:
-            self.list_view.delete("1.0", tk.END)
-            self._item_line_mapping.clear()
-
-            self._downloads = list(items)
-
-            for i, item in enumerate(items):
-                status_text = self._format_status(item)
-                self.list_view.insert(tk.END, f"{item.name} | {item.url} | {status_text}\n")
-                self._item_line_mapping[item.name] = i + 1
+    def _on_theme_changed(self, appearance, color) -> None:
+        self._apply_theme_colors()
+
+    def _apply_theme_colors(self) -> None:
+        colors = self._theme_manager.get_colors()
+        surface = colors.get("surface", "#2b2b2b")
+        text = colors.get("text_on_surface", "#FFFFFF")
+        select_bg = colors.get("select_bg", "#1f538d")
+        self._style.configure(
+            self._style_name,
+            background=surface,
+            fieldbackground=surface,
+            foreground=text,
+            font=("Roboto", 12),
+            rowheight=24,
+            borderwidth=0,
+        )
+        self._style.map(self._style_name, background=[("selected", select_bg)])
+        self._style.configure(f"{self._style_name}.Heading", font=("Roboto", 12, "bold"))
+        self.list_view.tag_configure("failed", foreground=colors.get("error", "#E5534B"))
 
-            if self.on_selection_change:
-                self.on_selection_change([])
-        except Exception as e:
-            logger.error(f"[DOWNLOAD_LIST] Error refreshing items: {e}", exc_info=True)
+    def _schedule_flush(self) -> None:
+        if self._flush_id is None:
+            self._flush_id = self.after(_FRAME_MS, self._flush)
 
-    def update_item_progress(self, item: Download, progress: float) -> None:
+    def _flush(self) -> None:
+        self._flush_id = None
         try:
-            if not (line_num := self._item_line_mapping.get(item.name)):
+            changes = self._rows.take_changes()
+            if not changes:
                 return
-
-            item.progress = progress
-            status_text = self._format_status(item)
-
-            line_start = f"{line_num}.0"
-            line_end = f"{line_num}.end"
-
-            if not (current_line := self.list_view.get(line_start, line_end).strip()):
-                return
-
-            parts = current_line.split(" | ", 2)
-            if len(parts) >= 3:
-                new_line = f"{parts[0]} | {parts[1]} | {status_text}"
-
-                current_scroll = self.list_view.yview()
-
-                self.list_view.delete(line_start, line_end)
-                self.list_view.insert(line_start, new_line)
-
-                if current_scroll and len(current_scroll) > 0:
-                    self.list_view.yview_moveto(current_scroll[0])
+            tree = self.list_view
+            if changes.removed:
+                tree.delete(*changes.removed)
+            for index, download_id, row in changes.inserted:
+                tree.insert("", index, iid=download_id, values=_values(row), tags=_tags(row))
+            for download_id, row in changes.updated:
+                tree.item(download_id, values=_values(row), tags=_tags(row))
+            if changes.reordered:
+                for index, download_id in enumerate(changes.reordered):
+                    tree.move(download_id, "", index)
+
+            if self._scroll_to_end and (children := tree.get_children()):
+                tree.see(children[-1])
+            self._scroll_to_end = False
+            if (changes.removed or changes.inserted) and self.on_selection_change:
+                self.on_selection_change(self.get_selected_indices())
         except Exception as e:
-            logger.error(f"[DOWNLOAD_LIST] Error updating progress: {e}", exc_info=True)
+            logger.error("[DOWNLOAD_LIST] Error redrawing items: %s", e, exc_info=True)
+
+    def refresh_items(self, items: list[Download]) -> None:
+        self._rows.replace(items)
+        self._schedule_flush()
 
-    @staticmethod
-    def _format_status(item: Download) -> str:
-        if item.status == DownloadStatus.DOWNLOADING:
-            return "Downloading"
-        if item.status == DownloadStatus.FAILED:
-            return f"Failed: {item.error_message}"
-        return item.status.value
+    def update_item_progress(self, item: Download, progress: float) -> None:
+        item.progress = progress
+        self._rows.touch(item)
+        self._schedule_flush()
 
     def get_selected_indices(self) -> list[int]:
-        try:
-            start = self.list_view.index("sel.first").split(".")[0]
-            end = self.list_view.index("sel.last").split(".")[0]
-            return list(range(int(start) - 1, int(end)))
-        except tk.TclError:
-            return []
+        positions = {d.id: i for i, d in enumerate(self._rows.downloads)}
+        return sorted(positions[i] for i in self.list_view.selection() if i in positions)
 
     def _handle_selection(self, event) -> None:
         self.on_selection_change(self.get_selected_indices())
 
     def _select_all(self, event) -> str:
-        self.list_view.tag_add(tk.SEL, "1.0", tk.END)
-        self.list_view.mark_set(tk.INSERT, "1.0")
-        self.list_view.see(tk.INSERT)
+        self.list_view.selection_set(self.list_view.get_children())
         return "break"
 
     def add_download(self, download: Download) -> None:
-        self._downloads.append(download)
-
-        current_content = self.list_view.get("1.0", tk.END)
-
-        status_text = self._format_status(download)
-        new_entry = f"{download.name} | {download.url} | {status_text}\n"
-
-        self.list_view.insert(tk.END, new_entry)
-
-        line_num = current_content.count("\n") + 1
-        self._item_line_mapping[download.name] = line_num
-
-        self.list_view.see(tk.END)
+        self._rows.append(download)
+        self._scroll_to_end = True
+        self._schedule_flush()
 
     def has_items(self) -> bool:
-        return len(self._downloads) > 0
+        return len(self._rows.downloads) > 0
 
     def get_downloads(self) -> list[Download]:
-        return self._downloads.copy()
+        return self._rows.downloads.copy()
 
     def clear_downloads(self) -> None:
-        self.list_view.delete("1.0", tk.END)
-        self._downloads.clear()
-        if self.on_selection_change:
-            self.on_selection_change([])
+        self._rows.replace([])
+        self._schedule_flush()
 
     def remove_downloads(self, indices: list[int]) -> None:
         if not indices:
             return
-        unique_indices = sorted({i for i in indices if 0 <= i < len(self._downloads)}, reverse=True)
-        for i in unique_indices:
-            del self._downloads[i]
-        self.refresh_items(self._downloads)
+        downloads = self._rows.downloads
+        doomed = {i for i in indices if 0 <= i < len(downloads)}
+        self.refresh_items([d for i, d in enumerate(downloads) if i not in doomed])
 
     def remove_completed_downloads(self) -> int:
         completed_indices = []
-        for i, download in enumerate(self._downloads):
+        for i, download in enumerate(self._rows.downloads):
             if download.status == DownloadStatus.COMPLETED:
                 completed_indices.append(i)
                 logger.debug(
-                    f"[DOWNLOAD_LIST] Marking completed download for removal: {download.name}"
+                    "[DOWNLOAD_LIST] Marking completed download for removal: %s", download.name
                 )
 
         if not completed_indices:
@@ -176,9 +285,20 @@ class DownloadListView(ctk.CTkFrame):
         return len(completed_indices)
 
     def has_completed_downloads(self) -> bool:
-        return any(download.status == DownloadStatus.COMPLETED for download in self._downloads)
+        return any(download.status == DownloadStatus.COMPLETED for download in self._rows.downloads)
 
     def destroy(self) -> None:
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
         if self._theme_manager:
             self._theme_manager.unsubscribe(ThemeEvent.THEME_CHANGED, self._on_theme_changed)
         super().destroy()
+
+
+def _values(row: RowValues) -> tuple[str, str, str]:
+    return (row.name, row.url, row.status)
+
+
+def _tags(row: RowValues) -> tuple[str, ...]:
+    return ("failed",) if row.failed else ()
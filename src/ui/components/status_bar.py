@@ -9,6 +9,7 @@ import customtkinter as ctk
 
 from src.core.config import AppConfig, get_config
 from src.core.enums.theme_event import ThemeEvent
+from src.services.events.scheduler import TkDrainScheduler
 from src.ui.utils.theme_manager import ThemeManager, get_theme_manager
 from src.utils.logger import get_logger
 
@@ -62,7 +63,8 @@ class StatusBar(ctk.CTkFrame):
 
         self._apply_theme_colors()
 
-        self._process_queue()
+        self._update_scheduler = TkDrainScheduler(self._root_window)
+        self._update_scheduler.start(self._process_queue)
         self._process_messages()
 
     def _get_root_window(self):
@@ -72,9 +74,9 @@ class StatusBar(ctk.CTkFrame):
             logger.error(f"[STATUS_BAR] Error getting root window: {e}")
             return self
 
-    def _process_queue(self) -> None:
+    def _process_queue(self) -> bool:
         if not self._running:
-            return
+            return False
 
         try:
             max_updates_per_cycle = 3
@@ -92,11 +94,7 @@ class StatusBar(ctk.CTkFrame):
         except Exception as e:
             logger.error(f"[STATUS_BAR] Error in _process_queue: {e}", exc_info=True)
 
-        if self._running and self._root_window:
-            try:
-                self._root_window.after(33, self._process_queue)
-            except Exception as e:
-                logger.error(f"[STATUS_BAR] Error scheduling next queue check: {e}")
+        return self._running and not self._update_queue.empty()
 
     def _queue_update(self, update_func) -> None:
         try:
@@ -104,6 +102,7 @@ class StatusBar(ctk.CTkFrame):
                 with contextlib.suppress(queue.Empty):
                     self._update_queue.get_nowait()
             self._update_queue.put_nowait(update_func)
+            self._update_scheduler.wake()
         except queue.Full:
             pass
         except Exception as e:
@@ -268,6 +267,7 @@ class StatusBar(ctk.CTkFrame):
 
     def destroy(self) -> None:
         self._running = False
+        self._update_scheduler.stop()
         if self._theme_manager:
             self._theme_manager.unsubscribe(ThemeEvent.THEME_CHANGED, self._on_theme_changed)
         super().destroy()
@@ -115,44 +115,53 @@ class NetworkStatusDialog(ctk.CTkToplevel, WindowCenterMixin):
             self.advice_frame.destroy()
             self.advice_frame = None
 
+        def on_result(service: ServiceType, connected: bool, error: str) -> None:
+            if not self._is_destroyed:
+                self.after(0, lambda: self.update_service_status(service, connected, error))
+
         def check_worker() -> None:
             _internet_connected, _error_msg = check_internet_connection()
 
-            service_results = check_all_services()
-
-            any_error = False
-            for service, (connected, _error) in service_results.items():
-                if connected:
-                    self.service_statuses[service] = NetworkStatus.CONNECTED
-                else:
-                    self.service_statuses[service] = NetworkStatus.ERROR
-                    any_error = True
+            service_results = check_all_services(on_result)
+            any_error = not all(connected for connected, _error in service_results.values())
 
             if not self._is_destroyed:
                 self.after(0, lambda: self.update_status_display(service_results, any_error))
 
         threading.Thread(target=check_worker, daemon=True).start()
 
+    def update_service_status(self, service: ServiceType, connected: bool, error: str) -> None:
+        """Fill in one service row as soon as its check finishes."""
+        if self._is_destroyed or service not in self.status_labels:
+            return
+
+        colors = self._theme_manager.get_colors()
+        if connected:
+            self.service_statuses[service] = NetworkStatus.CONNECTED
+            self.status_labels[service].configure(
+                text="Connected", text_color=colors.get("status_success", "green")
+            )
+        else:
+            self.service_statuses[service] = NetworkStatus.ERROR
+            self.status_labels[service].configure(
+                text=f"Error: {error}", text_color=colors.get("status_error", "red")
+            )
+
     def update_status_display(
         self, service_results: dict[ServiceType, tuple[bool, str]], any_error: bool
     ) -> None:
         """Update the status display with check results."""
-        colors = self._theme_manager.get_colors()
-        status_success = colors.get("status_success", "green")
-        status_error = colors.get("status_error", "red")
+        if self._is_destroyed:
+            return
 
         for service, (connected, error) in service_results.items():
-            if service not in self.status_labels:
-                continue
+            self.update_service_status(service, connected, error)
 
-            if connected:
-                self.service_statuses[service] = NetworkStatus.CONNECTED
-                self.status_labels[service].configure(text="Connected", text_color=status_success)
-            else:
-                self.service_statuses[service] = NetworkStatus.ERROR
-                self.status_labels[service].configure(
-                    text=f"Error: {error}", text_color=status_error
-                )
+        text_muted = self._theme_manager.get_colors().get("text_muted", "gray")
+        for service, status in self.service_statuses.items():
+            if status == NetworkStatus.CHECKING and service not in service_results:
+                self.service_statuses[service] = NetworkStatus.UNKNOWN
+                self.status_labels[service].configure(text="Not checked", text_color=text_muted)
 
         self.retry_button.configure(state="normal")
 
@@ -68,6 +68,8 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
         self.result_radio_var: ctk.StringVar | None = None
         self.result_checkboxes: dict[int, ctk.BooleanVar] = {}
         self.track_checkboxes: dict[int, ctk.BooleanVar] = {}
+        self._track_match_labels: dict[int, ctk.CTkLabel] = {}
+        self._search_cancel = threading.Event()
         self._poll_after_id = None
 
         self._theme_manager = theme_manager or get_theme_manager()
@@ -192,11 +194,12 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
                 if metadata.get("type") in ("album", "playlist"):
                     tracks = metadata.get("tracks", [])
                     logger.info(f"Found {len(tracks)} tracks in playlist/album")
+                    # Show the track list now; matches stream in as searches finish.
+                    self._metadata_ready = True
                     self._load_youtube_results_for_tracks(tracks, downloader)
                 else:
                     self._load_youtube_result_for_single_track(metadata, downloader)
-
-                self._metadata_ready = True
+                    self._metadata_ready = True
 
             except Exception as e:
                 logger.error(f"Error fetching metadata: {e}", exc_info=True)
@@ -223,29 +226,19 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
         tracks: list[dict[str, Any]],
         downloader: SpotifyDownloader,
     ) -> None:
-        """Load YouTube search results for all tracks in playlist/album."""
+        """Search YouTube for all tracks in playlist/album, updating rows as results arrive."""
         logger.info(f"Searching YouTube for {len(tracks)} tracks")
 
-        for track_data in tracks:
-            try:
-                track_title = track_data.get("title", "")
-                artist, track = downloader._parse_artist_track(track_title)
-
-                results = downloader.get_search_results(artist, track)
-
-                track_data["youtube_results"] = results
-                track_data["best_match"] = (
-                    downloader._select_best_match(track, results) if results else None
-                )
+        def on_result(track_data: dict[str, Any]) -> None:
+            position = track_data.get("position", 0)
+            self._schedule_ui_update(lambda: self._update_track_match(position, track_data))
 
-            except Exception as e:
-                logger.warning(
-                    f"Error searching YouTube for track {track_data.get('position')}: {e}"
-                )
-                track_data["youtube_results"] = []
-                track_data["best_match"] = None
+        downloader.search_tracks(tracks, on_result=on_result, cancel_event=self._search_cancel)
 
-        logger.info("YouTube search completed for all tracks")
+        if self._search_cancel.is_set():
+            logger.info("YouTube search cancelled")
+        else:
+            logger.info("YouTube search completed for all tracks")
 
     def _handle_metadata_error(self) -> None:
         """Handle metadata fetch error (YouTube pattern)."""
@@ -689,24 +682,39 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
         )
         checkbox.pack(fill="x")
 
+        text, color_key, fallback = self._track_match_status(track_data)
         colors = self._theme_manager.get_colors()
-
+        match_label = ctk.CTkLabel(
+            track_frame,
+            text=text,
+            font=("Roboto", 9),
+            text_color=colors.get(color_key, fallback),
+        )
+        match_label.pack(anchor="w", padx=(30, 0), pady=(0, 5))
+        self._track_match_labels[position] = match_label
+
+    @staticmethod
+    def _track_match_status(track_data: dict[str, Any]) -> tuple[str, str, str]:
+        """Label text and theme color for a track's YouTube match state."""
+        if "best_match" not in track_data:
+            return "… Searching YouTube", "text_muted", "gray"
         if best_match := track_data.get("best_match"):
-            match_label = ctk.CTkLabel(
-                track_frame,
-                text=f"✓ Match found: {best_match.get('title', 'Unknown')[:40]}...",
-                font=("Roboto", 9),
-                text_color=colors.get("status_success", "#28a745"),
+            return (
+                f"✓ Match found: {best_match.get('title', 'Unknown')[:40]}...",
+                "status_success",
+                "#28a745",
             )
-            match_label.pack(anchor="w", padx=(30, 0), pady=(0, 5))
-        else:
-            no_match_label = ctk.CTkLabel(
-                track_frame,
-                text="✗ No match found",
-                font=("Roboto", 9),
-                text_color=colors.get("status_error", "#dc3545"),
+        return "✗ No match found", "status_error", "#dc3545"
+
+    def _update_track_match(self, position: int, track_data: dict[str, Any]) -> None:
+        """Refresh one track row once its search finishes (main thread)."""
+        if not (label := self._track_match_labels.get(position)):
+            return
+        text, color_key, fallback = self._track_match_status(track_data)
+        with contextlib.suppress(Exception):
+            label.configure(
+                text=text, text_color=self._theme_manager.get_colors().get(color_key, fallback)
             )
-            no_match_label.pack(anchor="w", padx=(30, 0), pady=(0, 5))
 
     def _on_result_selected(self, index: int, selected: bool) -> None:
         """Handle YouTube search result selection (YouTube pattern)."""
@@ -798,6 +806,10 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
             self._show_error("Selected YouTube result has no valid URL")
             return
 
+        SpotifyDownloader(error_handler=self.error_handler, config=self.config).remember_match(
+            self.url, self.selected_youtube_result
+        )
+
         title = self.selected_youtube_result.get("title", "Spotify Track")
         filename = f"{title}.mp3"
 
@@ -837,7 +849,10 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
             title = best_match.get("title", track_data.get("title", "Spotify Track"))
 
         if not youtube_url:
-            self._show_error("No YouTube match found for selected track")
+            if "best_match" not in track_data:
+                self._show_error("Still searching YouTube for the selected track")
+            else:
+                self._show_error("No YouTube match found for selected track")
             return
 
         filename = f"{title}.mp3"
@@ -908,6 +923,7 @@ class SpotifyDownloaderDialog(ctk.CTkToplevel, WindowCenterMixin):
             )
 
     def destroy(self) -> None:
+        self._search_cancel.set()
         with contextlib.suppress(Exception):
             self.after_cancel(self._poll_after_id)
         if self.loading_overlay:
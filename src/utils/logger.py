@@ -1,9 +1,25 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.config import LogConfig
 
 _root_logger_configured = False
+_configure_lock = threading.Lock()
+_queue_handler: "_BoundedQueueHandler | None" = None
+_listener: logging.handlers.QueueListener | None = None
+_file_handler: logging.handlers.RotatingFileHandler | None = None
+
+# Defaults until configure_logging() applies the user's LogConfig.
+_DEFAULT_QUEUE_SIZE = 10_000
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+_DEFAULT_BACKUP_COUNT = 5
 
 
 def _get_log_dir() -> Path:
@@ -13,37 +29,144 @@ def _get_log_dir() -> Path:
     return log_dir
 
 
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the listener thread without doing any I/O.
+
+    Only the ``%``-interpolation of the message happens on the logging thread,
+    so the record no longer depends on mutable arguments; timestamps,
+    tracebacks and writing are done by the listener. When the queue is full,
+    DEBUG records are dropped (and counted) while anything more severe waits
+    for room, so warnings and errors are never lost.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno > logging.DEBUG:
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                with self._dropped_lock:
+                    self.dropped += 1
+                return
+        if self.dropped:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+        message = f"[LOGGER] Dropped {dropped} debug records while the log queue was full"
+        record = logging.makeLogRecord(
+            {"name": __name__, "levelno": logging.WARNING, "levelname": "WARNING", "msg": message}
+        )
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += dropped
+
+
+def _configure_root_logger() -> None:
+    """Route the root logger through a queue drained by one background thread."""
+    global _queue_handler, _listener, _file_handler  # noqa: PLW0603
+
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    # Console handler (stdout)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [console_handler]
+
+    # Rotating file handler — 5 MB per file, keep 5 backups
+    try:
+        log_file = _get_log_dir() / "media_downloader.log"
+        _file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=_DEFAULT_MAX_BYTES,
+            backupCount=_DEFAULT_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        _file_handler.setFormatter(formatter)
+        handlers.append(_file_handler)
+    except Exception:
+        pass  # Non-fatal: console logging still works
+
+    _queue_handler = _BoundedQueueHandler(queue.Queue(maxsize=_DEFAULT_QUEUE_SIZE))
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, *handlers)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(logging.INFO)
+
+
 def get_logger(name: str) -> logging.Logger:
+    """Get a named logger; the first call sets up the shared logging pipeline.
+
+    Loggers inherit the root level, which follows ``LogConfig.level`` once
+    :func:`configure_logging` has run. Hot paths should pass arguments
+    (``logger.debug("... %s", value)``) rather than f-strings so nothing is
+    formatted for records below that level.
+    """
     global _root_logger_configured  # noqa: PLW0603
 
     if not _root_logger_configured:
-        root_logger = logging.getLogger()
-        if not root_logger.handlers:
-            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        with _configure_lock:
+            if not _root_logger_configured:
+                _configure_root_logger()
+                _root_logger_configured = True
 
-            # Console handler (stdout)
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
+    return logging.getLogger(name)
 
-            # Rotating file handler — 5 MB per file, keep 5 backups
-            try:
-                log_file = _get_log_dir() / "media_downloader.log"
-                file_handler = logging.handlers.RotatingFileHandler(
-                    log_file,
-                    maxBytes=5 * 1024 * 1024,
-                    backupCount=5,
-                    encoding="utf-8",
-                )
-                file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
-            except Exception:
-                pass  # Non-fatal: console logging still works
-
-            root_logger.setLevel(logging.INFO)
-        _root_logger_configured = True
-
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-
-    return logger
+
+def configure_logging(log_config: "LogConfig") -> None:
+    """Apply the configured level, file rotation and queue size."""
+    level = logging.getLevelName(log_config.level.upper())
+    if not isinstance(level, int):
+        logging.getLogger(__name__).warning(
+            "[LOGGER] Unknown log level %r, keeping %s",
+            log_config.level,
+            logging.getLevelName(logging.getLogger().level),
+        )
+    else:
+        logging.getLogger().setLevel(level)
+
+    if _file_handler is not None:
+        _file_handler.maxBytes = log_config.max_bytes
+        _file_handler.backupCount = log_config.backup_count
+    if _queue_handler is not None:
+        _queue_handler.queue.maxsize = max(0, log_config.queue_size)
+
+
+def shutdown_logging() -> None:
+    """Write out every queued record and stop the listener thread.
+
+    Records logged afterwards (late atexit hooks) go straight to the handlers.
+    """
+    global _listener, _queue_handler
+    with _configure_lock:
+        listener, _listener = _listener, None
+        queue_handler, _queue_handler = _queue_handler, None
+    if listener is None:
+        return
+
+    root_logger = logging.getLogger()
+    if queue_handler is not None:
+        root_logger.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
@@ -0,0 +1,311 @@
+"""Startup tracer: where the time goes between launch and the first painted window.
+
+Off by default. Enable it with ``--trace-startup[=PATH]`` on the command line or
+``MEDIA_DOWNLOADER_TRACE_STARTUP=1`` (or ``=PATH``) in the environment;
+``--startup-benchmark`` / ``MEDIA_DOWNLOADER_STARTUP_BENCHMARK=1`` additionally
+quits once the window has painted, for ``scripts/benchmark_startup.py``.
+
+This module only uses the standard library so it can be imported, and start
+timing imports, before anything else the application loads.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+TRACE_ENV = "MEDIA_DOWNLOADER_TRACE_STARTUP"
+BENCHMARK_ENV = "MEDIA_DOWNLOADER_STARTUP_BENCHMARK"
+TRACE_FLAG = "--trace-startup"
+BENCHMARK_FLAG = "--startup-benchmark"
+
+REPORT_VERSION = 1
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def _default_report_path() -> Path:
+    return Path.home() / ".media_downloader" / "logs" / "startup_trace.json"
+
+
+@dataclass(slots=True)
+class TraceSpan:
+    name: str
+    category: str
+    start_ms: float
+    duration_ms: float
+    self_ms: float
+    thread: str
+    depth: int
+
+
+class _OpenSpan:
+    __slots__ = ("category", "child_ms", "name", "started")
+
+    def __init__(self, name: str, category: str, started: float) -> None:
+        self.name = name
+        self.category = category
+        self.started = started
+        self.child_ms = 0.0
+
+
+class StartupTracer:
+    """Records monotonic timings for startup phases, DI resolutions and imports.
+
+    Spans nest per thread: a span's ``self_ms`` is its duration minus the spans
+    opened inside it on the same thread, the way ``-X importtime`` separates a
+    module's own time from that of the modules it imports.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        report_path: Path | None = None,
+        exit_after_paint: bool = False,
+    ) -> None:
+        self.enabled = enabled
+        self.report_path = report_path
+        self.exit_after_paint = exit_after_paint
+        self._origin = time.perf_counter()
+        self._started_at = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._spans: list[TraceSpan] = []
+        self._marks: dict[str, float] = {}
+        self._import_hook: _ImportTimer | None = None
+
+    def _elapsed_ms(self, now: float | None = None) -> float:
+        return ((time.perf_counter() if now is None else now) - self._origin) * 1000
+
+    def _stack(self) -> list[_OpenSpan]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, category: str = "phase") -> AbstractContextManager[None]:
+        """Time the enclosed block; a no-op context when tracing is off."""
+        if not self.enabled:
+            return nullcontext()
+        return self._record(name, category)
+
+    @contextmanager
+    def _record(self, name: str, category: str) -> Iterator[None]:
+        stack = self._stack()
+        opened = _OpenSpan(name, category, time.perf_counter())
+        stack.append(opened)
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            stack.pop()
+            duration = (ended - opened.started) * 1000
+            if stack:
+                stack[-1].child_ms += duration
+            span = TraceSpan(
+                name=name,
+                category=category,
+                start_ms=round(self._elapsed_ms(opened.started), 3),
+                duration_ms=round(duration, 3),
+                self_ms=round(duration - opened.child_ms, 3),
+                thread=threading.current_thread().name,
+                depth=len(stack),
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    def mark(self, name: str) -> None:
+        """Note the moment ``name`` happened (first one wins)."""
+        if self.enabled:
+            with self._lock:
+                self._marks.setdefault(name, round(self._elapsed_ms(), 3))
+
+    def install_import_hook(self) -> None:
+        """Time every module imported from now on, ``-X importtime`` style."""
+        if self.enabled and self._import_hook is None:
+            self._import_hook = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_hook)
+
+    def remove_import_hook(self) -> None:
+        if self._import_hook is not None:
+            if self._import_hook in sys.meta_path:
+                sys.meta_path.remove(self._import_hook)
+            self._import_hook = None
+
+    def report(self) -> dict[str, Any]:
+        """The trace so far as a JSON-serialisable dict."""
+        with self._lock:
+            spans = list(self._spans)
+            marks = dict(self._marks)
+
+        def by_category(category: str) -> list[dict[str, Any]]:
+            selected = [asdict(span) for span in spans if span.category == category]
+            return sorted(selected, key=lambda span: span["start_ms"])
+
+        imports = by_category("import")
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self._started_at.isoformat(),
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "total_ms": round(max(marks.values(), default=self._elapsed_ms()), 3),
+            "marks": marks,
+            "phases": by_category("phase"),
+            "services": by_category("service"),
+            "imports": imports,
+            "import_total_ms": round(sum(span["self_ms"] for span in imports), 3),
+        }
+
+    def write_report(self, path: Path | None = None) -> Path | None:
+        """Write :meth:`report` as JSON; returns where, or None when tracing is off."""
+        if not self.enabled:
+            return None
+        target = path or self.report_path or _default_report_path()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        return target
+
+    def finish(self, mark: str = "first_paint") -> Path | None:
+        """Stop timing imports, note ``mark`` and write the report."""
+        if not self.enabled:
+            return None
+        self.mark(mark)
+        self.remove_import_hook()
+        return self.write_report()
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path finder that times ``exec_module`` of whatever the other finders find.
+
+    The spec's loader is replaced with a shallow copy whose ``exec_module`` is
+    wrapped, so the loader keeps its type and every other method.
+    """
+
+    def __init__(self, tracer: StartupTracer) -> None:
+        self._tracer = tracer
+        self._finding = threading.local()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                if (spec := finder.find_spec(fullname, path, target)) is not None:
+                    return self._timed(spec)
+            return None
+        finally:
+            self._finding.active = False
+
+    def _timed(self, spec: ModuleSpec) -> ModuleSpec:
+        loader = spec.loader
+        exec_module = getattr(loader, "exec_module", None)
+        if loader is None or isinstance(loader, type) or exec_module is None:
+            return spec
+        try:
+            timed_loader = copy.copy(loader)
+        except Exception:
+            return spec
+        tracer = self._tracer
+
+        def timed_exec_module(module: ModuleType) -> None:
+            with tracer.span(spec.name, "import"):
+                exec_module(module)
+
+        try:
+            timed_loader.exec_module = timed_exec_module
+        except (AttributeError, TypeError):
+            return spec
+        spec.loader = timed_loader
+        return spec
+
+
+def parse_trace_options(
+    argv: Sequence[str], environ: Mapping[str, str]
+) -> tuple[bool, Path | None, bool]:
+    """``(enabled, report_path, exit_after_paint)`` from the CLI and environment."""
+    enabled = False
+    report_path: Path | None = None
+
+    if (value := environ.get(TRACE_ENV, "").strip()) and value.lower() not in {"0", "false"}:
+        enabled = True
+        if value.lower() not in _TRUTHY:
+            report_path = Path(value).expanduser()
+
+    for arg in argv:
+        if arg == TRACE_FLAG:
+            enabled = True
+        elif arg.startswith(f"{TRACE_FLAG}="):
+            enabled = True
+            report_path = Path(arg.split("=", 1)[1]).expanduser()
+
+    exit_after_paint = BENCHMARK_FLAG in argv or (
+        environ.get(BENCHMARK_ENV, "").strip().lower() in _TRUTHY
+    )
+    return enabled or exit_after_paint, report_path, exit_after_paint
+
+
+_tracer: StartupTracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_startup_tracer() -> StartupTracer:
+    """Get the process-wide tracer; disabled unless :func:`start_startup_trace` enabled it."""
+    global _tracer  # noqa: PLW0603
+    if (tracer := _tracer) is not None:
+        return tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = StartupTracer()
+        return _tracer
+
+
+def reset_startup_tracer() -> None:
+    """Drop the process-wide tracer and its import hook (tests)."""
+    global _tracer  # noqa: PLW0603
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.remove_import_hook()
+        _tracer = None
+
+
+def start_startup_trace(
+    argv: Sequence[str] | None = None, environ: Mapping[str, str] | None = None
+) -> StartupTracer:
+    """Configure the process-wide tracer from the CLI/environment and start timing imports."""
+    global _tracer  # noqa: PLW0603
+    enabled, report_path, exit_after_paint = parse_trace_options(
+        sys.argv[1:] if argv is None else argv, os.environ if environ is None else environ
+    )
+    with _tracer_lock:
+        if _tracer is None or not _tracer.enabled:
+            _tracer = StartupTracer(enabled, report_path, exit_after_paint)
+        tracer = _tracer
+    tracer.install_import_hook()
+    return tracer
+
+
+def trace_phase(name: str) -> AbstractContextManager[None]:
+    """Time a startup phase on the process-wide tracer."""
+    return get_startup_tracer().span(name)
@@ -344,6 +344,56 @@ def mock_yt_dlp_fixture():
     return mock_yt_dlp_module
 
 
+@pytest.fixture(autouse=True)
+def isolated_youtube_info_cache(tmp_path, monkeypatch):
+    """Keep the shared YouTube info cache out of the user's data directory."""
+    from src.services.youtube import info_cache
+
+    cache = info_cache.YouTubeInfoCache(cache_dir=tmp_path / "youtube_info")
+    monkeypatch.setattr(info_cache, "_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_spotify_cache(tmp_path, monkeypatch):
+    """Keep the shared Spotify lookup cache out of the user's data directory."""
+    from src.services.spotify import cache as spotify_cache
+
+    cache = spotify_cache.SpotifyCache(path=tmp_path / "spotify.json")
+    monkeypatch.setattr(spotify_cache, "_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_radiojavan_host_cache(monkeypatch):
+    """Give every test an empty RadioJavan CDN host cache."""
+    from src.services.radiojavan import host_cache
+
+    cache = host_cache.CdnHostCache()
+    monkeypatch.setattr(host_cache, "_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_twitter_endpoint_scoreboard(monkeypatch):
+    """Give every test a Twitter endpoint scoreboard with no history."""
+    from src.services.twitter import endpoints
+
+    scoreboard = endpoints.EndpointScoreboard()
+    monkeypatch.setattr(endpoints, "_scoreboard", scoreboard)
+    return scoreboard
+
+
+@pytest.fixture(autouse=True)
+def isolated_connectivity_state():
+    """Start every test without connectivity results cached by earlier tests."""
+    from src.services.network.checker import invalidate_site_connection
+
+    invalidate_site_connection()
+    yield
+    invalidate_site_connection()
+
+
 # ================================
 # PYTEST CONFIGURATION
 # ================================
@@ -396,6 +396,57 @@ class TestDownloadCoordinator:
         assert len(status_messages) == 1
         assert "Failed: test" in status_messages[0]
 
+    def test_download_coordinator_overall_progress_is_incremental(self):
+        """Overall progress follows events without rescanning the queue."""
+        download_handler = MockDownloadHandler()
+        coordinator = DownloadCoordinator(
+            event_bus=DownloadEventBus(None),
+            download_handler=download_handler,
+            error_handler=MockErrorHandler(),
+            message_queue=MockMessageQueue(),
+        )
+        first = Download(url="https://test.com/1", name="first")
+        second = Download(url="https://test.com/2", name="second")
+        coordinator.add_download(first)
+        coordinator.add_download(second)
+        download_handler.get_downloads = Mock(side_effect=AssertionError("queue scanned"))
+
+        first.progress = 50.0
+        coordinator._on_progress_event(first, 50.0, 0.0)
+        assert coordinator._calculate_overall_progress() == 25.0
+
+        first.progress = 100.0
+        coordinator._on_completed_event(first)
+        assert coordinator._calculate_overall_progress() == 0.0
+
+        second.progress = 40.0
+        coordinator._on_progress_event(second, 40.0, 0.0)
+        assert coordinator._calculate_overall_progress() == 40.0
+
+        coordinator._on_failed_event(second, "boom")
+        assert coordinator._calculate_overall_progress() == 100.0
+
+    def test_download_coordinator_progress_resyncs_with_handler(self):
+        """Downloads queued behind the coordinator's back are picked up on refresh."""
+        download_handler = MockDownloadHandler()
+        coordinator = DownloadCoordinator(
+            event_bus=DownloadEventBus(None),
+            download_handler=download_handler,
+            error_handler=MockErrorHandler(),
+            message_queue=MockMessageQueue(),
+            ui_callbacks={"refresh_download_list": lambda _downloads: None},
+        )
+        download_handler.downloads = [
+            Download(url="https://test.com/1", name="a", progress=20.0),
+            Download(url="https://test.com/2", name="b", status=DownloadStatus.COMPLETED),
+        ]
+
+        coordinator._refresh_ui_after_event()
+        assert coordinator._calculate_overall_progress() == 20.0
+
+        coordinator.clear_downloads()
+        assert coordinator._calculate_overall_progress() == 0.0
+
 
 class TestEventCoordinator:
     """Test EventCoordinator with dependency injection."""
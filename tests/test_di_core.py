@@ -191,6 +191,64 @@ class TestServiceContainerCore:
             container.get(ServiceA)
 
 
+class TestResolutionPlan:
+    """Constructor reflection happens once per implementation type."""
+
+    def test_plan_reused_across_transient_constructions(self, monkeypatch):
+        from src.application import di_container
+
+        calls = []
+        real_get_type_hints = di_container.get_type_hints
+
+        def counting_get_type_hints(*args, **kwargs):
+            calls.append(args[0])
+            return real_get_type_hints(*args, **kwargs)
+
+        monkeypatch.setattr(di_container, "get_type_hints", counting_get_type_hints)
+        container = ServiceContainer()
+        container.register_singleton(MockService)
+
+        first = container.create_with_injection(MockServiceWithDeps)
+        second = container.create_with_injection(MockServiceWithDeps)
+
+        assert first is not second
+        assert first.dependency is second.dependency
+        # One reflection pass per class, none for the second construction.
+        assert len(calls) == 2
+        assert set(calls) == {MockService.__init__, MockServiceWithDeps.__init__}
+
+    def test_plan_sees_services_registered_after_compilation(self):
+        class ServiceWithOptional:
+            def __init__(self, dependency: MockService | None = None):
+                self.dependency = dependency
+
+        container = ServiceContainer()
+        assert container.create_with_injection(ServiceWithOptional).dependency is None
+
+        container.register_singleton(MockService)
+
+        assert isinstance(
+            container.create_with_injection(ServiceWithOptional).dependency, MockService
+        )
+
+    def test_validate_dependencies_prebuilds_plans(self):
+        container = ServiceContainer()
+        container.register_transient(MockService)
+        container.register_transient(MockServiceWithDeps)
+
+        container.validate_dependencies()
+
+        assert set(container._plans) == {MockService, MockServiceWithDeps}
+
+    def test_clear_drops_plans(self):
+        container = ServiceContainer()
+        container.precompile(MockServiceWithDeps)
+
+        container.clear()
+
+        assert container._plans == {}
+
+
 class TestLazyImports:
     """Test that lazy imports work correctly."""
 
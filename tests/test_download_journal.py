@@ -0,0 +1,132 @@
+"""Tests for the crash-safe download queue journal."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import AppConfig
+from src.core.enums.download_status import DownloadStatus
+from src.core.models import Download
+from src.handlers.download_handler import DownloadHandler
+from src.services.downloads import DownloadJournal
+
+
+@pytest.fixture
+def config():
+    cfg = AppConfig()
+    cfg.downloads.journal_flush_interval = 0
+    return cfg
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "download_queue.jsonl"
+
+
+def make_download(name):
+    return Download(name=name, url=f"https://example.com/{name}.mp4")
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestDownloadJournal:
+    """Recording, batching, replay and compaction."""
+
+    def test_replay_restores_unfinished_downloads(self, journal_path, config):
+        journal = DownloadJournal(journal_path, config)
+        pending, running, done, removed = (make_download(n) for n in "abcd")
+        for download in (pending, running, done, removed):
+            journal.record_add(download)
+        running.status = DownloadStatus.DOWNLOADING
+        running.progress = 42.0
+        journal.record_update(running, "status", "progress")
+        done.status = DownloadStatus.COMPLETED
+        journal.record_update(done, "status")
+        journal.record_remove(removed)
+        journal.close()
+
+        restored = DownloadJournal(journal_path, config).replay()
+
+        assert [d.id for d in restored] == [pending.id, running.id]
+        assert restored[1].status == DownloadStatus.PENDING
+        assert restored[1].progress == 42.0
+
+    def test_updates_are_merged_before_flush(self, journal_path, config):
+        journal = DownloadJournal(journal_path, config)
+        download = make_download("a")
+        journal.record_add(download)
+        for progress in (10.0, 20.0, 30.0):
+            download.progress = progress
+            journal.record_update(download, "progress")
+        journal.close()
+
+        records = read_records(journal_path)
+        assert len(records) == 1
+        assert records[0]["download"]["progress"] == 30.0
+
+    def test_torn_last_line_is_ignored(self, journal_path, config):
+        journal = DownloadJournal(journal_path, config)
+        download = make_download("a")
+        journal.record_add(download)
+        journal.close()
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "remove", "id": ')
+
+        restored = DownloadJournal(journal_path, config).replay()
+
+        assert [d.id for d in restored] == [download.id]
+
+    def test_log_is_compacted_past_threshold(self, journal_path, config):
+        config.downloads.journal_compact_threshold = 3
+        journal = DownloadJournal(journal_path, config)
+        keep = make_download("keep")
+        journal.record_add(keep)
+        for name in "abc":
+            journal.record_add(gone := make_download(name))
+            journal.flush()
+            journal.record_remove(gone)
+            journal.flush()
+        journal.close()
+
+        # Seven records were written; compaction kept the file short and equivalent.
+        assert len(read_records(journal_path)) < 7
+        assert [d.id for d in DownloadJournal(journal_path, config).replay()] == [keep.id]
+
+    def test_clear_drops_everything(self, journal_path, config):
+        journal = DownloadJournal(journal_path, config)
+        journal.record_add(make_download("a"))
+        journal.record_clear()
+        journal.close()
+
+        assert DownloadJournal(journal_path, config).replay() == []
+
+
+class TestDownloadHandlerJournal:
+    """DownloadHandler mirrors its queue into the journal."""
+
+    def make_handler(self, journal, config):
+        return DownloadHandler(
+            service_factory=Mock(),
+            file_service=Mock(),
+            ui_state=Mock(),
+            cookie_handler=Mock(),
+            config=config,
+            journal=journal,
+        )
+
+    def test_queue_survives_restart(self, journal_path, config):
+        handler = self.make_handler(DownloadJournal(journal_path, config), config)
+        handler.initialize()
+        first, second = make_download("a"), make_download("b")
+        handler.add_download(first)
+        handler.add_download(second)
+        handler.remove_downloads([0])
+        handler.cleanup()
+
+        restarted = self.make_handler(DownloadJournal(journal_path, config), config)
+        restarted.initialize()
+
+        assert [d.id for d in restarted.get_downloads()] == [second.id]
@@ -0,0 +1,88 @@
+"""Tests for the download list's row diffing (the widget itself needs a display)."""
+
+from src.core import Download, DownloadStatus
+from src.ui.components.download_list import DownloadRows, RowValues
+
+
+def _download(name: str = "video", **kwargs) -> Download:
+    return Download(name=name, url=f"https://example.com/{name}", **kwargs)
+
+
+def _drawn(*items: Download) -> DownloadRows:
+    rows = DownloadRows()
+    rows.replace(items)
+    rows.take_changes()
+    return rows
+
+
+class TestDownloadRows:
+    def test_first_refresh_inserts_every_row_in_order(self):
+        first, second = _download("a"), _download("b")
+        rows = DownloadRows()
+
+        rows.replace([first, second])
+        changes = rows.take_changes()
+
+        assert [(index, i) for index, i, _ in changes.inserted] == [(0, first.id), (1, second.id)]
+        assert changes.removed == [] and changes.updated == [] and changes.reordered is None
+
+    def test_progress_update_redraws_only_that_row(self):
+        first, second = _download("a"), _download("b")
+        rows = _drawn(first, second)
+
+        second.status = DownloadStatus.DOWNLOADING
+        second.progress = 42
+        rows.touch(second)
+        changes = rows.take_changes()
+
+        assert changes.updated == [(second.id, RowValues.of(second))]
+        assert changes.updated[0][1].status == "Downloading 42%"
+        assert not changes.inserted and not changes.removed
+
+    def test_duplicate_names_are_kept_apart(self):
+        first, second = _download("same"), _download("same")
+        rows = _drawn(first, second)
+
+        first.status = DownloadStatus.FAILED
+        first.error_message = "boom"
+        rows.touch(first)
+        changes = rows.take_changes()
+
+        assert changes.updated == [(first.id, RowValues("same", first.url, "Failed: boom", True))]
+
+    def test_unchanged_touch_produces_no_changes(self):
+        item = _download()
+        rows = _drawn(item)
+
+        rows.touch(item)
+
+        assert not rows.take_changes()
+
+    def test_refresh_removes_missing_rows(self):
+        first, second, third = _download("a"), _download("b"), _download("c")
+        rows = _drawn(first, second, third)
+
+        rows.replace([first, third])
+        changes = rows.take_changes()
+
+        assert changes.removed == [second.id]
+        assert not changes.inserted and changes.reordered is None
+
+    def test_reorder_reports_full_order(self):
+        first, second = _download("a"), _download("b")
+        rows = _drawn(first, second)
+
+        rows.replace([second, first])
+
+        assert rows.take_changes().reordered == [second.id, first.id]
+
+    def test_append_inserts_at_end(self):
+        first = _download("a")
+        rows = _drawn(first)
+        added = _download("b")
+
+        rows.append(added)
+        changes = rows.take_changes()
+
+        assert [(index, i) for index, i, _ in changes.inserted] == [(1, added.id)]
+        assert changes.reordered is None
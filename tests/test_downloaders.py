@@ -9,6 +9,7 @@ from src.core.enums import ServiceType
 from src.services.pinterest.downloader import PinterestDownloader
 from src.services.soundcloud.downloader import SoundCloudDownloader
 from src.services.spotify.downloader import SpotifyDownloader
+from src.services.twitter.downloader import TwitterDownloader
 from src.services.youtube.downloader import YouTubeDownloader
 
 
@@ -206,6 +207,113 @@ class TestPinterestDownloader:
         assert downloader.download("https://pin.it/3YtKpHT04", save_path) is False
 
 
+class TestTwitterMultiMedia:
+    """Tweets with several photos or videos fetch their items side by side."""
+
+    def test_items_download_concurrently_with_combined_progress(self, tmp_path):
+        import threading
+
+        from src.core.config import AppConfig
+        from src.services.file.models import DownloadResult
+
+        config = AppConfig()
+        config.downloads.item_concurrency = 3
+        started = threading.Barrier(3, timeout=5)
+        reports = []
+
+        class ConcurrentFileService(MockFileService):
+            def download_file(self, url, path, progress_callback=None):
+                started.wait()  # only passes if all three items run at once
+                with open(path, "wb") as f:
+                    f.write(b"data")
+                progress_callback(100.0, 0.0)
+                return DownloadResult(success=True, file_path=path)
+
+        downloader = TwitterDownloader(
+            error_handler=MockErrorNotifier(), file_service=ConcurrentFileService(), config=config
+        )
+        media = [{"url": f"https://pbs.twimg.com/media/{i}.jpg", "type": "photo"} for i in range(3)]
+
+        assert downloader._download_media(
+            media, str(tmp_path / "tweet"), lambda *args: reports.append(args)
+        )
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "tweet_0.jpg",
+            "tweet_1.jpg",
+            "tweet_2.jpg",
+        ]
+        assert [round(progress, 1) for progress, _ in reports] == [33.3, 66.7, 100.0]
+
+
+TWEET_PAYLOAD = {"tweet": {"text": "hello", "media": {"all": []}}}
+
+
+class TestTwitterEndpointRanking:
+    """Tweet API mirrors are tried by observed health, with optional hedging."""
+
+    @staticmethod
+    def json_response(payload):
+        response = Mock()
+        response.headers = {"content-type": "application/json"}
+        response.json.return_value = payload
+        return response
+
+    @staticmethod
+    def make_downloader(hedge_delay):
+        from src.core.config import AppConfig
+
+        config = AppConfig()
+        config.network.twitter_hedge_delay = hedge_delay
+        return TwitterDownloader(
+            error_handler=MockErrorNotifier(), file_service=MockFileService(), config=config
+        )
+
+    @patch("src.services.twitter.downloader.requests.exceptions.RequestException", OSError)
+    def test_failing_mirror_drops_behind_working_one(self):
+        downloader = self.make_downloader(hedge_delay=0)
+        calls = []
+
+        def fake_get(url, **_):
+            calls.append(url)
+            if "fxtwitter" in url:
+                raise ConnectionError("mirror down")
+            return self.json_response(TWEET_PAYLOAD)
+
+        with patch("src.services.twitter.downloader.requests.get", side_effect=fake_get):
+            assert downloader._scrape_tweet_data("1")["text"] == "hello"
+            assert len(calls) == 2
+            calls.clear()
+            assert downloader._scrape_tweet_data("2")["text"] == "hello"
+
+        assert len(calls) == 1
+        assert "vxtwitter" in calls[0]
+
+    def test_hedged_request_takes_the_first_answer(self):
+        import threading
+        import time
+
+        downloader = self.make_downloader(hedge_delay=0.05)
+        release_slow = threading.Event()
+
+        def fake_get(url, **_):
+            if url.endswith("api.fxtwitter.com/status/1"):
+                release_slow.wait(5)
+                return self.json_response({"tweet": {"text": "slow"}})
+            return self.json_response(TWEET_PAYLOAD)
+
+        started = time.monotonic()
+        with patch("src.services.twitter.downloader.requests.get", side_effect=fake_get):
+            tweet = downloader._scrape_tweet_data("1")
+        release_slow.set()
+
+        assert tweet["text"] == "hello"
+        assert time.monotonic() - started < 2
+        assert downloader.scoreboard.rank(["fxtwitter", "vxtwitter_user"]) == [
+            "vxtwitter_user",
+            "fxtwitter",
+        ]
+
+
 class TestSoundCloudDownloaderOutputVerification:
     @patch("src.services.soundcloud.downloader.yt_dlp.YoutubeDL")
     def test_soundcloud_download_requires_verified_output(self, mock_ydl_class, tmp_path):
@@ -312,6 +420,93 @@ class TestYouTubeDownloaderFormatFallback:
         assert mock_ydl.extract_info.call_count >= 2
 
 
+class TestYouTubeInfoCache:
+    """Test the info-dict cache shared by metadata extraction and downloads."""
+
+    @staticmethod
+    def _info(expire: float | None = None) -> dict:
+        query = f"?expire={int(expire)}" if expire else ""
+        return {
+            "id": "abc123",
+            "title": "Video",
+            "formats": [{"format_id": "18", "url": f"https://rr1.googlevideo.com/v{query}"}],
+            "requested_formats": [{"format_id": "18"}],
+        }
+
+    def test_round_trips_through_disk(self, tmp_path):
+        from src.services.youtube.info_cache import YouTubeInfoCache
+
+        YouTubeInfoCache(cache_dir=tmp_path).put("abc123", "no-cookies", self._info())
+
+        cached = YouTubeInfoCache(cache_dir=tmp_path).get("abc123", "no-cookies")
+        assert cached is not None
+        assert cached["title"] == "Video"
+        assert "requested_formats" not in cached
+        assert YouTubeInfoCache(cache_dir=tmp_path).get("abc123", "cookie-file") is None
+
+    def test_skips_entries_near_signed_url_expiry(self, tmp_path):
+        import time
+
+        from src.services.youtube.info_cache import YouTubeInfoCache
+
+        cache = YouTubeInfoCache(cache_dir=tmp_path)
+        cache.put("abc123", "no-cookies", self._info(expire=time.time() + 60))
+        assert cache.get("abc123", "no-cookies") is None
+
+        cache.put("abc123", "no-cookies", self._info(expire=time.time() + 6 * 3600))
+        assert cache.get("abc123", "no-cookies") is not None
+
+    def test_does_not_cache_playlists(self, tmp_path):
+        from src.services.youtube.info_cache import YouTubeInfoCache
+
+        cache = YouTubeInfoCache(cache_dir=tmp_path)
+        cache.put("abc123", "no-cookies", {"_type": "playlist", "entries": []})
+        assert cache.get("abc123", "no-cookies") is None
+
+    @patch("src.services.youtube.downloader.yt_dlp.YoutubeDL")
+    def test_download_reuses_cached_info(self, mock_ydl_class, isolated_youtube_info_cache):
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        isolated_youtube_info_cache.put("abc123", "no-cookies", self._info())
+
+        downloader = YouTubeDownloader(
+            error_handler=MockErrorNotifier(), file_service=MockFileService()
+        )
+        with (
+            patch.object(downloader, "_build_auth_strategies", return_value=[("no-cookies", {})]),
+            patch.object(downloader, "_verify_download_completion", return_value=True),
+            patch("os.makedirs"),
+        ):
+            assert downloader.download("https://youtube.com/watch?v=abc123", "/tmp/test.mp4")
+
+        mock_ydl.process_ie_result.assert_called_once()
+        assert mock_ydl.process_ie_result.call_args.args[0]["id"] == "abc123"
+        mock_ydl.extract_info.assert_not_called()
+
+    @patch("src.services.youtube.downloader.yt_dlp.YoutubeDL")
+    def test_download_re_extracts_when_cached_info_fails(
+        self, mock_ydl_class, isolated_youtube_info_cache
+    ):
+        mock_ydl = MagicMock()
+        mock_ydl.process_ie_result.side_effect = Exception("HTTP Error 403: Forbidden")
+        mock_ydl.extract_info.return_value = {"id": "abc123"}
+        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        isolated_youtube_info_cache.put("abc123", "no-cookies", self._info())
+
+        downloader = YouTubeDownloader(
+            error_handler=MockErrorNotifier(), file_service=MockFileService()
+        )
+        with (
+            patch.object(downloader, "_build_auth_strategies", return_value=[("no-cookies", {})]),
+            patch.object(downloader, "_verify_download_completion", return_value=True),
+            patch("os.makedirs"),
+        ):
+            assert downloader.download("https://youtube.com/watch?v=abc123", "/tmp/test.mp4")
+
+        mock_ydl.extract_info.assert_called_once()
+        assert isolated_youtube_info_cache.get("abc123", "no-cookies") is None
+
+
 class TestDownloadStateManagement:
     """Test download state management for multiple downloads."""
 
@@ -0,0 +1,170 @@
+"""Tests for the queue-based event bus and its drain schedulers."""
+
+import threading
+from unittest.mock import Mock
+
+from src.core.enums.events import DownloadEvent
+from src.core.models import Download
+from src.services.events.event_bus import DownloadEventBus
+from src.services.events.scheduler import ThreadDrainScheduler, TkDrainScheduler
+
+
+def make_download(name):
+    return Download(name=name, url=f"https://example.com/{name}.mp4")
+
+
+def record_events(bus):
+    received = []
+    for event in DownloadEvent:
+        bus.subscribe(
+            event,
+            lambda event=event, **kwargs: received.append((event, kwargs)),
+        )
+    return received
+
+
+def drain(bus):
+    bus._processing = True
+    return bus._process_events()
+
+
+class TestDownloadEventBusCoalescing:
+    def test_keeps_only_latest_progress_per_download(self):
+        bus = DownloadEventBus(None)
+        received = record_events(bus)
+        first, second = make_download("a"), make_download("b")
+
+        for value in (10, 20, 30):
+            bus.publish(DownloadEvent.PROGRESS, download=first, progress=value, speed=1.0)
+        bus.publish(DownloadEvent.PROGRESS, download=second, progress=5, speed=1.0)
+        bus.publish(DownloadEvent.PROGRESS, download=first, progress=40, speed=1.0)
+
+        assert bus.pending_count == 2
+        assert bus.coalesced_count == 3
+        drain(bus)
+
+        assert [(kw["download"].name, kw["progress"]) for _, kw in received] == [
+            ("a", 40),
+            ("b", 5),
+        ]
+
+    def test_completion_is_a_barrier_for_progress(self):
+        bus = DownloadEventBus(None)
+        received = record_events(bus)
+        download = make_download("a")
+
+        bus.publish(DownloadEvent.PROGRESS, download=download, progress=50, speed=1.0)
+        bus.publish(DownloadEvent.PROGRESS, download=download, progress=100, speed=1.0)
+        bus.publish(DownloadEvent.COMPLETED, download=download)
+        bus.publish(DownloadEvent.PROGRESS, download=download, progress=100, speed=0.0)
+        drain(bus)
+
+        assert [event for event, _ in received] == [
+            DownloadEvent.PROGRESS,
+            DownloadEvent.COMPLETED,
+            DownloadEvent.PROGRESS,
+        ]
+        assert received[0][1]["progress"] == 100
+
+    def test_terminal_events_are_never_coalesced(self):
+        bus = DownloadEventBus(None)
+        received = record_events(bus)
+        download = make_download("a")
+
+        bus.publish(DownloadEvent.FAILED, download=download, error="first")
+        bus.publish(DownloadEvent.FAILED, download=download, error="second")
+        drain(bus)
+
+        assert [kw["error"] for _, kw in received] == ["first", "second"]
+
+    def test_drain_is_capped_per_cycle(self):
+        bus = DownloadEventBus(None, max_events_per_drain=2)
+        received = record_events(bus)
+        downloads = [make_download(str(i)) for i in range(5)]
+        for download in downloads:
+            bus.publish(DownloadEvent.COMPLETED, download=download)
+
+        assert drain(bus) is True
+        assert len(received) == 2
+        assert bus.pending_count == 3
+
+        assert drain(bus) is True
+        assert drain(bus) is False
+        assert [kw["download"] for _, kw in received] == downloads
+
+    def test_clear_drops_pending_events(self):
+        bus = DownloadEventBus(None)
+        download = make_download("a")
+        bus.publish(DownloadEvent.PROGRESS, download=download, progress=10, speed=1.0)
+        bus.clear()
+        assert bus.pending_count == 0
+
+        received = record_events(bus)
+        bus.publish(DownloadEvent.PROGRESS, download=download, progress=20, speed=1.0)
+        drain(bus)
+        assert [kw["progress"] for _, kw in received] == [20]
+
+
+class TestDrainSchedulers:
+    def test_tk_wakeups_collapse_until_drained(self):
+        root = Mock()
+        bus = DownloadEventBus(root)
+        root.after_idle.reset_mock()
+        received = record_events(bus)
+        download = make_download("a")
+
+        bus.publish(DownloadEvent.STARTED, download=download)
+        bus.publish(DownloadEvent.COMPLETED, download=download)
+        assert root.after_idle.call_count == 1
+
+        run = root.after_idle.call_args.args[0]
+        run()
+        assert [event for event, _ in received] == [
+            DownloadEvent.STARTED,
+            DownloadEvent.COMPLETED,
+        ]
+
+        bus.publish(DownloadEvent.FAILED, download=download, error="boom")
+        assert root.after_idle.call_count == 2
+
+    def test_tk_backlog_drains_on_idle_and_idle_checks_back_off(self):
+        root = Mock()
+        results = iter([True, False, False, False])
+        scheduler = TkDrainScheduler(root, min_idle_ms=10, max_idle_ms=30)
+
+        scheduler.start(lambda: next(results))
+        assert root.after_idle.call_count == 1
+        assert root.after.call_count == 0
+
+        root.after_idle.call_args.args[0]()
+        root.after.call_args.args[1]()
+        root.after.call_args.args[1]()
+        assert [c.args[0] for c in root.after.call_args_list] == [10, 20, 30]
+
+        scheduler.wake()
+        root.after_idle.call_args.args[0]()
+        assert root.after.call_args.args[0] == 10
+
+    def test_tk_stop_cancels_pending_check(self):
+        root = Mock()
+        root.after.return_value = "after#1"
+        scheduler = TkDrainScheduler(root)
+        scheduler.start(lambda: False)
+
+        scheduler.stop()
+        scheduler.wake()
+        root.after_cancel.assert_called_once_with("after#1")
+        root.after_idle.assert_not_called()
+
+    def test_thread_scheduler_dispatches_without_root(self):
+        completed = threading.Event()
+        scheduler = ThreadDrainScheduler(idle_timeout=0.05)
+        bus = DownloadEventBus(None, scheduler=scheduler)
+        bus.subscribe(DownloadEvent.COMPLETED, lambda **_: completed.set())
+
+        bus.publish(DownloadEvent.COMPLETED, download=make_download("a"))
+        try:
+            assert completed.wait(timeout=2)
+        finally:
+            bus.stop_processing()
+        assert not scheduler.running
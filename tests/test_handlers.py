@@ -226,6 +226,57 @@ class TestHandlerRegistration:
             ), f"{handler.__class__.__name__}.get_ui_callback is not callable"
 
 
+class TestUrlClassifier:
+    """One compiled pass maps URLs to their service and link handler."""
+
+    def test_classifies_handler_and_service_together(self):
+        from src.core.enums import ServiceType
+        from src.services.detection import UrlClassifier
+
+        classifier = UrlClassifier()
+
+        result = classifier.classify("https://x.com/user/status/123")
+        assert (result.service_type, result.handler_name) == (ServiceType.TWITTER, "TwitterHandler")
+
+        result = classifier.classify("https://music.youtube.com/watch?v=abc")
+        assert (result.service_type, result.handler_name) == (ServiceType.YOUTUBE, "YouTubeHandler")
+
+        # No handler pattern matches a profile page, but the host still names the service.
+        result = classifier.classify("https://www.instagram.com/someone/")
+        assert (result.service_type, result.handler_name) == (ServiceType.INSTAGRAM, None)
+
+    def test_hosts_match_whole_domain_labels(self):
+        from src.core.enums import ServiceType
+        from src.services.detection import UrlClassifier
+
+        classifier = UrlClassifier(handler_patterns={})
+
+        assert classifier.service_for_url("https://m.soundcloud.com/a/b") == ServiceType.SOUNDCLOUD
+        assert classifier.service_for_url("pin.it/xyz789") == ServiceType.PINTEREST
+        assert classifier.service_for_url("https://box.com/x.com/file") == ServiceType.GENERIC
+        assert classifier.service_for_url("https://notyoutube.com/watch") == ServiceType.GENERIC
+
+    def test_registry_reuses_handler_instances(self):
+        from src.services.detection import LinkDetectionRegistry
+
+        _register_link_handlers()
+        created = []
+
+        def factory(handler_class):
+            created.append(handler_class.__name__)
+            return handler_class(message_queue=None)
+
+        LinkDetectionRegistry.set_handler_factory(factory)
+        try:
+            url = "https://soundcloud.com/artist/track"
+            first = LinkDetectionRegistry.detect_handler(url)
+            assert LinkDetectionRegistry.detect_handler(url) is first
+            assert LinkDetectionRegistry.quick_detect(url) == "SoundCloudHandler"
+            assert created == ["SoundCloudHandler"]
+        finally:
+            LinkDetectionRegistry._handler_factory = None
+
+
 class TestYouTubeHandler:
     """Test YouTube handler with dependency injection."""
 
@@ -532,6 +583,141 @@ class TestDownloadHandler:
                 detected_type == expected_type
             ), f"Expected {expected_type}, got {detected_type} for {url}"
 
+    def test_concurrency_gate_lets_idle_hosts_overtake_saturated_ones(self):
+        """A queued item for a busy host must not hold up items for idle hosts."""
+        from src.core.config import AppConfig
+        from src.handlers.download_handler import _ConcurrencyGate
+
+        gate = _ConcurrencyGate(AppConfig(), max_active=3)
+        pending = [
+            (Mock(), "radiojavan", "www.radiojavan.com"),
+            (Mock(), "radiojavan", "www.radiojavan.com"),
+            (Mock(), "youtube", "www.youtube.com"),
+        ]
+
+        assert gate.take_next(pending)[1] == "radiojavan"
+        assert gate.take_next(pending)[1] == "youtube"
+        assert [item[1] for item in pending] == ["radiojavan"]
+
+        gate.release("radiojavan", "www.radiojavan.com")
+        assert gate.take_next(pending)[1] == "radiojavan"
+
+    def test_concurrency_gate_lends_only_free_slots(self):
+        """Item fan-out borrows idle slots within the global and per-service caps."""
+        from src.core.config import AppConfig
+        from src.handlers.download_handler import _ConcurrencyGate
+
+        gate = _ConcurrencyGate(AppConfig(), max_active=4)
+        pending = [(Mock(), "instagram", "www.instagram.com")]
+        gate.take_next(pending)
+
+        # Instagram allows two concurrent downloads, so one extra slot is lent.
+        budget = gate.budget("instagram", "www.instagram.com")
+        assert budget.borrow(3) == 1
+        assert budget.borrow(3) == 0
+        assert gate.budget("youtube", "www.youtube.com").borrow(5) == 2
+
+        budget.give_back(1)
+        assert budget.borrow(3) == 1
+
+    def test_start_downloads_respects_per_host_limit(self, tmp_path):
+        """Workers never exceed a host's max_downloads_per_host."""
+        import threading
+        import time
+
+        from src.core.config import AppConfig
+        from src.core.enums.service_type import ServiceType
+        from src.core.models import Download
+        from src.handlers.download_handler import DownloadHandler
+
+        config = AppConfig()
+        config.downloads.max_concurrent_downloads = 4
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def fake_download(url, save_path, progress_callback=None):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return True
+
+        service_factory = Mock()
+        service_factory.get_downloader.return_value.download.side_effect = fake_download
+        handler = DownloadHandler(
+            service_factory=service_factory,
+            file_service=MockFileService(),
+            ui_state=MockUIState(),
+            cookie_handler=Mock(),
+            config=config,
+        )
+        done = threading.Event()
+        downloads = [
+            Download(
+                name=f"video{i}",
+                url=f"https://www.youtube.com/watch?v=v{i}",
+                service_type=ServiceType.YOUTUBE,
+            )
+            for i in range(5)
+        ]
+
+        handler.start_downloads(
+            downloads, str(tmp_path), completion_callback=lambda *_: done.set()
+        )
+
+        assert done.wait(5)
+        _, host_cap = config.services.concurrency_limits("youtube")
+        assert active["peak"] == host_cap
+        assert service_factory.get_downloader.return_value.download.call_count == 5
+
+    def test_pause_and_cancel_stop_running_worker(self, tmp_path):
+        """A paused or cancelled worker unwinds promptly and frees its slot."""
+        import threading
+
+        from src.core.enums.download_status import DownloadStatus
+        from src.core.models import Download
+        from src.handlers.download_handler import DownloadHandler
+        from src.services.downloads import current_token, raise_if_cancelled
+
+        started = threading.Event()
+
+        def fake_download(url, save_path, progress_callback=None):
+            started.set()
+            token = current_token()
+            while not token.sleep(0.01):
+                pass
+            raise_if_cancelled()
+            return True
+
+        service_factory = Mock()
+        service_factory.get_downloader.return_value.download.side_effect = fake_download
+        handler = DownloadHandler(
+            service_factory=service_factory,
+            file_service=MockFileService(),
+            ui_state=MockUIState(),
+            cookie_handler=Mock(),
+        )
+        download = Download(name="clip", url="https://example.com/clip.mp4")
+
+        for stop, expected in (
+            (handler.pause_download, DownloadStatus.PAUSED),
+            (handler.cancel_download, DownloadStatus.CANCELLED),
+        ):
+            started.clear()
+            done = threading.Event()
+            handler.start_downloads(
+                [download], str(tmp_path), completion_callback=lambda *_: done.set()
+            )
+            assert started.wait(5)
+            stop(download)
+            assert done.wait(5)
+            assert download.status == expected
+            if expected == DownloadStatus.PAUSED:
+                assert handler.resume_download(download)
+                assert download.status == DownloadStatus.PENDING
+
 
 class TestHandlerIntegration:
     """Integration tests for handlers working together."""
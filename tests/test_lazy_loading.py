@@ -0,0 +1,81 @@
+"""Startup must not import handler or downloader modules before they are needed."""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that only matter once a URL for their service shows up.
+HEAVY_MODULES = [
+    "instaloader",
+    "bs4",
+    "src.handlers.youtube_handler",
+    "src.handlers.spotify_handler",
+    "src.services.youtube.downloader",
+    "src.services.instagram.downloader",
+    "src.services.soundcloud.downloader",
+    "src.services.spotify.downloader",
+]
+
+# Generous wall-clock ceiling for the cold import below; it only trips when
+# something drags a large dependency back onto the startup path.
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def run_fresh(code: str) -> dict:
+    """Run ``code`` in a new interpreter and return the JSON it prints last."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_startup_imports_skip_service_modules():
+    report = run_fresh(
+        f"""
+        import json, sys, time
+
+        started = time.perf_counter()
+        import src.application.service_factory
+        import src.handlers
+        from src.services.detection import LinkDetectionRegistry
+        elapsed = time.perf_counter() - started
+
+        LinkDetectionRegistry.register_manifest()
+        handler = LinkDetectionRegistry.quick_detect("https://soundcloud.com/artist/track")
+        loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+        print(json.dumps({{"elapsed": elapsed, "loaded": loaded, "handler": handler}}))
+        """
+    )
+
+    assert report["loaded"] == []
+    assert report["handler"] == "SoundCloudHandler"
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_handler_module_loads_on_first_detection():
+    report = run_fresh(
+        """
+        import json, sys
+        from src.services.detection import LinkDetectionRegistry
+
+        LinkDetectionRegistry.register_manifest()
+        before = "src.handlers.twitter_handler" in sys.modules
+        handler = LinkDetectionRegistry.detect_handler("https://x.com/user/status/123")
+        print(json.dumps({
+            "before": before,
+            "after": "src.handlers.twitter_handler" in sys.modules,
+            "handler": type(handler).__name__,
+        }))
+        """
+    )
+
+    assert report == {"before": False, "after": True, "handler": "TwitterHandler"}
@@ -0,0 +1,560 @@
+"""Tests for the direct-file download stack (session pool, resume, bandwidth, downloader)."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.config import AppConfig
+from src.core.enums.download_status import DownloadStatus
+from src.services.downloads import (
+    CancellationToken,
+    DownloadCancelledError,
+    bind_budget,
+    bind_token,
+    current_token,
+    fetch_concurrently,
+    split_progress,
+    ytdlp_cancel_hook,
+)
+from src.services.network.bandwidth import BandwidthScheduler, TokenBucket, current_transfer
+from src.services.network.downloader import download_file, stream_download
+from src.services.network.resume import PartialDownload, save_partial, sidecar_path
+from src.services.network.segmented import split_ranges
+from src.services.network.session_pool import HTTPSessionPool
+
+
+@pytest.fixture
+def config():
+    cfg = AppConfig()
+    cfg.downloads.http_pool_maxsize = 2
+    return cfg
+
+
+class TestHTTPSessionPool:
+    """Session checkout and reuse."""
+
+    @patch("src.services.network.session_pool.requests.Session")
+    def test_session_is_reused_for_same_host(self, mock_session_cls, config):
+        mock_session_cls.side_effect = lambda: MagicMock()
+        pool = HTTPSessionPool(config)
+
+        with pool.session("https://cdn.example.com/a.mp3") as first:
+            pass
+        with pool.session("https://cdn.example.com/b.mp3") as second:
+            pass
+
+        assert first is second
+        assert mock_session_cls.call_count == 1
+
+    @patch("src.services.network.session_pool.requests.Session")
+    def test_concurrent_checkouts_get_distinct_sessions(self, mock_session_cls, config):
+        mock_session_cls.side_effect = lambda: MagicMock()
+        pool = HTTPSessionPool(config)
+
+        first = pool.acquire("https://cdn.example.com/a.mp3")
+        second = pool.acquire("https://cdn.example.com/b.mp3")
+
+        assert first is not second
+
+    @patch("src.services.network.session_pool.requests.Session")
+    def test_hosts_do_not_share_sessions(self, mock_session_cls, config):
+        mock_session_cls.side_effect = lambda: MagicMock()
+        pool = HTTPSessionPool(config)
+
+        with pool.session("https://a.example.com/file") as first:
+            pass
+        with pool.session("https://b.example.com/file") as second:
+            pass
+
+        assert first is not second
+
+    @patch("src.services.network.session_pool.requests.Session")
+    def test_idle_sessions_are_bounded_and_cookies_cleared(self, mock_session_cls, config):
+        mock_session_cls.side_effect = lambda: MagicMock()
+        pool = HTTPSessionPool(config)
+        url = "https://cdn.example.com/file"
+
+        sessions = [pool.acquire(url) for _ in range(3)]
+        for session in sessions:
+            pool.release(url, session)
+
+        assert pool.idle_count(url) == 2
+        sessions[-1].close.assert_called_once()
+        for session in sessions:
+            session.cookies.clear.assert_called_once()
+
+    @patch("src.services.network.session_pool.requests.Session")
+    def test_close_all_closes_idle_sessions(self, mock_session_cls, config):
+        mock_session_cls.side_effect = lambda: MagicMock()
+        pool = HTTPSessionPool(config)
+        url = "https://cdn.example.com/file"
+
+        with pool.session(url) as session:
+            pass
+        pool.close_all()
+
+        session.close.assert_called_once()
+        assert pool.idle_count(url) == 0
+
+
+class FakeResponse:
+    """Minimal streaming response used to drive the downloader."""
+
+    def __init__(self, status_code=200, headers=None, chunks=(), fail_after=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._chunks = list(chunks)
+        self._fail_after = fail_after
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=8192):
+        for index, chunk in enumerate(self._chunks):
+            if self._fail_after is not None and index >= self._fail_after:
+                raise ConnectionError("connection reset")
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_session():
+    session = MagicMock()
+    with patch("src.services.network.downloader.get_session_pool") as mock_get_pool:
+        mock_get_pool.return_value.session.return_value.__enter__.return_value = session
+        yield session
+
+
+@pytest.fixture
+def resume_config():
+    cfg = AppConfig()
+    cfg.downloads.retry_delay = 0
+    cfg.downloads.retry_count = 1
+    return cfg
+
+
+class TestResumableDownloads:
+    """Range/If-Range resumption of interrupted .part files."""
+
+    URL = "https://cdn.example.com/video.mp4"
+
+    def test_resumes_from_existing_partial(self, tmp_path, fake_session, resume_config):
+        temp_file = str(tmp_path / "video.mp4.part")
+        with open(temp_file, "wb") as f:
+            f.write(b"hello")
+        save_partial(temp_file, PartialDownload(url=self.URL, etag='"abc"', total_size=10))
+        fake_session.get.return_value = FakeResponse(
+            206,
+            {"content-range": "bytes 5-9/10", "content-length": "5", "etag": '"abc"'},
+            [b"world"],
+        )
+
+        downloaded = stream_download(
+            self.URL, temp_file, progress_callback=None, chunk_size=4, config=resume_config
+        )
+
+        sent_headers = fake_session.get.call_args.kwargs["headers"]
+        assert sent_headers["Range"] == "bytes=5-"
+        assert sent_headers["If-Range"] == '"abc"'
+        assert downloaded == 10
+        with open(temp_file, "rb") as f:
+            assert f.read() == b"helloworld"
+        assert not os.path.exists(sidecar_path(temp_file))
+
+    def test_changed_validator_restarts_full_download(self, tmp_path, fake_session, resume_config):
+        temp_file = str(tmp_path / "video.mp4.part")
+        with open(temp_file, "wb") as f:
+            f.write(b"stale")
+        save_partial(temp_file, PartialDownload(url=self.URL, etag='"old"', total_size=10))
+        fake_session.get.return_value = FakeResponse(
+            200, {"content-length": "4", "etag": '"new"'}, [b"new!"]
+        )
+
+        downloaded = stream_download(
+            self.URL, temp_file, progress_callback=None, chunk_size=4, config=resume_config
+        )
+
+        assert downloaded == 4
+        with open(temp_file, "rb") as f:
+            assert f.read() == b"new!"
+
+    def test_broken_transfer_retries_with_range(self, tmp_path, fake_session, resume_config):
+        temp_file = str(tmp_path / "song.mp3.part")
+        fake_session.get.side_effect = [
+            FakeResponse(
+                200,
+                {"content-length": "6", "etag": '"v1"'},
+                [b"ab", b"cd", b"ef"],
+                fail_after=2,
+            ),
+            FakeResponse(
+                206,
+                {"content-range": "bytes 4-5/6", "content-length": "2", "etag": '"v1"'},
+                [b"ef"],
+            ),
+        ]
+
+        downloaded = stream_download(
+            self.URL, temp_file, progress_callback=None, chunk_size=2, config=resume_config
+        )
+
+        assert downloaded == 6
+        assert fake_session.get.call_args_list[1].kwargs["headers"]["Range"] == "bytes=4-"
+        with open(temp_file, "rb") as f:
+            assert f.read() == b"abcdef"
+
+    def test_partial_kept_after_final_failure(self, tmp_path, fake_session, resume_config):
+        resume_config.downloads.retry_count = 0
+        save_path = str(tmp_path / "song.mp3")
+        fake_session.get.return_value = FakeResponse(
+            200, {"content-length": "6", "etag": '"v1"'}, [b"ab", b"cd"], fail_after=1
+        )
+
+        with patch(
+            "src.services.network.downloader._is_mocked_requests_module", return_value=False
+        ):
+            assert download_file(self.URL, save_path, config=resume_config) is False
+
+        assert (tmp_path / "song.mp3.part").read_bytes() == b"ab"
+        assert (tmp_path / "song.mp3.part.json").exists()
+
+    def test_partial_discarded_without_validator(self, tmp_path, fake_session, resume_config):
+        save_path = str(tmp_path / "song.mp3")
+        fake_session.get.return_value = FakeResponse(
+            200, {"content-length": "6"}, [b"ab", b"cd"], fail_after=1
+        )
+
+        with patch(
+            "src.services.network.downloader._is_mocked_requests_module", return_value=False
+        ):
+            assert download_file(self.URL, save_path, config=resume_config) is False
+
+        assert not (tmp_path / "song.mp3.part").exists()
+        assert fake_session.get.call_count == 1
+
+
+class RangeServer:
+    """Fake session that serves ``payload`` with HEAD and byte-range GETs."""
+
+    def __init__(self, payload, accept_ranges=True):
+        self.payload = payload
+        self.accept_ranges = accept_ranges
+        self.ranges = []
+
+    def head(self, url, **kwargs):
+        headers = {"content-length": str(len(self.payload)), "etag": '"v1"'}
+        if self.accept_ranges:
+            headers["accept-ranges"] = "bytes"
+        response = FakeResponse(200, headers)
+        response.url = url
+        return response
+
+    def get(self, url, headers=None, **kwargs):
+        range_header = (headers or {}).get("Range")
+        if not (self.accept_ranges and range_header):
+            return FakeResponse(200, {"content-length": str(len(self.payload))}, [self.payload])
+        start, end = (int(part) for part in range_header.removeprefix("bytes=").split("-"))
+        self.ranges.append((start, end))
+        body = self.payload[start : end + 1]
+        headers = {"content-range": f"bytes {start}-{end}/{len(self.payload)}", "etag": '"v1"'}
+        return FakeResponse(206, headers, [body[i : i + 3] for i in range(0, len(body), 3)])
+
+
+@contextmanager
+def serve_ranges(server):
+    with (
+        patch("src.services.network.downloader.get_session_pool") as downloader_pool,
+        patch("src.services.network.segmented.get_session_pool") as segmented_pool,
+    ):
+        for mock_get_pool in (downloader_pool, segmented_pool):
+            mock_get_pool.return_value.session.return_value.__enter__.return_value = server
+        yield server
+
+
+@pytest.fixture
+def range_server():
+    with serve_ranges(RangeServer(b"0123456789abcdefghij")) as server:
+        yield server
+
+
+class TestSegmentedDownloads:
+    """Multi-connection byte-range downloads."""
+
+    URL = "https://pbs.twimg.com/media/video.mp4"
+
+    def test_split_ranges_covers_every_byte(self):
+        assert split_ranges(10, 3) == [(0, 3), (4, 7), (8, 9)]
+        assert split_ranges(2, 4) == [(0, 0), (1, 1)]
+
+    def test_segments_resolve_from_media_domains(self, resume_config):
+        services = resume_config.services
+        assert services.service_for_host("video.twimg.com") == "twitter"
+        assert services.download_segments_for_host("video.twimg.com") == 4
+        assert services.download_segments_for_host("scontent.cdninstagram.com") == 1
+        assert services.download_segments_for_host("cdn.example.com") == 1
+
+    def test_large_file_is_fetched_in_segments(self, tmp_path, range_server, resume_config):
+        resume_config.downloads.segmented_min_size = 10
+        temp_file = str(tmp_path / "video.mp4.part")
+        progress = []
+
+        downloaded = stream_download(
+            self.URL,
+            temp_file,
+            progress_callback=lambda pct, _speed: progress.append(pct),
+            chunk_size=3,
+            config=resume_config,
+        )
+
+        assert downloaded == 20
+        assert sorted(range_server.ranges) == [(0, 4), (5, 9), (10, 14), (15, 19)]
+        with open(temp_file, "rb") as f:
+            assert f.read() == range_server.payload
+        assert progress[-1] == pytest.approx(100)
+
+    def test_small_file_uses_single_connection(self, tmp_path, range_server, resume_config):
+        temp_file = str(tmp_path / "video.mp4.part")
+
+        assert (
+            stream_download(
+                self.URL, temp_file, progress_callback=None, chunk_size=3, config=resume_config
+            )
+            == 20
+        )
+        assert range_server.ranges == []
+
+    def test_falls_back_when_ranges_unsupported(self, tmp_path, resume_config):
+        resume_config.downloads.segmented_min_size = 10
+        server = RangeServer(b"0123456789abcdefghij", accept_ranges=False)
+        temp_file = str(tmp_path / "video.mp4.part")
+        with serve_ranges(server):
+            downloaded = stream_download(
+                self.URL, temp_file, progress_callback=None, chunk_size=3, config=resume_config
+            )
+
+        assert downloaded == 20
+        with open(temp_file, "rb") as f:
+            assert f.read() == server.payload
+
+
+class TestBandwidthScheduler:
+    """Token-bucket throttling shared by every chunk loop."""
+
+    @patch("src.services.network.bandwidth.time.monotonic", return_value=100.0)
+    def test_bucket_queues_reservations_in_order(self, _mock_monotonic):
+        bucket = TokenBucket(rate=1000, burst_seconds=0)
+
+        waits = [bucket.reserve(500) for _ in range(3)]
+
+        assert waits == [pytest.approx(0.5), pytest.approx(1.0), pytest.approx(1.5)]
+
+    def test_unlimited_bucket_never_waits(self):
+        assert TokenBucket().reserve(10**9) == 0.0
+
+    @patch("src.services.network.bandwidth.time.sleep")
+    def test_unlimited_scheduler_does_not_sleep(self, mock_sleep, config):
+        BandwidthScheduler(config).throttle(10**6)
+
+        mock_sleep.assert_not_called()
+
+    @patch("src.services.network.bandwidth.time.sleep")
+    def test_tightest_cap_wins(self, mock_sleep, config):
+        config.downloads.bandwidth_limit = 100
+        config.downloads.service_bandwidth_limits = {"youtube": 10}
+        scheduler = BandwidthScheduler(config)
+
+        with scheduler.transfer("https://youtu.be/x", service="youtube", limit_kbps=50):
+            scheduler.throttle(10 * 1024)
+
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.0, rel=0.1)
+
+    def test_download_limit_only_changes_while_running(self, config):
+        scheduler = BandwidthScheduler(config)
+
+        with scheduler.transfer("key", limit_kbps=10) as lease:
+            assert current_transfer() is lease
+            assert scheduler.set_download_limit("key", 20) is True
+            assert lease.bucket.rate == 20 * 1024
+
+        assert current_transfer() is None
+        assert scheduler.set_download_limit("key", 20) is False
+
+    def test_ytdlp_hook_throttles_byte_deltas(self, config):
+        scheduler = BandwidthScheduler(config)
+        with patch.object(scheduler, "throttle") as mock_throttle:
+            hook = scheduler.ytdlp_hook()
+            for downloaded in (100, 250, 50):
+                hook({"status": "downloading", "filename": "a.mp4", "downloaded_bytes": downloaded})
+            hook({"status": "finished", "filename": "a.mp4"})
+
+        assert [c.args[0] for c in mock_throttle.call_args_list] == [100, 150, 50]
+
+    @patch("src.services.network.bandwidth.time.sleep")
+    def test_stream_download_draws_from_scheduler(
+        self, mock_sleep, tmp_path, fake_session, resume_config
+    ):
+        resume_config.downloads.bandwidth_limit = 1
+        fake_session.get.return_value = FakeResponse(200, {"content-length": "4096"}, [b"x" * 4096])
+
+        with patch(
+            "src.services.network.downloader.get_bandwidth_scheduler",
+            return_value=BandwidthScheduler(resume_config),
+        ):
+            stream_download(
+                "https://cdn.example.com/file.bin",
+                str(tmp_path / "file.bin.part"),
+                progress_callback=None,
+                chunk_size=4096,
+                config=resume_config,
+            )
+
+        assert mock_sleep.call_args.args[0] == pytest.approx(4.0, rel=0.1)
+
+
+class TestCancellation:
+    """Cooperative cancel/pause inside the chunk loops."""
+
+    URL = "https://cdn.example.com/video.mp4"
+
+    def test_pause_stops_within_one_chunk_and_keeps_partial(
+        self, tmp_path, fake_session, resume_config
+    ):
+        temp_file = str(tmp_path / "video.mp4.part")
+        token = CancellationToken()
+        fake_session.get.return_value = FakeResponse(
+            200, {"content-length": "6", "etag": '"v1"'}, [b"ab", b"cd", b"ef"]
+        )
+
+        with bind_token(token), pytest.raises(DownloadCancelledError) as excinfo:
+            stream_download(
+                self.URL,
+                temp_file,
+                progress_callback=lambda *_: token.pause(),
+                chunk_size=2,
+                config=resume_config,
+            )
+
+        assert excinfo.value.status == DownloadStatus.PAUSED
+        assert fake_session.get.call_count == 1
+        with open(temp_file, "rb") as f:
+            assert f.read() == b"ab"
+        assert os.path.exists(sidecar_path(temp_file))
+
+    def test_cancelled_token_skips_request(self, tmp_path, fake_session, resume_config):
+        token = CancellationToken()
+        token.cancel()
+
+        with bind_token(token), pytest.raises(DownloadCancelledError):
+            stream_download(
+                self.URL,
+                str(tmp_path / "video.mp4.part"),
+                progress_callback=None,
+                chunk_size=2,
+                config=resume_config,
+            )
+
+        fake_session.get.assert_not_called()
+
+    def test_ytdlp_hook_aborts_once_cancelled(self):
+        token = CancellationToken()
+        with bind_token(token):
+            hook = ytdlp_cancel_hook()
+        hook({"status": "downloading"})
+
+        token.cancel()
+
+        with pytest.raises(DownloadCancelledError):
+            hook({"status": "downloading"})
+
+
+class FakeBudget:
+    def __init__(self, spare):
+        self.spare = spare
+        self.returned = 0
+
+    def borrow(self, wanted):
+        granted = min(wanted, self.spare)
+        self.spare -= granted
+        return granted
+
+    def give_back(self, count):
+        self.returned += count
+        self.spare += count
+
+
+class TestItemFanout:
+    """Multi-item downloads fetched on a sub-pool that shares the handler's slots."""
+
+    @staticmethod
+    def tracked_fetch(delay=0.05):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(delay)
+            with lock:
+                state["active"] -= 1
+            return item * 2
+
+        return fetch, state
+
+    def test_results_keep_item_order(self):
+        config = AppConfig()
+        config.downloads.item_concurrency = 4
+        fetch, state = self.tracked_fetch()
+
+        assert fetch_concurrently([1, 2, 3, 4], fetch, config) == [2, 4, 6, 8]
+        assert state["peak"] > 1
+
+    def test_width_is_limited_by_borrowed_slots(self):
+        config = AppConfig()
+        config.downloads.item_concurrency = 4
+        budget = FakeBudget(spare=1)
+        fetch, state = self.tracked_fetch()
+
+        with bind_budget(budget):
+            fetch_concurrently(list(range(6)), fetch, config)
+
+        assert state["peak"] == 2
+        assert budget.returned == 1
+        assert budget.spare == 1
+
+    def test_no_spare_slots_runs_items_in_sequence(self):
+        config = AppConfig()
+        config.downloads.item_concurrency = 4
+        fetch, state = self.tracked_fetch(delay=0.01)
+
+        with bind_budget(FakeBudget(spare=0)):
+            assert fetch_concurrently([1, 2, 3], fetch, config) == [2, 4, 6]
+
+        assert state["peak"] == 1
+
+    def test_items_see_the_callers_cancellation_token(self):
+        config = AppConfig()
+        token = CancellationToken()
+
+        with bind_token(token):
+            seen = fetch_concurrently([1, 2, 3], lambda _: current_token(), config)
+
+        assert seen == [token, token, token]
+
+    def test_split_progress_reports_mean_and_never_goes_backwards(self):
+        reports = []
+        first, second = split_progress(lambda *args: reports.append(args), 2)
+
+        first(100.0, 0.0)
+        second(50.0, 1000.0)
+        first(10.0, 500.0)
+
+        assert reports == [(50.0, 0.0), (75.0, 1000.0), (75.0, 1000.0)]
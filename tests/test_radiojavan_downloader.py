@@ -7,6 +7,7 @@ import pytest
 sys.modules.pop("requests", None)
 import requests  # noqa: E402
 
+from src.core.config import AppConfig  # noqa: E402
 from src.services.radiojavan.downloader import RadioJavanDownloader  # noqa: E402
 
 
@@ -62,3 +63,82 @@ def test_resolve_direct_media_url_from_play_search(monkeypatch: pytest.MonkeyPat
     )
 
     assert resolved == expected
+
+
+def test_host_lookup_is_cached_per_media_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    downloader = RadioJavanDownloader()
+    calls: list[str] = []
+
+    def fake_fetch(endpoint: str, media_name: str) -> str | None:
+        calls.append(endpoint)
+        _ = media_name
+        return "host1.rj.example"
+
+    monkeypatch.setattr(downloader, "_fetch_host_from_endpoint", fake_fetch)
+
+    first = downloader._candidate_hosts("song-one", "mp3")
+    second = downloader._candidate_hosts("song-two", "mp3")
+    downloader._candidate_hosts("video-one", "mp4")
+
+    assert first[0] == second[0] == "https://host1.rj.example"
+    assert len(calls) == 4  # two endpoints for mp3, two for mp4
+
+
+def test_last_good_host_is_tried_first() -> None:
+    from src.services.radiojavan.host_cache import CdnHostCache
+
+    cache = CdnHostCache()
+    hosts = ["https://a", "https://b", "https://c"]
+    cache.record("mp3", "https://a", False)
+    cache.record("mp3", "https://c", True)
+
+    assert cache.rank("mp3", hosts) == ["https://c", "https://b", "https://a"]
+    assert cache.rank("mp4", hosts) == hosts
+
+
+def test_best_ranked_valid_candidate_wins(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    config = AppConfig()
+    config.radiojavan.validation_concurrency = 4
+    downloader = RadioJavanDownloader(config=config)
+    candidates = [(f"https://h{i}", f"https://h{i}/song.mp3") for i in range(8)]
+    slow_valid = threading.Event()
+    probed: list[str] = []
+
+    def fake_validate(url: str) -> bool:
+        probed.append(url)
+        if url == candidates[1][1]:
+            slow_valid.wait(timeout=0.2)
+            return True
+        return url == candidates[2][1]
+
+    monkeypatch.setattr(downloader, "_validate_url", fake_validate)
+
+    assert downloader._first_valid_candidate("mp3", candidates) == candidates[1][1]
+    assert candidates[7][1] not in probed
+    assert downloader.host_cache.rank("mp3", [host for host, _ in candidates])[0] == "https://h1"
+
+
+def test_construct_url_prefers_host_that_served_last_song(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = AppConfig()
+    config.radiojavan.validation_concurrency = 1
+    downloader = RadioJavanDownloader(config=config)
+    probed: list[str] = []
+
+    def fake_validate(url: str) -> bool:
+        probed.append(url)
+        return url.startswith("https://rj3.media/media/mp3/mp3-320/")
+
+    monkeypatch.setattr(downloader, "_resolve_direct_media_url_from_play", lambda *_: None)
+    monkeypatch.setattr(downloader, "_fetch_host_from_endpoint", lambda *_: None)
+    monkeypatch.setattr(downloader, "_validate_url", fake_validate)
+
+    downloader._construct_download_url("https://play.radiojavan.com/song/first-song")
+    first_probes = len(probed)
+    probed.clear()
+    url = downloader._construct_download_url("https://play.radiojavan.com/song/second-song")
+
+    assert url == "https://rj3.media/media/mp3/mp3-320/second-song.mp3"
+    assert first_probes > 1
+    assert probed == [url]
@@ -310,3 +310,194 @@ class TestSpotifyDownloader:
             assert results[0]["title"] == "Test Video 1"
             assert results[1]["title"] == "Test Video 2"
             assert results[2]["title"] == "Test Video 3"
+
+
+class TestSpotifyCache:
+    """Test caching of Spotify lookups shared by the dialog and the downloader."""
+
+    @patch("src.services.spotify.downloader.requests.get")
+    def test_metadata_is_fetched_once_per_spotify_id(self, mock_get):
+        mock_get.return_value.json.return_value = {"title": "Artist - Song"}
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+
+        first = downloader._extract_spotify_metadata("https://open.spotify.com/track/abc")
+        second = downloader._extract_spotify_metadata("https://open.spotify.com/track/abc?si=x")
+
+        assert first["title"] == second["title"] == "Artist - Song"
+        assert second["original_url"] == "https://open.spotify.com/track/abc?si=x"
+        assert mock_get.call_count == 1
+
+    @patch("src.services.spotify.downloader.yt_dlp.YoutubeDL")
+    def test_search_is_cached_by_normalized_query(self, mock_ydl):
+        extract_info = mock_ydl.return_value.__enter__.return_value.extract_info
+        extract_info.return_value = {"entries": [{"title": "Song", "id": "vid1"}]}
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+
+        downloader._search_youtube("The Artist", "Song")
+        results = downloader._search_youtube("  the  artist", "SONG ")
+
+        assert results == [{"title": "Song", "id": "vid1"}]
+        assert extract_info.call_count == 1
+
+    def test_cache_persists_and_evicts_oldest(self, tmp_path):
+        from src.core.config import AppConfig
+        from src.services.spotify.cache import SEARCH, SpotifyCache
+
+        config = AppConfig()
+        config.spotify.cache_max_entries = 2
+        cache = SpotifyCache(path=tmp_path / "spotify.json", config=config)
+        cache.put(SEARCH, "a", [1])
+        cache.put(SEARCH, "b", [2])
+        cache.get(SEARCH, "a")
+        cache.put(SEARCH, "c", [3])
+
+        reloaded = SpotifyCache(path=tmp_path / "spotify.json", config=config)
+        assert reloaded.get(SEARCH, "a") == [1]
+        assert reloaded.get(SEARCH, "b") is None
+        assert reloaded.get(SEARCH, "c") == [3]
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        from src.core.config import AppConfig
+        from src.services.spotify.cache import OEMBED, SpotifyCache
+
+        config = AppConfig()
+        config.spotify.cache_ttl = 60
+        cache = SpotifyCache(path=tmp_path / "spotify.json", config=config)
+        with patch("src.services.spotify.cache.time.time", return_value=1000.0):
+            cache.put(OEMBED, "abc", {"title": "Song"})
+        with patch("src.services.spotify.cache.time.time", return_value=1061.0):
+            assert cache.get(OEMBED, "abc") is None
+
+    @patch("src.services.spotify.downloader.YouTubeDownloader")
+    @patch("src.services.spotify.downloader.requests.get")
+    def test_download_of_dialog_match_skips_spotify_lookups(self, mock_get, mock_yt):
+        mock_yt.return_value.download.return_value = True
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+
+        with patch.object(downloader, "_search_youtube") as mock_search:
+            assert downloader.download("https://www.youtube.com/watch?v=vid1", "/tmp/song.mp3")
+
+        mock_get.assert_not_called()
+        mock_search.assert_not_called()
+        mock_yt.return_value.download.assert_called_once_with(
+            "https://www.youtube.com/watch?v=vid1", "/tmp/song.mp3", None
+        )
+
+    @patch("src.services.spotify.downloader.YouTubeDownloader")
+    @patch("src.services.spotify.downloader.requests.get")
+    def test_download_uses_remembered_match(self, mock_get, mock_yt):
+        mock_yt.return_value.download.return_value = True
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+        downloader.remember_match(
+            "https://open.spotify.com/track/abc", {"webpage_url": "https://youtu.be/vid1"}
+        )
+
+        assert downloader.download("https://open.spotify.com/track/abc", "/tmp/song.mp3")
+
+        mock_get.assert_not_called()
+        assert mock_yt.return_value.download.call_args.args[0] == "https://youtu.be/vid1"
+
+
+class TestSearchTracks:
+    """Test the concurrent YouTube search used for playlists and albums."""
+
+    def make_tracks(self, count):
+        return [{"position": i, "title": f"Artist - Song {i}"} for i in range(count)]
+
+    def test_searches_run_concurrently_up_to_width(self):
+        import threading
+        import time
+
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_search(artist, track):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return [{"title": f"{artist} - {track}", "id": track}]
+
+        tracks = self.make_tracks(8)
+        streamed = []
+        with patch.object(downloader, "_search_youtube", side_effect=fake_search):
+            downloader.search_tracks(tracks, on_result=streamed.append, max_workers=3)
+
+        assert 1 < peak <= 3
+        assert sorted(t["position"] for t in streamed) == list(range(8))
+        assert all(t["best_match"]["title"] == t["title"] for t in tracks)
+
+    def test_empty_results_leave_no_match(self):
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+        tracks = self.make_tracks(2)
+
+        with patch.object(downloader, "_search_youtube", return_value=[]):
+            downloader.search_tracks(tracks)
+
+        assert all(t["youtube_results"] == [] and t["best_match"] is None for t in tracks)
+
+    def test_cancel_skips_remaining_searches(self):
+        import threading
+
+        downloader = SpotifyDownloader(error_handler=MockErrorNotifier(), config=get_config())
+        cancel = threading.Event()
+        tracks = self.make_tracks(6)
+        streamed = []
+
+        def fake_search(artist, track):
+            cancel.set()
+            return []
+
+        with patch.object(downloader, "_search_youtube", side_effect=fake_search) as mock_search:
+            downloader.search_tracks(
+                tracks, on_result=streamed.append, cancel_event=cancel, max_workers=1
+            )
+
+        assert mock_search.call_count == 1
+        assert streamed == []
+        assert sum("best_match" in t for t in tracks) == 1
+
+
+class TestTrackMatcher:
+    """Test the profile-based matcher behind _select_best_match."""
+
+    def test_punctuation_and_case_do_not_matter(self):
+        from src.services.spotify.matcher import TrackMatcher
+
+        results = [
+            {"id": "other", "title": "Someone Else - Another Song"},
+            {"id": "right", "title": "ARTIST - Track (Official Audio)"},
+        ]
+        assert TrackMatcher().best_match("Artist Track", results)["id"] == "right"
+
+    def test_duration_breaks_ties_between_uploads(self):
+        from src.services.spotify.matcher import TrackMatcher
+
+        results = [
+            {"id": "extended", "title": "Artist - Track (Official)", "duration": 420},
+            {"id": "single", "title": "Artist - Track (Official)", "duration": 212},
+        ]
+        matcher = TrackMatcher()
+
+        assert matcher.best_match("Artist Track", results)["id"] == "extended"
+        assert matcher.best_match("Artist Track", results, duration=210)["id"] == "single"
+
+    def test_match_batch_keeps_order_and_threshold(self):
+        from src.services.spotify.matcher import TrackMatcher
+
+        first = [{"id": "a", "title": "Artist - Track"}]
+        second = [{"id": "b", "title": "Unrelated Video Title"}]
+
+        assert TrackMatcher().match_batch(
+            [("Artist Track", first, None), ("Artist Track", second, None)]
+        ) == [first[0], None]
+
+    def test_parse_duration_from_track_row(self):
+        assert SpotifyDownloader._parse_duration("Song Artist 3:45") == 225
+        assert SpotifyDownloader._parse_duration("1 Song 1:02:03") == 3723
+        assert SpotifyDownloader._parse_duration("Song") is None
+        assert SpotifyDownloader._parse_duration(Mock()) is None
@@ -0,0 +1,109 @@
+"""Tests for the startup tracer and its DI container hook."""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.application.di_container import ServiceContainer
+from src.utils import startup_trace
+from src.utils.startup_trace import StartupTracer, parse_trace_options
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    tracer = StartupTracer(enabled=True)
+    monkeypatch.setattr(startup_trace, "_tracer", tracer)
+    yield tracer
+    tracer.remove_import_hook()
+
+
+class TestStartupTracer:
+    def test_disabled_tracer_records_nothing(self, tmp_path):
+        tracer = StartupTracer()
+
+        with tracer.span("phase"):
+            pass
+        tracer.mark("first_paint")
+
+        assert tracer.report()["phases"] == []
+        assert tracer.report()["marks"] == {}
+        assert tracer.write_report(tmp_path / "trace.json") is None
+
+    def test_nested_spans_split_self_time(self, tracer):
+        with tracer.span("outer"), tracer.span("inner"):
+            pass
+
+        phases = {span["name"]: span for span in tracer.report()["phases"]}
+        outer, inner = phases["outer"], phases["inner"]
+        assert (outer["depth"], inner["depth"]) == (0, 1)
+        assert outer["self_ms"] == pytest.approx(
+            outer["duration_ms"] - inner["duration_ms"], abs=0.01
+        )
+
+    def test_import_hook_times_new_modules(self, tracer, tmp_path, monkeypatch):
+        (tmp_path / "traced_parent.py").write_text("import traced_child\n")
+        (tmp_path / "traced_child.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        tracer.install_import_hook()
+        try:
+            module = importlib.import_module("traced_parent")
+        finally:
+            tracer.remove_import_hook()
+            sys.modules.pop("traced_parent", None)
+            sys.modules.pop("traced_child", None)
+
+        imports = {span["name"]: span for span in tracer.report()["imports"]}
+        assert module.traced_child.VALUE == 1
+        assert type(module.__loader__).__name__ == "SourceFileLoader"
+        assert imports["traced_child"]["depth"] == imports["traced_parent"]["depth"] + 1
+        assert imports["traced_parent"]["duration_ms"] >= imports["traced_child"]["duration_ms"]
+
+    def test_finish_marks_first_paint_and_writes_report(self, tracer, tmp_path):
+        tracer.report_path = tmp_path / "logs" / "trace.json"
+        tracer.install_import_hook()
+
+        path = tracer.finish()
+
+        report = json.loads(Path(path).read_text())
+        assert path == tracer.report_path
+        assert report["total_ms"] == report["marks"]["first_paint"]
+        assert tracer._import_hook is None
+
+    def test_container_records_service_resolution(self, tracer):
+        class Clock:
+            pass
+
+        container = ServiceContainer()
+        container.register_singleton(Clock)
+
+        container.get(Clock)
+        container.get(Clock)
+
+        assert [span["name"] for span in tracer.report()["services"]] == ["Clock"]
+
+
+class TestTraceOptions:
+    def test_off_by_default(self):
+        assert parse_trace_options([], {}) == (False, None, False)
+
+    def test_cli_flag_with_path(self):
+        assert parse_trace_options(["--trace-startup=out.json"], {}) == (
+            True,
+            Path("out.json"),
+            False,
+        )
+
+    def test_environment_enables_tracing(self):
+        assert parse_trace_options([], {"MEDIA_DOWNLOADER_TRACE_STARTUP": "1"}) == (
+            True,
+            None,
+            False,
+        )
+        assert parse_trace_options([], {"MEDIA_DOWNLOADER_TRACE_STARTUP": "0"})[0] is False
+
+    def test_benchmark_flag_implies_tracing(self):
+        assert parse_trace_options(["--startup-benchmark"], {}) == (True, None, True)
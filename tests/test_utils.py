@@ -44,3 +44,70 @@ def test_window_utils():
 
     # Test that the mixin exists
     assert WindowCenterMixin is not None
+
+
+def test_log_queue_drops_debug_records_when_full():
+    """DEBUG records are dropped on overflow and the loss is reported once there is room."""
+    import logging
+    import queue
+
+    from src.utils.logger import _BoundedQueueHandler
+
+    handler = _BoundedQueueHandler(queue.Queue(maxsize=2))
+    logger = logging.getLogger("test.log_queue")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        for message in ("first", "second", "third", "fourth"):
+            logger.debug(message)
+        assert handler.dropped == 2
+
+        drained = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+        logger.debug("fifth")
+        messages = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    assert drained == ["first", "second"]
+    assert messages == [
+        "fifth",
+        "[LOGGER] Dropped 2 debug records while the log queue was full",
+    ]
+    assert handler.dropped == 0
+
+
+def test_log_queue_formats_message_when_logged():
+    """Arguments are interpolated on the logging thread, so later mutation does not leak in."""
+    import logging
+    import queue
+
+    from src.utils.logger import _BoundedQueueHandler
+
+    handler = _BoundedQueueHandler(queue.Queue())
+    state = {"status": "queued"}
+    record = logging.makeLogRecord({"levelno": logging.INFO, "msg": "state: %s", "args": (state,)})
+
+    handler.emit(record)
+    state["status"] = "done"
+
+    assert handler.queue.get_nowait().getMessage() == "state: {'status': 'queued'}"
+
+
+def test_configure_logging_applies_log_config():
+    """LogConfig.level drives the root logger level."""
+    import logging
+
+    from src.core.config import LogConfig
+    from src.utils.logger import configure_logging
+
+    root = logging.getLogger()
+    previous = root.level
+    try:
+        configure_logging(LogConfig(level="debug"))
+        assert root.level == logging.DEBUG
+        configure_logging(LogConfig(level="not-a-level"))
+        assert root.level == logging.DEBUG
+    finally:
+        root.setLevel(previous)
@@ -179,15 +179,16 @@ class TestCommonUtilsComprehensive:
         assert service.is_service_connected(ServiceType.GOOGLE) is False
 
     @patch("src.services.network.downloader._is_mocked_requests_module", return_value=False)
-    @patch("src.services.network.downloader.requests")
-    def test_download_file_success(self, mock_requests, _mock_is_mocked):
+    @patch("src.services.network.downloader.get_session_pool")
+    def test_download_file_success(self, mock_get_pool, _mock_is_mocked):
         """Test successful file download."""
 
         mock_response = Mock()
         mock_response.headers = {"content-length": "100"}
         mock_response.iter_content.return_value = [b"test content"]
         mock_response.raise_for_status.return_value = None
-        mock_requests.Session.return_value.get.return_value = mock_response
+        mock_session = mock_get_pool.return_value.session.return_value.__enter__.return_value
+        mock_session.get.return_value = mock_response
 
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             temp_path = temp_file.name
@@ -362,3 +363,161 @@ class TestWindowUtilsComprehensive:
         # Should not raise an error
         with contextlib.suppress(TypeError):
             mixin.center_window()
+
+
+class TestConnectivityStateComprehensive:
+    """Tests for the TTL cache behind check_site_connection."""
+
+    @staticmethod
+    def make_state(results):
+        from src.core.config import AppConfig
+        from src.services.network.checker import ConnectivityState
+
+        config = AppConfig()
+        config.network.connectivity_cache_ttl = 60
+        config.network.connectivity_failure_ttl = 10
+        checker = Mock()
+        checker.check_service.side_effect = results
+        return ConnectivityState(checker, config=config), checker
+
+    @staticmethod
+    def result(connected):
+        from src.core.enums.service_type import ServiceType
+        from src.services.network.checker import ConnectionResult
+
+        return ConnectionResult(
+            is_connected=connected,
+            error_message="" if connected else "down",
+            service_type=ServiceType.TWITTER,
+        )
+
+    def test_repeated_checks_reuse_result_until_invalidated(self):
+        from src.core.enums.service_type import ServiceType
+
+        state, checker = self.make_state([self.result(True), self.result(False)])
+
+        for _ in range(5):
+            assert state.get(ServiceType.TWITTER).is_connected is True
+        assert checker.check_service.call_count == 1
+
+        state.invalidate(ServiceType.TWITTER)
+        assert state.get(ServiceType.TWITTER).is_connected is False
+        assert checker.check_service.call_count == 2
+
+    def test_failures_expire_sooner_than_successes(self):
+        from src.core.enums.service_type import ServiceType
+
+        state, checker = self.make_state([self.result(False), self.result(True)])
+
+        with patch("src.services.network.checker.time.monotonic", return_value=100.0):
+            assert state.get(ServiceType.TWITTER).is_connected is False
+        with patch("src.services.network.checker.time.monotonic", return_value=105.0):
+            assert state.get(ServiceType.TWITTER).is_connected is False
+        with patch("src.services.network.checker.time.monotonic", return_value=111.0):
+            assert state.get(ServiceType.TWITTER).is_connected is True
+        assert checker.check_service.call_count == 2
+
+    def test_stale_success_is_served_while_refreshing(self):
+        import threading
+
+        from src.core.enums.service_type import ServiceType
+
+        refreshed = threading.Event()
+        state, checker = self.make_state([self.result(True)])
+
+        with patch("src.services.network.checker.time.monotonic", return_value=100.0):
+            state.get(ServiceType.TWITTER)
+
+        def background_check(_service):
+            refreshed.set()
+            return self.result(False)
+
+        checker.check_service.side_effect = background_check
+        with patch("src.services.network.checker.time.monotonic", return_value=170.0):
+            assert state.get(ServiceType.TWITTER).is_connected is True
+        assert refreshed.wait(timeout=2)
+
+    def test_service_sweep_warms_the_cache(self):
+        from src.core.enums.service_type import ServiceType
+        from src.services.network.checker import NetworkService
+
+        checker = Mock()
+        checker.check_all_services.return_value = {ServiceType.TWITTER: self.result(True)}
+        service = NetworkService(checker=checker, cache_results=True)
+
+        service.check_all_services()
+        assert service.check_site_connection(ServiceType.TWITTER) == (True, "")
+        checker.check_service.assert_not_called()
+
+
+class TestServiceSweepComprehensive:
+    """Tests for the concurrent HTTPNetworkChecker.check_all_services sweep."""
+
+    @staticmethod
+    def connected(service):
+        from src.services.network.checker import ConnectionResult
+
+        return ConnectionResult(is_connected=True, service_type=service)
+
+    def test_services_are_checked_concurrently_and_streamed(self):
+        import time
+
+        from src.services.network.checker import HTTPNetworkChecker
+
+        def slow_check(service):
+            time.sleep(0.1)
+            return self.connected(service)
+
+        checker = HTTPNetworkChecker()
+        streamed = []
+        started = time.monotonic()
+        with patch.object(checker, "check_service", side_effect=slow_check):
+            results = checker.check_all_services(
+                on_result=lambda service, _result: streamed.append(service), timeout=5
+            )
+        elapsed = time.monotonic() - started
+
+        assert list(results) == list(HTTPNetworkChecker.SERVICE_URLS)
+        assert all(result.is_connected for result in results.values())
+        assert sorted(streamed) == sorted(results)
+        assert elapsed < 0.1 * len(results) / 2
+
+    def test_deadline_reports_pending_services_as_timed_out(self):
+        import threading
+
+        from src.core.enums.service_type import ServiceType
+        from src.services.network.checker import HTTPNetworkChecker
+
+        release = threading.Event()
+
+        def check(service):
+            if service == ServiceType.TIKTOK:
+                release.wait(timeout=5)
+            return self.connected(service)
+
+        checker = HTTPNetworkChecker()
+        try:
+            with patch.object(checker, "check_service", side_effect=check):
+                results = checker.check_all_services(timeout=0.2)
+        finally:
+            release.set()
+
+        assert results[ServiceType.TIKTOK].is_connected is False
+        assert "timed out" in results[ServiceType.TIKTOK].error_message
+        assert results[ServiceType.YOUTUBE].is_connected is True
+
+    def test_probe_errors_become_failed_results(self):
+        from src.core.enums.service_type import ServiceType
+        from src.services.network.checker import HTTPNetworkChecker
+
+        def check(service):
+            if service == ServiceType.SPOTIFY:
+                raise RuntimeError("boom")
+            return self.connected(service)
+
+        checker = HTTPNetworkChecker()
+        with patch.object(checker, "check_service", side_effect=check):
+            results = checker.check_all_services(timeout=5)
+
+        assert results[ServiceType.SPOTIFY].error_message == "boom"
+        assert results[ServiceType.GOOGLE].is_connected is True